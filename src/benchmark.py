@@ -0,0 +1,179 @@
+"""Headless benchmark of the game loop.
+
+Runs `Model` and `Game` on a video file or an image directory, without any
+window, and reports per-stage timings as JSON. The stages are the profiler
+scopes (see profiler.py) of the measured frames:
+
+    tire-au-cannard-bench path/to/clip.mp4 --output bench.json
+"""
+
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from game import Game
+from global_data import GlobalData
+from model import Model
+from model.capture import BlankCapture, parse_size
+from model.replay import ReplayModel
+from profiler import profiler
+
+
+def stage_report(durations: dict[str, np.ndarray]) -> dict:
+    """Count, mean and percentiles of the per-frame milliseconds of each stage"""
+    report = {}
+    for name, ms in durations.items():
+        p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+        report[name] = {
+            "count": len(ms),
+            "mean_ms": float(ms.mean()),
+            "p50_ms": float(p50),
+            "p95_ms": float(p95),
+            "p99_ms": float(p99),
+        }
+    return report
+
+
+def run(md: Model, gm: Game, max_frames: int = 0, warmup: int = 0, dt: float = 1 / 30):
+    """Drive the game loop until the source is exhausted and return the report"""
+    profiler.enable()
+    GlobalData.dt = dt
+    GlobalData.fps = 1 / dt
+    GlobalData.deferred = True
+    frames = 0
+    start = None
+    first_frame = profiler.frame + warmup  # Première frame mesurée
+
+    while md.cap.isOpened():
+        if max_frames and frames >= max_frames + warmup:
+            break
+        if frames == warmup:
+            start = time.perf_counter()
+
+        # capture, color, inference et metrics sont mesurés par Model
+        frame = md.get_current_frame()
+        if frame is None:
+            break
+        frame_rgb = md.prepare_frame(frame)
+        results = md.infer(frame_rgb)
+        md.frame_pool.release(frame_rgb)
+        md.process_active_players()
+        md.apply_results(results, md.frame_id, md.frame_timestamp)
+        with profiler.scope("update"):
+            gm.update()
+        with profiler.scope("tick"):
+            gm.tick(dt)
+        with profiler.scope("events"):
+            GlobalData.flush()
+        with profiler.scope("draw"):
+            gm.draw()
+        profiler.end_frame()
+        frames += 1
+
+    measured = frames - warmup
+    elapsed = time.perf_counter() - start if start is not None and measured > 0 else 0.0
+    records = profiler.records()
+    if records and records[0][4] > first_frame:
+        print(
+            "Profiler buffer overflowed: only the last frames are reported",
+            file=sys.stderr,
+        )
+    return {
+        "frames": max(measured, 0),
+        "elapsed_s": elapsed,
+        "fps": measured / elapsed if elapsed > 0 else 0.0,
+        "resolution": [md.width, md.height],
+        "inference_resolution": list(md.inference_shape(md.width, md.height)),
+        "stages": stage_report(profiler.stage_durations(first_frame)),
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Headless game loop benchmark")
+    parser.add_argument(
+        "source",
+        nargs="?",
+        help="video file or directory of images (blank frames with --replay)",
+    )
+    parser.add_argument("--output", "-o", help="write the JSON report to this file")
+    parser.add_argument(
+        "--max-frames", type=int, default=0, help="stop after N measured frames"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=5, help="frames run before measuring"
+    )
+    parser.add_argument(
+        "--replay", help="serve hand landmarks from this recording instead of MediaPipe"
+    )
+    parser.add_argument("--record", help="record the hand landmarks to this file")
+    parser.add_argument(
+        "--roi-tracking",
+        action="store_true",
+        help="run inference on a crop around the previous hands",
+    )
+    parser.add_argument(
+        "--inference-size",
+        type=parse_size,
+        metavar="WxH",
+        help="downscale the frames to fit in WxH before inference",
+    )
+    parser.add_argument(
+        "--dt", type=float, default=1 / 30, help="simulated frame time in seconds"
+    )
+    parser.add_argument(
+        "--swarm", type=int, default=0, metavar="N", help="add a swarm of N ducks"
+    )
+    parser.add_argument(
+        "--duck-collisions",
+        action="store_true",
+        help="make the swarm ducks bounce off each other",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    model = ReplayModel(args.replay, loop=False) if args.replay else None
+    source = args.source
+    if source is None:
+        if model is None:
+            print("A source is required unless --replay is given", file=sys.stderr)
+            return 2
+        source = BlankCapture(len(model))
+    # Capture et inférence synchrones pour mesurer chaque étape
+    md = Model(
+        source=source,
+        model=model,
+        threaded_capture=False,
+        pipelined=False,
+        roi_tracking=args.roi_tracking,
+        inference_size=args.inference_size,
+    )
+    if args.record:
+        md.start_recording(args.record)
+    if not md.cap.isOpened():
+        print(f"Cannot open {args.source}", file=sys.stderr)
+        return 1
+    gm = Game(md, swarm_size=args.swarm, swarm_collisions=args.duck_collisions)
+    try:
+        report = run(md, gm, args.max_frames, args.warmup, args.dt)
+    finally:
+        md.release()
+    report["source"] = args.source
+    report["model"] = type(md.hands).__name__
+    report["swarm"] = args.swarm
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,3 +3,4 @@ from .cursor import Cursor
 from .player_hand import PlayerHand
 from .quit_button import QuitButton
 from .rect_target import RectTarget
+from .target_pool import TargetPool
@@ -12,6 +12,13 @@ class ATarget(ABC):
         default=False, init=False
     )  # Par défaut, les targets ne sont pas dessinés sur l'overlay
 
+    @property
+    @abstractmethod
+    def bounds(self) -> tuple[int, int, int, int]:
+        """Rectangle englobant (x1, y1, x2, y2), x2/y2 exclus, qui contient tout
+        ce qui est dessiné et tous les points pour lesquels `_is_hit` est vrai"""
+        ...
+
     @abstractmethod
     def _is_hit(self, x: int, y: int) -> bool:
         """Détermine si les coordonnées (x, y) touchent le target"""
@@ -23,8 +30,9 @@ class ATarget(ABC):
         ...
 
     @abstractmethod
-    def update(self, delta: float):
-        """Met à jour la position du target en fonction du temps écoulé depuis la dernière mise à jour"""
+    def update(self, delta: float, width: int = 640, height: int = 480):
+        """Met à jour la position du target en fonction du temps écoulé depuis la dernière mise à jour,
+        dans une frame de width x height pixels"""
         ...
 
     @abstractmethod
@@ -46,12 +46,26 @@ class Button(ATarget):
 
         cv2.putText(img, self.text, (text_x, text_y), font, scale, color, 2)
 
-    def update(self, delta: float):
+    def update(self, delta: float, width: int = 640, height: int = 480):
         """Le bouton n'a pas de logique de mise à jour pour le moment"""
 
+    # Marge de tolérance pour les clics
+    _GIVE = 5
+
+    @property
+    def bounds(self) -> tuple[int, int, int, int]:
+        """Englobe la bordure et la marge de tolérance des clics"""
+        give = self._GIVE
+        return (
+            self.x - give,
+            self.y - give,
+            self.x + self.width + give + 1,
+            self.y + self.height + give + 1,
+        )
+
     def _is_hit(self, x, y):
         """Détermine si les coordonnées (x, y) touchent le bouton"""
-        give_x, give_y = 5, 5  # Marge de tolérance pour les clics
+        give_x, give_y = self._GIVE, self._GIVE
 
         return (
             self.x - give_x <= x <= self.x + self.width + give_x
@@ -1,6 +1,7 @@
 import cv2
-import numpy as np
 
+from components.cursor_filter import CursorFilter, ExponentialFilter
+from components.glyph_atlas import GlyphAtlas
 from global_data import GlobalData
 
 
@@ -13,7 +14,7 @@ class Cursor:
     def just_clicked(self):
         return self.is_active and self._active_frames == 1
 
-    def __init__(self, pos, color):
+    def __init__(self, pos, color, smoothing: CursorFilter | None = None):
         self._pos = pos
         self._animation_length = 0.2
         self._animation_time = 0
@@ -22,7 +23,14 @@ class Cursor:
         self.color = color
         self.is_active = False
         self.label = ""
+        # Échelle du dessin par rapport à une frame de 480 px de haut
+        self.scale = 1.0
         self._active_frames = 0
+        # Lissage de la position (par défaut le mélange exponentiel historique)
+        self.filter = smoothing if smoothing is not None else ExponentialFilter()
+        self._time = 0.0
+        # Anticipation maximale (secondes), au-delà la prédiction diverge
+        self.max_prediction = 0.2
 
         self._reset_animation()
 
@@ -30,83 +38,93 @@ class Cursor:
         self._animation_time = self._animation_length
         self._active_frames = 0
 
-    def update(self, pos: tuple[int, int], origin: tuple[int, int], is_active: bool):
+    def update(
+        self,
+        pos: tuple[int, int],
+        origin: tuple[int, int],
+        is_active: bool,
+        timestamp: float | None = None,
+        latency: float = 0.0,
+    ):
         """Met à jour la position et l'état du curseur
 
         Args:
             pos (tuple[int, int]): Position actuelle du curseur (projetée à l'écran)
             origin (tuple[int, int]): Position d'origine du curseur (Sur la main)
             is_active (bool): Indique si le curseur est actif (en train de tirer)
+            timestamp (float | None): Instant de la mesure `pos` (secondes), par
+                défaut avancé de `GlobalData.dt` à chaque appel
+            latency (float): Retard de la mesure sur l'affichage (secondes); les
+                filtres qui estiment une vitesse anticipent d'autant
         """
         self._pos = pos
         self.origin_pos = origin
         self.is_active = is_active
         self._active_frames = self._active_frames + 1 if is_active else 0
 
-        # Appliquer un lissage de 5 frames pour éviter les mouvements brusques du curseur
-        self.smoothed_pos = (
-            (2 / 3) * np.array(self.smoothed_pos) + (1 / 3) * np.array(pos)
-        ).astype(int)
+        self._time = timestamp if timestamp is not None else self._time + GlobalData.dt
+        self.filter.update(pos, self._time)
+        filtered = self.filter.predict(min(max(latency, 0.0), self.max_prediction))
+        self.smoothed_pos = (int(filtered[0]), int(filtered[1]))
 
     def draw(self, frame: cv2.Mat):
         """Dessine le curseur sur la frame avec un style différent selon son état"""
         pos = self.smoothed_pos
+        s = self.scale
 
-        cv2.line(frame, self.origin_pos, pos, (255, 255, 255), 1)
+        def px(size: float) -> int:
+            return max(round(size * s), 1)
+
+        cv2.line(frame, self.origin_pos, pos, (255, 255, 255), px(1))
 
         if self.is_active:
             if self._animation_time > 0:
                 progress = self._animation_time / self._animation_length * 2
+                d = 12 * s * progress
                 cv2.line(
                     frame,
-                    (int(pos[0] - 12 * progress), int(pos[1] - 12 * progress)),
-                    (int(pos[0] + 12 * progress), int(pos[1] + 12 * progress)),
+                    (int(pos[0] - d), int(pos[1] - d)),
+                    (int(pos[0] + d), int(pos[1] + d)),
                     (255, 255, 255),
-                    6,
+                    px(6),
                 )
                 cv2.line(
                     frame,
-                    (int(pos[0] - 12 * progress), int(pos[1] + 12 * progress)),
-                    (int(pos[0] + 12 * progress), int(pos[1] - 12 * progress)),
+                    (int(pos[0] - d), int(pos[1] + d)),
+                    (int(pos[0] + d), int(pos[1] - d)),
                     (255, 255, 255),
-                    6,
+                    px(6),
                 )
-                cv2.circle(frame, pos, 15, (255, 255, 255), 8)
+                cv2.circle(frame, pos, px(15), (255, 255, 255), px(8))
                 self._animation_time -= GlobalData.dt
 
             # Curseur actif (shooting) - Rouge avec effet de pulsation
-            cv2.circle(frame, pos, 15, (0, 0, 255), 3)
-            cv2.circle(frame, pos, 8, (255, 255, 255), -1)
-            cv2.circle(frame, pos, 4, (0, 0, 255), -1)
+            cv2.circle(frame, pos, px(15), (0, 0, 255), px(3))
+            cv2.circle(frame, pos, px(8), (255, 255, 255), -1)
+            cv2.circle(frame, pos, px(4), (0, 0, 255), -1)
         else:
             self._reset_animation()  # Réinitialiser l'animation pour la prochaine fois que le curseur devient actif
             # Curseur normal - Vert avec croix
-            cv2.circle(frame, pos, 12, (0, 255, 0), 2)
-            cv2.circle(frame, pos, 5, (0, 255, 0), -1)
+            cv2.circle(frame, pos, px(12), (0, 255, 0), px(2))
+            cv2.circle(frame, pos, px(5), (0, 255, 0), -1)
             # Croix au centre
             cv2.line(
                 frame,
-                (pos[0] - 3, pos[1]),
-                (pos[0] + 3, pos[1]),
+                (pos[0] - px(3), pos[1]),
+                (pos[0] + px(3), pos[1]),
                 (255, 255, 255),
-                1,
+                px(1),
             )
             cv2.line(
                 frame,
-                (pos[0], pos[1] - 3),
-                (pos[0], pos[1] + 3),
+                (pos[0], pos[1] - px(3)),
+                (pos[0], pos[1] + px(3)),
                 (255, 255, 255),
-                1,
+                px(1),
             )
 
         # Afficher le label si défini
         if self.label:
-            cv2.putText(
-                frame,
-                self.label,
-                (pos[0] + 20, pos[1] - 10),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.6,
-                (255, 255, 255),
-                2,
-            )
+            # Atlas partagé, créé une fois par échelle
+            atlas = GlyphAtlas.get(cv2.FONT_HERSHEY_SIMPLEX, 0.6 * s, (255, 255, 255), px(2))
+            atlas.draw_text(frame, self.label, (pos[0] + px(20), pos[1] - px(10)))
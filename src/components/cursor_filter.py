@@ -0,0 +1,182 @@
+import math
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+class CursorFilter(ABC):
+    """Filtre de position du curseur (x, y en pixels).
+
+    L'état est gardé dans des tableaux préalloués; `update` et `predict`
+    retournent une vue sur un tableau interne, à copier si besoin.
+    """
+
+    def __init__(self):
+        self._out = np.zeros(2, dtype=np.float64)
+        self._initialized = False
+
+    def reset(self, pos, timestamp: float):
+        self._initialized = True
+        self._reset(pos, timestamp)
+
+    def update(self, pos, timestamp: float) -> np.ndarray:
+        """Ajoute une mesure prise à `timestamp` (secondes) et retourne la position filtrée"""
+        if not self._initialized:
+            self.reset(pos, timestamp)
+            return self.predict(0.0)
+        return self._update(pos, timestamp)
+
+    @abstractmethod
+    def _reset(self, pos, timestamp: float): ...
+
+    @abstractmethod
+    def _update(self, pos, timestamp: float) -> np.ndarray: ...
+
+    @abstractmethod
+    def predict(self, horizon: float) -> np.ndarray:
+        """Position estimée `horizon` secondes après la dernière mesure"""
+        ...
+
+
+class ExponentialFilter(CursorFilter):
+    """Lissage exponentiel par frame: (1 - weight) * ancien + weight * nouveau"""
+
+    def __init__(self, weight: float = 1 / 3):
+        super().__init__()
+        self.weight = weight
+        self._pos = np.zeros(2, dtype=np.float64)
+        self._measure = np.zeros(2, dtype=np.float64)
+
+    def _reset(self, pos, timestamp):
+        self._pos[:] = pos
+
+    def _update(self, pos, timestamp):
+        # Appliqué à chaque appel, même sans nouvelle mesure, comme avant
+        self._measure[:] = pos
+        self._measure -= self._pos
+        self._measure *= self.weight
+        self._pos += self._measure
+        return self.predict(0.0)
+
+    def predict(self, horizon):
+        self._out[:] = self._pos
+        return self._out
+
+
+class OneEuroFilter(CursorFilter):
+    """Filtre « 1€ » (Casiez et al. 2012): lissage fort à l'arrêt, faible latence
+    quand le curseur bouge vite. La vitesse filtrée permet aussi d'anticiper."""
+
+    def __init__(self, min_cutoff: float = 1.0, beta: float = 0.005, d_cutoff: float = 1.0):
+        super().__init__()
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self._pos = np.zeros(2, dtype=np.float64)
+        self._velocity = np.zeros(2, dtype=np.float64)
+        self._tmp = np.zeros(2, dtype=np.float64)
+        self._timestamp = 0.0
+
+    @staticmethod
+    def _alpha(cutoff: float, dt: float) -> float:
+        tau = 1.0 / (2 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def _reset(self, pos, timestamp):
+        self._pos[:] = pos
+        self._velocity.fill(0.0)
+        self._timestamp = timestamp
+
+    def _update(self, pos, timestamp):
+        dt = timestamp - self._timestamp
+        if dt <= 0:
+            return self.predict(0.0)  # Pas de nouvelle mesure
+        self._timestamp = timestamp
+
+        # Vitesse brute puis filtrée
+        self._tmp[:] = pos
+        self._tmp -= self._pos
+        self._tmp /= dt
+        self._tmp -= self._velocity
+        self._tmp *= self._alpha(self.d_cutoff, dt)
+        self._velocity += self._tmp
+
+        # La fréquence de coupure augmente avec la vitesse
+        speed = math.hypot(self._velocity[0], self._velocity[1])
+        a = self._alpha(self.min_cutoff + self.beta * speed, dt)
+        self._tmp[:] = pos
+        self._tmp -= self._pos
+        self._tmp *= a
+        self._pos += self._tmp
+        return self.predict(0.0)
+
+    def predict(self, horizon):
+        np.multiply(self._velocity, horizon, out=self._out)
+        self._out += self._pos
+        return self._out
+
+
+class KalmanFilter(CursorFilter):
+    """Filtre de Kalman à vitesse constante, indépendant sur x et y.
+
+    Args:
+        process_noise (float): Densité spectrale de l'accélération (px²/s³)
+        measurement_noise (float): Variance de la mesure (px²)
+    """
+
+    def __init__(self, process_noise: float = 1e5, measurement_noise: float = 9.0):
+        super().__init__()
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+        # Une ligne par axe: [position, vitesse]
+        self._x = np.zeros((2, 2), dtype=np.float64)
+        # Même covariance pour les deux axes (mêmes instants et même bruit),
+        # symétrique: [[p00, p01], [p01, p11]]
+        self._P = np.zeros((2, 2), dtype=np.float64)
+        self._timestamp = 0.0
+
+    def _reset(self, pos, timestamp):
+        self._x[:, 0] = pos
+        self._x[:, 1] = 0.0
+        self._P[:] = ((self.measurement_noise, 0.0), (0.0, 1e6))
+        self._timestamp = timestamp
+
+    def _update(self, pos, timestamp):
+        dt = timestamp - self._timestamp
+        if dt <= 0:
+            return self.predict(0.0)  # Pas de nouvelle mesure
+        self._timestamp = timestamp
+        x, P = self._x, self._P
+
+        # Prédiction: P = F P Fᵀ + Q, F = [[1, dt], [0, 1]], développé en
+        # scalaires pour ne rien allouer
+        q = self.process_noise
+        p00, p01, p11 = float(P[0, 0]), float(P[0, 1]), float(P[1, 1])
+        p00 += 2 * dt * p01 + dt * dt * p11 + q * dt**3 / 3
+        p01 += dt * p11 + q * dt**2 / 2
+        p11 += q * dt
+
+        # Correction avec la position mesurée
+        s = p00 + self.measurement_noise
+        k0, k1 = p00 / s, p01 / s
+        for axis in range(2):
+            position = x[axis, 0] + x[axis, 1] * dt
+            innovation = pos[axis] - position
+            x[axis, 0] = position + k0 * innovation
+            x[axis, 1] += k1 * innovation
+        P[0, 0] = p00 - k0 * p00
+        P[0, 1] = P[1, 0] = p01 - k0 * p01
+        P[1, 1] = p11 - k1 * p01
+        return self.predict(0.0)
+
+    def predict(self, horizon):
+        np.multiply(self._x[:, 1], horizon, out=self._out)
+        self._out += self._x[:, 0]
+        return self._out
+
+
+CURSOR_FILTERS: dict[str, type[CursorFilter]] = {
+    "exponential": ExponentialFilter,
+    "one_euro": OneEuroFilter,
+    "kalman": KalmanFilter,
+}
@@ -0,0 +1,75 @@
+import cv2
+import numpy as np
+
+
+class GlyphAtlas:
+    """Caractères ASCII prérendus pour une police, une taille et une couleur.
+
+    `draw_text` remplace `cv2.putText` pour les textes qui bougent ou changent
+    souvent: chaque caractère est une petite copie masquée au lieu d'être
+    rasterisé à chaque frame.
+    """
+
+    _shared: dict[tuple, "GlyphAtlas"] = {}
+
+    @classmethod
+    def get(
+        cls, font: int, scale: float, color: tuple[int, int, int], thickness: int
+    ) -> "GlyphAtlas":
+        """Retourne l'atlas partagé pour ces paramètres, créé au premier appel"""
+        key = (font, scale, tuple(color), thickness)
+        atlas = cls._shared.get(key)
+        if atlas is None:
+            atlas = cls(font, scale, color, thickness)
+            cls._shared[key] = atlas
+        return atlas
+
+    def __init__(
+        self, font: int, scale: float, color: tuple[int, int, int], thickness: int
+    ):
+        self.color = tuple(color[:3])
+        self.pad = thickness + 1
+        chars = [chr(c) for c in range(32, 127)]
+        sizes = [cv2.getTextSize(c, font, scale, thickness) for c in chars]
+        self.ascent = max(size[0][1] for size in sizes)
+        descent = max(size[1] for size in sizes)
+
+        self._advance: dict[str, float] = {}
+        self._masks: dict[str, np.ndarray] = {}
+        self._fills: dict[str, np.ndarray] = {}
+        for c, ((w, _), _) in zip(chars, sizes):
+            # Avance fractionnaire, mesurée sur une répétition du caractère
+            repeated = cv2.getTextSize(c * 11, font, scale, thickness)[0][0]
+            self._advance[c] = (repeated - w) / 10
+            mask = np.zeros(
+                (self.ascent + descent + 2 * self.pad, w + 2 * self.pad), dtype=np.uint8
+            )
+            cv2.putText(
+                mask, c, (self.pad, self.pad + self.ascent), font, scale, 255, thickness
+            )
+            self._masks[c] = mask
+            self._fills[c] = np.full((*mask.shape, 3), self.color, dtype=np.uint8)
+
+    def text_width(self, text: str) -> int:
+        return int(round(sum(self._advance.get(c, self._advance["?"]) for c in text)))
+
+    def draw_text(self, img: np.ndarray, text: str, org: tuple[int, int]):
+        """Dessine `text` avec la ligne de base en `org`, comme `cv2.putText`"""
+        pen = float(org[0])
+        top = int(org[1]) - self.pad - self.ascent
+        for c in text:
+            if c not in self._masks:
+                c = "?"
+            if c != " ":
+                self._blit(img, c, int(round(pen)) - self.pad, top)
+            pen += self._advance[c]
+
+    def _blit(self, img: np.ndarray, c: str, x: int, y: int):
+        mask = self._masks[c]
+        h, w = mask.shape
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + w, img.shape[1]), min(y + h, img.shape[0])
+        if x0 >= x1 or y0 >= y1:
+            return
+        glyph = (slice(y0 - y, y1 - y), slice(x0 - x, x1 - x))
+        cv2.copyTo(self._fills[c][glyph], mask[glyph], img[y0:y1, x0:x1])
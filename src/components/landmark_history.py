@@ -0,0 +1,93 @@
+import numpy as np
+
+
+class LandmarkHistory:
+    """Ring buffer of the last `size` detections of a hand.
+
+    Landmarks, world landmarks and timestamps are stored in preallocated
+    arrays; `push` copies into the next slot, so keeping the history never
+    allocates. Velocity and acceleration are finite differences of the
+    last samples, computed for all 21 landmarks at once.
+    """
+
+    def __init__(self, size: int = 16, max_gap: float = 0.5):
+        """
+        Args:
+            size (int): Detections kept (at least 3 for the acceleration)
+            max_gap (float): Samples more than `max_gap` seconds apart are
+                not differentiated (the hand was lost in between)
+        """
+        if size < 3:
+            raise ValueError("LandmarkHistory needs at least 3 slots")
+        self.size = size
+        self.max_gap = max_gap
+        self.landmarks = np.zeros((size, 21, 3), dtype=np.float32)
+        self.world_landmarks = np.zeros((size, 21, 3), dtype=np.float32)
+        self.timestamps = np.zeros(size, dtype=np.float64)
+        self.count = 0
+        self._head = -1  # Slot de la dernière détection
+        # Résultats réutilisés par velocity / acceleration
+        self._velocity = np.zeros((2, 21, 3), dtype=np.float32)
+        self._previous_velocity = np.zeros((2, 21, 3), dtype=np.float32)
+        self._acceleration = np.zeros((2, 21, 3), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def push(self, landmarks: np.ndarray, world_landmarks: np.ndarray, timestamp: float):
+        if self.count and not 0 < timestamp - self.timestamps[self._head] <= self.max_gap:
+            self.clear()  # Main perdue ou horloge incohérente: nouvel historique
+        self._head = (self._head + 1) % self.size
+        np.copyto(self.landmarks[self._head], landmarks)
+        np.copyto(self.world_landmarks[self._head], world_landmarks)
+        self.timestamps[self._head] = timestamp
+        self.count = min(self.count + 1, self.size)
+
+    def clear(self):
+        self.count = 0
+
+    def _slot(self, age: int) -> int:
+        """Slot de la détection d'il y a `age` échantillons (0 = la dernière)"""
+        return (self._head - age) % self.size
+
+    def latest(self, world: bool = False) -> np.ndarray | None:
+        """(21, 3) landmarks of the last detection (a view, valid until
+        `size` more pushes)"""
+        if not self.count:
+            return None
+        return (self.world_landmarks if world else self.landmarks)[self._slot(0)]
+
+    @property
+    def timestamp(self) -> float:
+        return float(self.timestamps[self._slot(0)]) if self.count else 0.0
+
+    def _difference(self, out: np.ndarray, world: bool, age: int) -> np.ndarray:
+        """Vitesse entre les échantillons `age + 1` et `age`, dans `out`"""
+        if self.count < age + 2:
+            out.fill(0.0)
+            return out
+        lms = self.world_landmarks if world else self.landmarks
+        new, old = self._slot(age), self._slot(age + 1)
+        np.subtract(lms[new], lms[old], out=out)
+        out /= self.timestamps[new] - self.timestamps[old]
+        return out
+
+    def velocity(self, world: bool = False) -> np.ndarray:
+        """(21, 3) velocity per second between the last two detections
+        (zeros with less than two). Reused between calls."""
+        return self._difference(self._velocity[int(world)], world, 0)
+
+    def acceleration(self, world: bool = False) -> np.ndarray:
+        """(21, 3) acceleration per second² over the last three detections
+        (zeros with less than three). Reused between calls."""
+        out = self._acceleration[int(world)]
+        if self.count < 3:
+            out.fill(0.0)
+            return out
+        v1 = self._difference(self._velocity[int(world)], world, 0)
+        v0 = self._difference(self._previous_velocity[int(world)], world, 1)
+        # Pas de temps non uniforme: écart entre les milieux des deux intervalles
+        dt = (self.timestamps[self._slot(0)] - self.timestamps[self._slot(2)]) / 2
+        np.subtract(v1, v0, out=out)
+        out /= dt
+        return out
@@ -1,4 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from components.landmark_history import LandmarkHistory
+from components.shot_trigger import ShotTrigger
 
 
 @dataclass
@@ -24,6 +29,11 @@ class PlayerHand:
     average_dist_3D: float = 0.5
     wrist_pos_3d: tuple[float, float, float] = None
 
+    # Dernières détections de la main, pour la vitesse (extrapolation entre
+    # deux inférences) et la détection des tirs dans le temps
+    history: LandmarkHistory = field(default_factory=LandmarkHistory)
+    trigger: ShotTrigger = field(default_factory=ShotTrigger)
+
     # Number of frames since the hand was last detected, used to determine when to remove a player from the game
     _time_since_last_claimed: int = 0
 
@@ -31,6 +41,42 @@ class PlayerHand:
         """Marque ce joueur comme actif et réinitialise le compteur de temps depuis la dernière détection"""
         self._time_since_last_claimed = 0
 
+    @property
+    def landmarks(self) -> np.ndarray | None:
+        """Landmarks (21, 3) de la dernière détection"""
+        return self.history.latest()
+
+    @property
+    def world_landmarks(self) -> np.ndarray | None:
+        return self.history.latest(world=True)
+
+    @property
+    def landmarks_velocity(self) -> np.ndarray:
+        """Vitesse par seconde des landmarks entre les deux dernières détections"""
+        return self.history.velocity()
+
+    @property
+    def world_landmarks_velocity(self) -> np.ndarray:
+        return self.history.velocity(world=True)
+
+    @property
+    def landmarks_timestamp(self) -> float:
+        return self.history.timestamp
+
+    def set_landmarks(
+        self, landmarks: np.ndarray, world_landmarks: np.ndarray, timestamp: float
+    ):
+        """Ajoute les landmarks d'une nouvelle détection à l'historique"""
+        self.history.push(landmarks, world_landmarks, timestamp)
+        if len(self.history) == 1:
+            self.trigger.reset()  # Main retrouvée après une absence: réarmer
+
+    def update_trigger(self, thumb_bent: bool, timestamp: float) -> bool:
+        """Met à jour le tir avec la pose de la dernière détection; True si un tir part"""
+        fired = self.trigger.update(thumb_bent, self.history, timestamp)
+        self.is_shooting = self.trigger.is_firing
+        return fired
+
     def update(self):
         if not self.is_active:
             return  # Ne rien faire si le joueur n'est pas actif
@@ -21,7 +21,7 @@ class RectTarget(ATarget):
         """Invisible"""
         pass
 
-    def update(self, delta: float):
+    def update(self, delta: float, width: int = 640, height: int = 480):
         """Static target, no update needed"""
         pass
 
@@ -30,6 +30,10 @@ class RectTarget(ATarget):
         if self.callback:
             self.callback()
 
+    @property
+    def bounds(self) -> tuple[int, int, int, int]:
+        return (self.x, self.y, self.x + self.w + 1, self.y + self.h + 1)
+
     def _is_hit(self, x: int, y: int) -> bool:
         """Détermine si les coordonnées (x, y) touchent le target"""
         return self.x <= x <= self.x + self.w and self.y <= y <= self.y + self.h
@@ -0,0 +1,86 @@
+from enum import Enum
+
+import numpy as np
+
+from components.landmark_history import LandmarkHistory
+
+WRIST = 0
+
+
+class ShotTrigger:
+    """Debounced shot detection for one hand.
+
+    The thumb pose of each detection (bent or released) drives a small
+    state machine, timed with the detection timestamps rather than counted
+    in frames:
+
+    - IDLE: the thumb must stay released for `arm_time` to arm the trigger
+    - ARMED: the next bent thumb fires, if the hand is steady
+    - FIRED: the shot; held while the thumb stays bent
+    - COOLDOWN: thumb released, no new shot before `cooldown` after firing
+
+    A "steady" hand moves and accelerates less than `max_hand_speed` and
+    `max_hand_acceleration` (frame sizes per second and per second²,
+    measured at the wrist): fast moves and tracking jumps can flip the
+    thumb test for one detection, they neither arm nor fire the trigger.
+    """
+
+    class State(Enum):
+        IDLE = "idle"
+        ARMED = "armed"
+        FIRED = "fired"
+        COOLDOWN = "cooldown"
+
+    def __init__(
+        self,
+        arm_time: float = 0.05,
+        cooldown: float = 0.25,
+        max_hand_speed: float = 3.0,
+        max_hand_acceleration: float = 80.0,
+    ):
+        self.arm_time = arm_time
+        self.cooldown = cooldown
+        self.max_hand_speed = max_hand_speed
+        self.max_hand_acceleration = max_hand_acceleration
+        self.state = ShotTrigger.State.IDLE
+        self.shots = 0
+        self._released_since: float | None = None
+        self._fired_at = float("-inf")
+
+    @property
+    def is_firing(self) -> bool:
+        return self.state is ShotTrigger.State.FIRED
+
+    def is_steady(self, history: LandmarkHistory) -> bool:
+        speed = np.hypot(*history.velocity()[WRIST, :2])
+        acceleration = np.hypot(*history.acceleration()[WRIST, :2])
+        return speed <= self.max_hand_speed and acceleration <= self.max_hand_acceleration
+
+    def update(self, thumb_bent: bool, history: LandmarkHistory, timestamp: float) -> bool:
+        """Advance with the pose of a new detection (already pushed to
+        `history`) and return True if it fires a shot"""
+        State = ShotTrigger.State
+        steady = self.is_steady(history)
+        if thumb_bent or not steady:
+            self._released_since = None
+        elif self._released_since is None:
+            self._released_since = timestamp
+
+        if self.state is State.FIRED and not thumb_bent:
+            self.state = State.COOLDOWN
+        if self.state is State.COOLDOWN and timestamp - self._fired_at >= self.cooldown:
+            self.state = State.IDLE
+        if self.state is State.IDLE and self._released_since is not None:
+            if timestamp - self._released_since >= self.arm_time:
+                self.state = State.ARMED
+        elif self.state is State.ARMED and thumb_bent and steady:
+            self.state = State.FIRED
+            self._fired_at = timestamp
+            self.shots += 1
+            return True
+        return False
+
+    def reset(self):
+        """Hand lost: it must be re-armed"""
+        self.state = ShotTrigger.State.IDLE
+        self._released_since = None
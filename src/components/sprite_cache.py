@@ -0,0 +1,96 @@
+import os
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "assets")
+
+
+@dataclass
+class Sprite:
+    """Sprite stocké en alpha prémultiplié, prêt à être mélangé sur une frame"""
+
+    premultiplied: np.ndarray  # (h, w, 3) uint8, couleur * alpha / 255
+    inv_alpha: np.ndarray  # (h, w, 3) uint8, 255 - alpha
+    # Masque uint8 si l'alpha est binaire (texte, ...): simple copie masquée
+    mask: np.ndarray | None = None
+
+    @property
+    def width(self) -> int:
+        return self.premultiplied.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.premultiplied.shape[0]
+
+    @classmethod
+    def from_bgra(cls, image: np.ndarray) -> "Sprite":
+        if image.ndim == 2:
+            image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGRA)
+        elif image.shape[2] == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2BGRA)
+        alpha = image[:, :, 3]
+        # Arrondi inférieur: premultiplied + fond * (1 - alpha) ne dépasse jamais 255
+        premultiplied = (
+            image[:, :, :3].astype(np.uint16) * alpha[:, :, None] // 255
+        ).astype(np.uint8)
+        inv_alpha = cv2.merge([255 - alpha] * 3)
+        mask = None
+        if np.all((alpha == 0) | (alpha == 255)):
+            mask = np.ascontiguousarray(alpha)
+        return cls(np.ascontiguousarray(premultiplied), inv_alpha, mask)
+
+    def blit(self, img: np.ndarray, x: int, y: int):
+        """Mélange le sprite sur `img`, coin haut-gauche en (x, y), découpé aux bords"""
+        h, w = self.premultiplied.shape[:2]
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + w, img.shape[1]), min(y + h, img.shape[0])
+        if x0 >= x1 or y0 >= y1:
+            return
+        roi = img[y0:y1, x0:x1]
+        sx, sy = x0 - x, y0 - y
+        sprite_slice = (slice(sy, sy + y1 - y0), slice(sx, sx + x1 - x0))
+
+        if self.mask is not None:
+            cv2.copyTo(self.premultiplied[sprite_slice], self.mask[sprite_slice], roi)
+            return
+        # fond * (255 - alpha) / 255 + couleur prémultipliée, en deux passes SIMD
+        background = cv2.multiply(roi, self.inv_alpha[sprite_slice], scale=1 / 255)
+        cv2.add(background, self.premultiplied[sprite_slice], dst=roi)
+
+
+class SpriteCache:
+    """Cache partagé des sprites redimensionnés, indexé par (nom, taille, flip)"""
+
+    _images: dict[str, np.ndarray] = {}
+    _sprites: dict[tuple[str, tuple[int, int], bool], Sprite] = {}
+
+    @classmethod
+    def _load(cls, name: str) -> np.ndarray:
+        image = cls._images.get(name)
+        if image is None:
+            path = os.path.join(ASSETS_DIR, f"{name}.png")
+            image = cv2.imread(path, cv2.IMREAD_UNCHANGED)
+            if image is None:
+                raise FileNotFoundError(f"Cannot load sprite {path}")
+            cls._images[name] = image
+        return image
+
+    @classmethod
+    def get(cls, name: str, size: tuple[int, int], flip: bool = False) -> Sprite:
+        """Retourne le sprite `assets/<name>.png` à la taille (w, h), miroir si `flip`"""
+        key = (name, size, flip)
+        sprite = cls._sprites.get(key)
+        if sprite is None:
+            image = cv2.resize(cls._load(name), size)
+            if flip:
+                image = cv2.flip(image, 1)
+            sprite = Sprite.from_bgra(image)
+            cls._sprites[key] = sprite
+        return sprite
+
+    @classmethod
+    def clear(cls):
+        cls._images.clear()
+        cls._sprites.clear()
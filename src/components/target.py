@@ -1,79 +1,103 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-import cv2
 from cv2.typing import MatLike
 import random
 
 import numpy as np
 
 from components.atarget import ATarget
+from global_data import GlobalData
+from components.sprite_cache import Sprite, SpriteCache
 
 
 @dataclass
 class Target(ATarget):
     radius: int
     _velocity: tuple[float, float] = (0.0, 0.0)
+    # Position exacte de la simulation et celle du tick précédent; x et y en
+    # sont l'arrondi. Le canard est dessiné et touché entre les deux
+    _pos: tuple[float, float] = field(default=(0.0, 0.0), init=False)
+    _prev_pos: tuple[float, float] = field(default=(0.0, 0.0), init=False)
+    # Taille de la zone de jeu au dernier update, pour réapparaître dedans
+    _area: tuple[int, int] = field(default=(640, 480), init=False)
 
     def __post_init__(self):
+        self._pos = self._prev_pos = (float(self.x), float(self.y))
         # Initialiser une vélocité aléatoire pour le target
         angle = random.uniform(0, 2 * np.pi)
         speed = random.uniform(50, 150)  # pixels par seconde
         self._velocity = (speed * np.cos(angle), speed * np.sin(angle))
-        self.sprite_right = cv2.imread("assets/duck_right.png", cv2.IMREAD_UNCHANGED)
-        self.sprite_right = cv2.resize(
-            self.sprite_right, (self.radius * 2, self.radius * 2)
-        )
-        self.sprite_up = cv2.imread("assets/duck_up.png", cv2.IMREAD_UNCHANGED)
-        self.sprite_up = cv2.resize(self.sprite_up, (self.radius * 2, self.radius * 2))
-        self.sprite_down = cv2.imread("assets/duck_down.png", cv2.IMREAD_UNCHANGED)
-        self.sprite_down = cv2.resize(
-            self.sprite_down, (self.radius * 2, self.radius * 2)
-        )
 
-    def draw(self, img: MatLike):
-        """Dessine le target avec un style arrondi"""
-        x1, y1 = self.x - self.radius, self.y - self.radius
-        x2, y2 = self.x + self.radius, self.y + self.radius
-
-        # Sprite du target
-        sprite = self.sprite_up
+    def _sprite(self) -> Sprite:
+        """Choisit le sprite selon la direction du mouvement"""
+        name = "duck_up"
         if abs(self._velocity[1]) > abs(self._velocity[0]):
             if self._velocity[1] > 0:
-                sprite = self.sprite_down
+                name = "duck_down"
         else:
-            sprite = self.sprite_right
+            name = "duck_right"
         # flip if moving left
-        if self._velocity[0] < 0:
-            sprite = cv2.flip(sprite, 1)
-        for c in range(0, 3):
-            img[y1:y2, x1:x2, c] = sprite[:, :, c] * (sprite[:, :, 3] / 255.0) + img[
-                y1:y2, x1:x2, c
-            ] * (1.0 - sprite[:, :, 3] / 255.0)
+        size = (self.radius * 2, self.radius * 2)
+        return SpriteCache.get(name, size, flip=self._velocity[0] < 0)
+
+    def _drawn_pos(self) -> tuple[int, int]:
+        """Position affichée, interpolée entre les deux derniers ticks de simulation"""
+        a = GlobalData.alpha
+        x = self._prev_pos[0] + (self._pos[0] - self._prev_pos[0]) * a
+        y = self._prev_pos[1] + (self._pos[1] - self._prev_pos[1]) * a
+        return round(x), round(y)
+
+    def draw(self, img: MatLike):
+        """Dessine le target avec un style arrondi, à sa position interpolée"""
+        x, y = self._drawn_pos()
+        self._sprite().blit(img, x - self.radius, y - self.radius)
 
     def _to_radian(self, angle):
         return angle * np.pi / 180
 
-    def update(self, delta: float):
+    def update(self, delta: float, width: int = 640, height: int = 480):
         """Met à jour la position du target en fonction de sa vélocité"""
-        self.x += int(self._velocity[0] * delta)
-        self.y += int(self._velocity[1] * delta)
+        self._prev_pos = self._pos
+        self._area = (width, height)
+        x = self._pos[0] + self._velocity[0] * delta
+        y = self._pos[1] + self._velocity[1] * delta
 
         # Rebondir sur les bords de l'écran
-        if self.x - self.radius < 0 or self.x + self.radius > 640:
+        if x - self.radius < 0 or x + self.radius > width:
             self._velocity = (-self._velocity[0], self._velocity[1])
-            self.x = max(self.radius, min(640 - self.radius, self.x))
-        if self.y - self.radius < 0 or self.y + self.radius > 480:
+            x = max(self.radius, min(width - self.radius, x))
+        if y - self.radius < 0 or y + self.radius > height:
             self._velocity = (self._velocity[0], -self._velocity[1])
-            self.y = max(self.radius, min(480 - self.radius, self.y))
+            y = max(self.radius, min(height - self.radius, y))
+        self._pos = (x, y)
+        self.x, self.y = round(x), round(y)
 
     def on_shot(self):
         """Réinitialise le target à une position aléatoire et une nouvelle vélocité"""
-        self.x = random.randint(50, 590)
-        self.y = random.randint(50, 430)
+        width, height = self._area
+        margin = max(50, self.radius)
+        self.x = random.randint(margin, max(margin, width - margin))
+        self.y = random.randint(margin, max(margin, height - margin))
+        # Pas d'interpolation depuis l'ancienne position
+        self._pos = self._prev_pos = (float(self.x), float(self.y))
         angle = random.uniform(0, 2 * np.pi)
         speed = random.uniform(50, 150)  # pixels par seconde
         self._velocity = (speed * np.cos(angle), speed * np.sin(angle))
 
+    @property
+    def bounds(self) -> tuple[int, int, int, int]:
+        """Couvre le trajet entre les deux derniers ticks: le canard dessiné y
+        est quel que soit `alpha`, même si l'index est mis à jour avant lui"""
+        r = self.radius
+        x0, y0 = round(self._prev_pos[0]), round(self._prev_pos[1])
+        return (
+            min(x0, self.x) - r,
+            min(y0, self.y) - r,
+            max(x0, self.x) + r + 1,
+            max(y0, self.y) + r + 1,
+        )
+
     def _is_hit(self, x: int, y: int) -> bool:
-        """Détermine si les coordonnées (x, y) touchent le target"""
-        return (x - self.x) ** 2 + (y - self.y) ** 2 <= self.radius**2
+        """Détermine si les coordonnées (x, y) touchent le target tel qu'il est dessiné"""
+        cx, cy = self._drawn_pos()
+        return (x - cx) ** 2 + (y - cy) ** 2 <= self.radius**2
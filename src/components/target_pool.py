@@ -0,0 +1,261 @@
+from dataclasses import dataclass
+
+import numpy as np
+from cv2.typing import MatLike
+
+from components.sprite_cache import SpriteCache
+
+# Index dans `TargetPool.sprites`
+SPRITE_UP, SPRITE_DOWN, SPRITE_RIGHT = 0, 1, 2
+SPRITE_NAMES = ("duck_up", "duck_down", "duck_right")
+
+# Cellules voisines à comparer pour ne tester chaque paire qu'une fois
+_NEIGHBOUR_CELLS = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+# Cellules où peut se trouver le centre d'un canard touché par un tir
+_HIT_CELLS = tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1))
+_CELL_KEY = 1 << 20
+
+
+class TargetPool:
+    """Canards stockés en tableaux NumPy (une ligne par canard).
+
+    Mouvement, rebonds sur les bords de la frame, collisions entre canards
+    et choix du sprite sont calculés pour tous les canards à la fois, ce qui
+    permet des manches avec des milliers de canards. Collisions et tirs ne
+    testent que les canards des cellules voisines, via un hachage des
+    cellules trié (cellules de la taille du plus grand diamètre).
+    """
+
+    @dataclass
+    class Duck:
+        """Référence vers un canard du pool, passée aux abonnés de "target_hit" """
+
+        pool: "TargetPool"
+        index: int
+
+        def on_shot(self):
+            self.pool.respawn(self.index)
+
+    def __init__(
+        self,
+        count: int,
+        width: int = 640,
+        height: int = 480,
+        radius: int = 20,
+        speed: tuple[float, float] = (50.0, 150.0),
+        collisions: bool = False,
+        seed: int | None = None,
+    ):
+        """
+        Args:
+            count (int): Nombre de canards
+            width (int), height (int): Taille de la zone de jeu
+            radius (int): Rayon des canards en pixels
+            speed (tuple[float, float]): Vitesse min/max en pixels par seconde
+            collisions (bool): Faire rebondir les canards entre eux
+        """
+        self.width, self.height = width, height
+        self.speed = speed
+        self.collisions = collisions
+        self.rng = np.random.default_rng(seed)
+
+        self.positions = np.zeros((count, 2), dtype=np.float64)
+        # Positions au tick précédent, pour interpoler le rendu
+        self.previous_positions = np.zeros((count, 2), dtype=np.float64)
+        self.velocities = np.zeros((count, 2), dtype=np.float64)
+        self.speeds = np.zeros(count, dtype=np.float64)  # Norme de la vitesse
+        self.radii = np.full(count, radius, dtype=np.int32)
+        self.sprites = np.zeros(count, dtype=np.int8)
+        self.flipped = np.zeros(count, dtype=bool)
+        # (taille de cellule, ordre des canards, clés triées), recalculé
+        # seulement après un déplacement
+        self._cells: tuple[int, np.ndarray, np.ndarray] | None = None
+        self.respawn(np.arange(count))
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def set_radius(self, radius: int):
+        """Change le rayon de tous les canards (ex: nouvelle résolution)"""
+        self.radii[:] = radius
+        self._cells = None
+
+    def respawn(self, index):
+        """Replace les canards `index` (int ou tableau) à une position et une
+        vitesse aléatoires"""
+        index = np.atleast_1d(index)
+        n = len(index)
+        r = self.radii[index]
+        low = np.stack([r, r], axis=1)
+        high = np.stack([self.width - r, self.height - r], axis=1)
+        self.positions[index] = self.rng.uniform(low, np.maximum(high, low + 1))
+        self._cells = None
+        self.previous_positions[index] = self.positions[index]
+        angle = self.rng.uniform(0, 2 * np.pi, n)
+        speed = self.rng.uniform(*self.speed, n)
+        self.speeds[index] = speed
+        self.velocities[index, 0] = speed * np.cos(angle)
+        self.velocities[index, 1] = speed * np.sin(angle)
+        self._update_sprites()
+
+    def update(self, delta: float, width: int | None = None, height: int | None = None):
+        """Avance la simulation de `delta` secondes dans une zone width x height"""
+        if width is not None:
+            self.width, self.height = width, height
+        pos, vel = self.positions, self.velocities
+        self.previous_positions[:] = pos
+        pos += vel * delta
+
+        if self.collisions and len(self) > 1:
+            self._collide()
+
+        # Rebondir sur les bords de la frame
+        r = self.radii
+        for axis, size in ((0, self.width), (1, self.height)):
+            low = pos[:, axis] < r
+            high = pos[:, axis] > size - r
+            vel[low, axis] = np.abs(vel[low, axis])
+            vel[high, axis] = -np.abs(vel[high, axis])
+            np.clip(pos[:, axis], r, np.maximum(size - r, r), out=pos[:, axis])
+
+        self._cells = None
+        self._update_sprites()
+
+    @staticmethod
+    def _cell_keys(points: np.ndarray, cell: int) -> np.ndarray:
+        cells = np.floor_divide(points, cell).astype(np.int64)
+        return cells[:, 0] * _CELL_KEY + cells[:, 1]
+
+    def _build_cells(self) -> tuple[int, np.ndarray, np.ndarray]:
+        """Taille de cellule, canards triés par cellule et leurs clés"""
+        cell = max(2 * int(self.radii.max()), 1)
+        keys = self._cell_keys(self.positions, cell)
+        order = np.argsort(keys, kind="stable")
+        return cell, order, keys[order]
+
+    def _sorted_cells(self) -> tuple[int, np.ndarray, np.ndarray]:
+        """`_build_cells`, gardé tant que les canards ne bougent pas"""
+        if self._cells is None:
+            self._cells = self._build_cells()
+        return self._cells
+
+    @staticmethod
+    def _expand(lo: np.ndarray, hi: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Pour des intervalles [lo, hi), (numéro de l'intervalle, position)
+        de chacun de leurs éléments"""
+        counts = np.maximum(hi - lo, 0)
+        total = int(counts.sum())
+        owner = np.repeat(np.arange(len(lo)), counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        return owner, lo[owner] + offsets
+
+    def _candidate_pairs(self) -> tuple[np.ndarray, np.ndarray]:
+        """Paires (i, j) de canards dans des cellules voisines"""
+        n = len(self)
+        # Index des positions qui viennent d'avancer, invalidé à la fin d'update
+        _, order, sorted_keys = self._build_cells()
+        rank = np.arange(n)
+
+        pairs_i, pairs_j = [], []
+        for dx, dy in _NEIGHBOUR_CELLS:
+            wanted = sorted_keys + dx * _CELL_KEY + dy
+            lo = np.searchsorted(sorted_keys, wanted, "left")
+            hi = np.searchsorted(sorted_keys, wanted, "right")
+            if dx == 0 and dy == 0:
+                lo = np.maximum(lo, rank + 1)  # Même cellule: j > i seulement
+            owner, slots = self._expand(lo, hi)
+            if not len(owner):
+                continue
+            pairs_i.append(order[owner])
+            pairs_j.append(order[slots])
+        if not pairs_i:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        return np.concatenate(pairs_i), np.concatenate(pairs_j)
+
+    def _collide(self):
+        """Collisions entre canards: séparation et rebond, sans changer leur vitesse"""
+        i, j = self._candidate_pairs()
+        if not len(i):
+            return
+        delta = self.positions[j] - self.positions[i]
+        dist = np.hypot(delta[:, 0], delta[:, 1])
+        overlap = self.radii[i] + self.radii[j] - dist
+        touching = (overlap > 0) & (dist > 1e-9)
+        if not touching.any():
+            return
+        i, j = i[touching], j[touching]
+        normal = delta[touching] / dist[touching, None]
+        overlap = overlap[touching]
+
+        # Un canard en plusieurs contacts reçoit la moyenne des corrections,
+        # sinon leur somme injecte de l'énergie quand la nuée est dense
+        contacts = np.bincount(i, minlength=len(self)) + np.bincount(j, minlength=len(self))
+        share = (1.0 / np.maximum(contacts[i], contacts[j]))[:, None]
+
+        # Séparer les canards, chacun de la moitié du recouvrement
+        push = normal * (overlap / 2)[:, None] * share
+        np.add.at(self.positions, i, -push)
+        np.add.at(self.positions, j, push)
+
+        # Échanger les composantes normales des vitesses s'ils se rapprochent
+        approach = np.einsum("ij,ij->i", self.velocities[j] - self.velocities[i], normal)
+        approach = np.minimum(approach, 0.0)[:, None] * normal * share
+        np.add.at(self.velocities, i, approach)
+        np.add.at(self.velocities, j, -approach)
+
+        # Les collisions ne changent que la direction: chaque canard garde sa vitesse
+        norm = np.hypot(self.velocities[:, 0], self.velocities[:, 1])
+        moving = norm > 1e-9
+        self.velocities[moving] *= (self.speeds[moving] / norm[moving])[:, None]
+
+    def _update_sprites(self):
+        vx, vy = self.velocities[:, 0], self.velocities[:, 1]
+        vertical = np.abs(vy) > np.abs(vx)
+        self.sprites[:] = np.where(
+            vertical, np.where(vy > 0, SPRITE_DOWN, SPRITE_UP), SPRITE_RIGHT
+        )
+        # flip if moving left
+        self.flipped[:] = vx < 0
+
+    def hit_test(self, points) -> np.ndarray:
+        """Pour chaque point (x, y), l'index du premier canard touché ou -1"""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        hits = np.full(len(points), -1, dtype=np.int64)
+        if not len(self) or not len(points):
+            return hits
+        # Un canard touché a son centre à moins d'un rayon du point, donc dans
+        # la cellule du point ou une voisine: seuls ces canards sont testés
+        cell, order, sorted_keys = self._sorted_cells()
+        point_keys = self._cell_keys(points, cell)
+        first = np.full(len(points), len(self), dtype=np.int64)
+        for dx, dy in _HIT_CELLS:
+            wanted = point_keys + dx * _CELL_KEY + dy
+            lo = np.searchsorted(sorted_keys, wanted, "left")
+            hi = np.searchsorted(sorted_keys, wanted, "right")
+            owner, slots = self._expand(lo, hi)
+            if not len(owner):
+                continue
+            ducks = order[slots]
+            delta = self.positions[ducks] - points[owner]
+            inside = (delta**2).sum(axis=1) <= self.radii[ducks].astype(np.float64) ** 2
+            # Premier canard (plus petit index) touché par chaque point
+            np.minimum.at(first, owner[inside], ducks[inside])
+        hit = first < len(self)
+        hits[hit] = first[hit]
+        return hits
+
+    def draw(self, img: MatLike, alpha: float = 1.0):
+        """Dessine tous les canards, interpolés à `alpha` entre le tick
+        précédent et le tick courant"""
+        pos = self.previous_positions + (self.positions - self.previous_positions) * alpha
+        corners = np.rint(pos - self.radii[:, None]).astype(np.int32).tolist()
+        keys = zip(self.sprites.tolist(), self.flipped.tolist(), self.radii.tolist())
+        sprites = {}
+        for (x, y), key in zip(corners, keys):
+            sprite = sprites.get(key)
+            if sprite is None:
+                name, flip, r = SPRITE_NAMES[key[0]], key[1], key[2]
+                sprite = SpriteCache.get(name, (2 * r, 2 * r), flip=flip)
+                sprites[key] = sprite
+            sprite.blit(img, x, y)
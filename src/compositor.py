@@ -0,0 +1,55 @@
+from contextlib import contextmanager
+
+import cv2
+import numpy as np
+
+
+class Compositor:
+    """Compose la frame affichée sans passes plein écran inutiles.
+
+    La frame caméra est mise en miroir une seule fois dans un buffer
+    réutilisé, et les overlays (transparence, addition) ne sont appliqués
+    que dans leur rectangle englobant.
+    """
+
+    def __init__(self):
+        self._frame: np.ndarray | None = None
+        # Reste noir en dehors du rectangle en cours de dessin
+        self._overlay: np.ndarray | None = None
+
+    def mirror(self, frame: np.ndarray) -> np.ndarray:
+        """Retourne `frame` en miroir horizontal, dans le buffer de composition"""
+        if self._frame is None or self._frame.shape != frame.shape:
+            self._frame = np.empty_like(frame)
+            self._overlay = np.zeros_like(frame)
+        cv2.flip(frame, 1, dst=self._frame)
+        return self._frame
+
+    @staticmethod
+    def clip_rect(img: np.ndarray, rect) -> tuple[int, int, int, int] | None:
+        """Restreint `rect` (x1, y1, x2, y2 exclusifs) à l'image, None si vide"""
+        h, w = img.shape[:2]
+        if rect is None:
+            return 0, 0, w, h
+        x1, y1, x2, y2 = rect
+        x1, y1 = max(int(x1), 0), max(int(y1), 0)
+        x2, y2 = min(int(x2), w), min(int(y2), h)
+        if x1 >= x2 or y1 >= y2:
+            return None
+        return x1, y1, x2, y2
+
+    @contextmanager
+    def overlay(self, img: np.ndarray, rect=None):
+        """Fournit un overlay noir de la taille de `img` sur lequel dessiner
+        à l'intérieur de `rect`; il est ajouté (`cv2.add`) à `img` à la sortie."""
+        if self._overlay is None or self._overlay.shape != img.shape:
+            self._overlay = np.zeros_like(img)
+        yield self._overlay
+        rect = self.clip_rect(img, rect)
+        if rect is None:
+            return
+        x1, y1, x2, y2 = rect
+        roi = img[y1:y2, x1:x2]
+        overlay_roi = self._overlay[y1:y2, x1:x2]
+        cv2.add(overlay_roi, roi, dst=roi)
+        overlay_roi.fill(0)
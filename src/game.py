@@ -1,17 +1,38 @@
-import cv2
+import logging
+import time
 import typing
-import numpy as np
 
-from components import PlayerHand, Cursor, Target, QuitButton, RectTarget
+import cv2
+
+from components import PlayerHand, Cursor, Target, QuitButton, RectTarget, TargetPool
+from components.cursor_filter import CURSOR_FILTERS
+from compositor import Compositor
 from global_data import GlobalData
+from hud import HudLayer, TileCanvas
+from profiler import profiler
+from spatial_grid import SpatialGrid
 
 if typing.TYPE_CHECKING:
     from model import Model
 
+logger = logging.getLogger(__name__)
+
+# Tailles en pixels de la mise en page d'origine (480 px de haut), mises à
+# l'échelle par `Game.ui_scale`
+TARGET_RADIUS = 30
+SWARM_RADIUS = 20
+
 
 class Game:
-    def __init__(self, md: "Model"):
+    def __init__(
+        self,
+        md: "Model",
+        cursor_filter: str = "exponential",
+        swarm_size: int = 0,
+        swarm_collisions: bool = False,
+    ):
         self.md = md
+        self.cursor_filter = cursor_filter  # Clé de CURSOR_FILTERS
         self.qt = 0
         self.cursors: dict[int, Cursor] = {}
         self.targets = []  # List of targets to shoot at
@@ -19,28 +40,51 @@ class Game:
         self.game_over = False
         self.winCondition = 5
         self.show_panel = False
+        self.compositor = Compositor()
+        self.hud = HudLayer()
+        self.target_index = SpatialGrid()
+        s = self.ui_scale
+        # Manche "nuée": canards supplémentaires simulés en bloc
+        self.swarm = (
+            TargetPool(
+                swarm_size,
+                width=md.width,
+                height=md.height,
+                radius=max(round(SWARM_RADIUS * s), 1),
+                collisions=swarm_collisions,
+            )
+            if swarm_size > 0
+            else None
+        )
         self.targets.extend(
             [
                 QuitButton(
-                    x=20,
+                    x=round(20 * s),
                     y=md.height - md.height // 20 - 10,
                     width=md.width // 5,
                     height=md.height // 20,
                 ),
-                Target(x=md.width // 2, y=md.height // 2, radius=30),
+                Target(
+                    x=md.width // 2,
+                    y=md.height // 2,
+                    radius=max(round(TARGET_RADIUS * s), 1),
+                ),
                 RectTarget(
                     x=md.width // 4,
                     y=md.height // 4,
-                    w=80,
-                    h=80,
+                    w=round(80 * s),
+                    h=round(80 * s),
                     callback=self.toggle_help_panel,
                 ),
             ]
         )
-        GlobalData.subscribe("target_hit", self.on_target_hit)
+        self._layout_height = md.height  # Hauteur pour laquelle les tailles sont calculées
+        self._sync_target_index()
+        self.target_hit = GlobalData.signal("target_hit")
+        self.target_hit.connect(self.on_target_hit)
 
     def on_target_hit(self, player_id, target):
-        if not isinstance(target, Target):
+        if not isinstance(target, (Target, TargetPool.Duck)):
             return
         # Initialiser le score du joueur s'il n'existe pas
         if player_id not in self.scores:
@@ -48,10 +92,39 @@ class Game:
 
         # Incrémenter le score
         self.scores[player_id] += 1
-        print(f"Player {player_id} hit a {target}! Score: {self.scores[player_id]}")
+        logger.info("Player %s hit a %s! Score: %d", player_id, target, self.scores[player_id])
         if self.scores[player_id] >= self.winCondition:
             self.game_over = True
 
+    @staticmethod
+    def player_name(player_id) -> str:
+        """Nom affiché d'un joueur: "Left 2" (main gauche, caméra 2) -> "Player Right 2" """
+        # On inverse les labels des mains car on est sur une caméra frontale
+        side, _, lane = str(player_id).partition(" ")
+        side = "Right" if side == "Left" else "Left"
+        return f"Player {side} {lane}" if lane else f"Player {side}"
+
+    @property
+    def ui_scale(self) -> float:
+        """Échelle de la mise en page (texte, rayons, panneau, curseurs) par
+        rapport à la mise en page d'origine (480 px de haut)"""
+        return self.md.height / 480
+
+    def _rescale_targets(self):
+        """Adapte le rayon des canards après un changement de résolution"""
+        s = self.ui_scale
+        for target in self.targets:
+            if isinstance(target, Target):
+                target.radius = max(round(TARGET_RADIUS * s), 1)
+        if self.swarm is not None:
+            self.swarm.set_radius(max(round(SWARM_RADIUS * s), 1))
+        self._layout_height = self.md.height
+
+    def _centered_org(self, text: str, y: int, scale: float, thickness: int) -> tuple[int, int]:
+        """Origine de `text` centré horizontalement sur la ligne `y`"""
+        (text_width, _), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness)
+        return ((self.md.width - text_width) // 2, y)
+
     def toggle_help_panel(self):
         self.show_panel = not self.show_panel
 
@@ -60,8 +133,15 @@ class Game:
         x1, y1 = pt1
         x2, y2 = pt2
 
-        # Créer un overlay pour la transparence
-        overlay = img.copy()
+        # Créer un overlay pour la transparence, limité au rectangle
+        rect = Compositor.clip_rect(img, (x1, y1, x2 + 1, y2 + 1))
+        if rect is None:
+            return
+        ox, oy = rect[0], rect[1]
+        roi = img[rect[1] : rect[3], rect[0] : rect[2]]
+        overlay = roi.copy()
+        x1, x2 = x1 - ox, x2 - ox
+        y1, y2 = y1 - oy, y2 - oy
 
         # Rectangle principal
         cv2.rectangle(overlay, (x1 + radius, y1), (x2 - radius, y2), color, -1)
@@ -74,30 +154,56 @@ class Game:
         cv2.circle(overlay, (x2 - radius, y2 - radius), radius, color, -1)
 
         # Appliquer la transparence
-        cv2.addWeighted(overlay, 0.7, img, 0.3, 0, img)
+        cv2.addWeighted(overlay, 0.7, roi, 0.3, 0, roi)
 
     def draw_scores(self):
+        if any(player_id not in ("Left", "Right") for player_id in self.scores):
+            self._draw_lane_scores()
+            return
         left_score = self.scores.get("Left", 0)
         right_score = self.scores.get("Right", 0)
-        cv2.putText(
+        s = self.ui_scale
+        y = self.md.height - round(16 * s)
+        # Tuiles en cache: re-rendues seulement quand un score change
+        self.hud.draw_text(
             self.md.frame,
             f"Right Score: {left_score}",
-            (400, 464),
+            (self.md.width * 400 // 640, y),
             cv2.FONT_HERSHEY_SIMPLEX,
-            0.9,
+            0.9 * s,
             (255, 255, 255),
-            2,
+            max(round(2 * s), 1),
         )
-        cv2.putText(
+        self.hud.draw_text(
             self.md.frame,
             f"Left Score: {right_score}",
-            (170, 464),
+            (self.md.width * 170 // 640, y),
             cv2.FONT_HERSHEY_SIMPLEX,
-            0.9,
+            0.9 * s,
             (255, 255, 255),
-            2,
+            max(round(2 * s), 1),
         )
 
+    def _draw_lane_scores(self):
+        """Scores de plusieurs caméras: une ligne par joueur, en bas à droite"""
+        lines = [
+            f"{self.player_name(player_id)[len('Player '):]}: {score}"
+            for player_id, score in sorted(self.scores.items())
+        ]
+        for i, line in enumerate(reversed(lines)):
+            self.hud.draw_text(
+                self.md.frame,
+                line,
+                (
+                    self.md.width - round(180 * self.ui_scale),
+                    self.md.height - round((16 + i * 26) * self.ui_scale),
+                ),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.7 * self.ui_scale,
+                (255, 255, 255),
+                max(round(2 * self.ui_scale), 1),
+            )
+
     def draw_info_panel(self, player_count: int, angles: PlayerHand.Angle | None):
         """Affiche un panneau d'informations stylisé"""
         title = "Help" if self.show_panel else "Press 'H' for help"
@@ -116,12 +222,12 @@ class Game:
             if self.show_panel
             else ""
         )
-        panel_height = content.count("\n") * 28 + 50
-        panel_width = (
-            max(len(title) * 13, len(max(content.split("\n"), key=len)) * 10) + 20
+        s = self.ui_scale
+        panel_height = round((content.count("\n") * 28 + 50) * s)
+        panel_width = round(
+            (max(len(title) * 13, len(max(content.split("\n"), key=len)) * 10) + 20) * s
         )
-        panel_x = 10
-        panel_y = 10
+        panel_x = panel_y = round(10 * s)
         panel_target: RectTarget = self.targets[
             2
         ]  # Assuming the RectTarget is the third target in the list
@@ -131,59 +237,125 @@ class Game:
             panel_target.h = panel_height
             panel_target.x = panel_x
             panel_target.y = panel_y
+            self.target_index.update(2, panel_target.bounds)
+
+        # Le panneau n'est rendu qu'une fois par état, puis simplement blitté
+        self.hud.draw(
+            self.md.frame,
+            ("panel", self.show_panel, panel_x, panel_y, panel_width, panel_height),
+            lambda: self._render_info_panel(
+                title, content, panel_x, panel_y, panel_width, panel_height, s
+            ),
+        )
+
+    def _render_info_panel(
+        self,
+        title: str,
+        content: str,
+        panel_x: int,
+        panel_y: int,
+        panel_width: int,
+        panel_height: int,
+        scale: float = 1.0,
+    ):
+        """Rend le panneau d'informations dans une tuile BGRA, à l'échelle `scale`"""
+        border = max(round(2 * scale), 1)
+        margin = border  # La bordure déborde du rectangle
+        title_font = (cv2.FONT_HERSHEY_DUPLEX, 0.7 * scale, border)
+        line_font = (cv2.FONT_HERSHEY_SIMPLEX, 0.6 * scale, max(round(scale), 1))
+        indent = round(15 * scale)
+        lines = content.split("\n")
+        text_width = max(
+            cv2.getTextSize(title, *title_font)[0][0] + indent,
+            *(cv2.getTextSize(line, *line_font)[0][0] + indent for line in lines),
+        )
+        canvas = TileCanvas(
+            max(panel_width, text_width) + 1 + 2 * margin,
+            panel_height + 1 + 2 * margin,
+        )
+        x, y = margin, margin
 
         # Fond du panneau avec transparence
-        overlay = self.md.frame.copy()
-        cv2.rectangle(
-            overlay,
-            (panel_x, panel_y),
-            (panel_x + panel_width, panel_y + panel_height),
-            (40, 40, 40),
-            -1,
+        canvas.fill_rect(
+            (x, y), (x + panel_width, y + panel_height), (40, 40, 40), alpha=0.8
         )
-        cv2.addWeighted(overlay, 0.8, self.md.frame, 0.2, 0, self.md.frame)
 
         # Bordure du panneau
-        cv2.rectangle(
-            self.md.frame,
-            (panel_x, panel_y),
-            (panel_x + panel_width, panel_y + panel_height),
-            (0, 200, 255),
-            2,
+        canvas.rectangle(
+            (x, y), (x + panel_width, y + panel_height), (0, 200, 255), border
         )
 
         # Titre
-        cv2.putText(
-            self.md.frame,
+        font, font_scale, thickness = title_font
+        canvas.text(
             title,
-            (panel_x + 14, panel_y + 30),
-            cv2.FONT_HERSHEY_DUPLEX,
-            0.7,
+            (x + round(14 * scale), y + round(30 * scale)),
+            font,
+            font_scale,
             (0, 255, 255),
-            2,
+            thickness,
         )
 
-        for i, line in enumerate(content.split("\n")):
-            cv2.putText(
-                self.md.frame,
+        font, font_scale, thickness = line_font
+        for i, line in enumerate(lines):
+            canvas.text(
                 line,
-                (panel_x + 15, panel_y + 60 + i * 25),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.6,
+                (x + indent, y + round((60 + i * 25) * scale)),
+                font,
+                font_scale,
                 (255, 255, 255),
-                1,
+                thickness,
             )
+        return canvas.bgra(), panel_x - margin, panel_y - margin
 
     def handle_click(self, player_id, x, y, cursor: Cursor):
-        if not cursor.just_clicked:
+        if cursor.just_clicked:
+            self.handle_clicks([(player_id, x, y)])
+
+    def handle_clicks(self, clicks: list[tuple[str, int, int]]):
+        """Résout en une requête groupée les tirs (player_id, x, y) de la frame.
+
+        Seuls les targets proches d'un tir (via l'index spatial) sont testés, et
+        un target ne peut être touché qu'une fois par frame, par le premier tir.
+        """
+        if not clicks:
             return
         if self.game_over:
             self.game_over = False
             self.scores = {}
-        for target in self.targets:
-            if target._is_hit(x, y):
-                GlobalData.emit("target_hit", player_id=player_id, target=target)
-                target.on_shot()
+        candidates = self.target_index.query_points([(x, y) for _, x, y in clicks])
+        hit = set()
+        for (player_id, x, y), near in zip(clicks, candidates):
+            # Ordre de la liste des targets, comme avant l'index
+            for i in sorted(near - hit):
+                target = self.targets[i]
+                if target._is_hit(x, y):
+                    hit.add(i)
+                    self.target_hit.emit(player_id=player_id, target=target)
+                    target.on_shot()
+                    self.target_index.update(i, target.bounds)
+
+        if self.swarm is not None:
+            self._handle_swarm_clicks(clicks)
+
+    def _handle_swarm_clicks(self, clicks: list[tuple[str, int, int]]):
+        """Teste tous les tirs contre tous les canards de la nuée en une passe"""
+        indices = self.swarm.hit_test([(x, y) for _, x, y in clicks])
+        hit = set()
+        for (player_id, _, _), i in zip(clicks, indices.tolist()):
+            if i < 0 or i in hit:
+                continue
+            hit.add(i)
+            duck = TargetPool.Duck(self.swarm, i)
+            self.target_hit.emit(player_id=player_id, target=duck)
+            duck.on_shot()
+
+    def _sync_target_index(self):
+        """Met à jour l'index spatial avec la position courante des targets"""
+        if len(self.target_index) != len(self.targets):
+            self.target_index.clear()
+        for i, target in enumerate(self.targets):
+            self.target_index.update(i, target.bounds)
 
     def draw_cursor(
         self, origin: tuple[int, int], pos: tuple[int, int], is_active: bool
@@ -219,33 +391,40 @@ class Game:
             )
 
     def draw(self):
-        overlay = np.zeros_like(self.md.frame)
-        overlay = cv2.cvtColor(
-            overlay, cv2.COLOR_BGR2RGB
-        )  # Convertir en BGRA pour la transparence
-        self.md.frame = cv2.flip(self.md.frame, 1)  # Flip horizontal pour effet miroir
+        # Flip horizontal pour effet miroir, dans le buffer de composition
+        with profiler.scope("mirror"):
+            self.md.frame = self.compositor.mirror(self.md.frame)
+        overlay_targets = []
 
         if self.game_over:
             left_score = self.scores.get("Right", 0)
             right_score = self.scores.get("Left", 0)
             text = "Left Won" if left_score > right_score else "Right Won"
-            cv2.putText(
+            if any(player_id not in ("Left", "Right") for player_id in self.scores):
+                winner = max(self.scores, key=self.scores.get)
+                text = f"{self.player_name(winner)[len('Player '):]} Won"
+            s = self.ui_scale
+            scale, thickness = 3 * s, max(round(6 * s), 1)
+            self.hud.draw_text(
                 self.md.frame,
                 text,
-                (100, 250),
+                self._centered_org(text, self.md.height * 250 // 480, scale, thickness),
                 cv2.FONT_HERSHEY_SIMPLEX,
-                3,
+                scale,
                 (30, 255, 30),
-                6,
+                thickness,
             )
-            cv2.putText(
+            scale, thickness = s, max(round(2 * s), 1)
+            self.hud.draw_text(
                 self.md.frame,
                 "Shoot to restart",
-                (180, 300),
+                self._centered_org(
+                    "Shoot to restart", self.md.height * 300 // 480, scale, thickness
+                ),
                 cv2.FONT_HERSHEY_SIMPLEX,
-                1,
+                scale,
                 (30, 255, 30),
-                2,
+                thickness,
             )
         else:
             # Afficher le panneau d'info
@@ -253,45 +432,75 @@ class Game:
             angles = (
                 list(self.md.player.values())[0].angle if player_count > 0 else None
             )
-            self.draw_info_panel(player_count, angles)
-            self.draw_scores()
+            with profiler.scope("draw_hud"):
+                self.draw_info_panel(player_count, angles)
+                self.draw_scores()
 
             for target in self.targets:
-                target.draw(overlay if target._draw_on_overlay else self.md.frame)
+                if target._draw_on_overlay:
+                    overlay_targets.append(target)  # Dessinés au-dessus de tout
+                else:
+                    with profiler.scope("draw_target"):
+                        target.draw(self.md.frame)
+            if self.swarm is not None:
+                with profiler.scope("draw_swarm"):
+                    self.swarm.draw(self.md.frame, GlobalData.alpha)
 
             # Dessiner les curseurs pour chaque main
             for i, player in self.md.player.items():
-                cursor = self.cursors.get(player.id)
-                if not cursor:
-                    cursor = Cursor(player.projected_pos, (0, 255, 0))
-                    self.cursors[player.id] = cursor
-
-                # On inverse les labels des mains car on est sur une caméra frontale
-                if player.id == "Left":
-                    cursor.label = f"Player Right"
-                else:
-                    cursor.label = f"Player Left"
-                cursor.draw(self.md.frame)
-
-        self.md.frame = cv2.add(overlay, self.md.frame)
+                cursor = self._get_cursor(player)
+
+                cursor.label = self.player_name(player.id)
+                cursor.scale = self.ui_scale
+                with profiler.scope("draw_cursor"):
+                    cursor.draw(self.md.frame)
+
+        # Les overlays sont additionnés à la frame, uniquement sur leur rectangle
+        for target in overlay_targets:
+            with profiler.scope("draw_target"):
+                with self.compositor.overlay(self.md.frame, target.bounds) as overlay:
+                    target.draw(overlay)
+
+    def _get_cursor(self, player: PlayerHand) -> Cursor:
+        cursor = self.cursors.get(player.id)
+        if not cursor:
+            cursor = Cursor(
+                player.projected_pos,
+                (0, 255, 0),
+                smoothing=CURSOR_FILTERS[self.cursor_filter](),
+            )
+            self.cursors[player.id] = cursor
+        return cursor
 
     def update(self, key: int = None):
         if key == ord("h"):
             self.toggle_help_panel()
+        # Instant auquel correspondent les positions des joueurs, pour que le
+        # filtre du curseur compense la latence de la capture et de l'inférence
+        timestamp = self.md.players_timestamp
+        latency = time.perf_counter() - timestamp if timestamp else 0.0
+        clicks = []
         for player_id, player in self.md.player.items():
-            cursor = self.cursors.get(player_id)
-            if not cursor:
-                cursor = Cursor(player.projected_pos, (0, 255, 0))
-                self.cursors[player_id] = cursor
-
-            cursor.update(player.projected_pos, player.pos, player.is_shooting)
-
-            self.handle_click(
-                player_id,
-                *cursor.pos,
-                self.cursors[player_id],
+            cursor = self._get_cursor(player)
+            cursor.update(
+                player.projected_pos,
+                player.pos,
+                player.is_shooting,
+                timestamp=timestamp or None,
+                latency=latency,
             )
+            if cursor.just_clicked:
+                clicks.append((player_id, *cursor.pos))
+
+        # Tous les tirs de la frame sont résolus ensemble
+        self.handle_clicks(clicks)
 
-        # Mettre à jour les targets
+    def tick(self, dt: float):
+        """Avance la simulation d'un pas fixe de `dt` secondes"""
+        if self.md.height != self._layout_height:
+            self._rescale_targets()
         for target in self.targets:
-            target.update(GlobalData.dt)
+            target.update(dt, self.md.width, self.md.height)
+        if self.swarm is not None:
+            self.swarm.update(dt, self.md.width, self.md.height)
+        self._sync_target_index()
@@ -1,27 +1,89 @@
 from dataclasses import dataclass
+from typing import ClassVar
+
+
+class Signal:
+    """Signal nommé et sa liste d'abonnés.
+
+    Récupéré une fois avec `GlobalData.signal(name)` puis gardé par l'émetteur:
+    `emit` appelle directement les abonnés, sans recherche par nom.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.handlers: list[callable] = []
+
+    def connect(self, callback: callable):
+        self.handlers.append(callback)
+
+    def emit(self, *args, **kwargs):
+        """Appelle les abonnés, ou met l'événement en file si GlobalData.deferred"""
+        if GlobalData.deferred:
+            GlobalData.queue(self, args, kwargs)
+            return
+        for callback in self.handlers:
+            callback(*args, **kwargs)
+
+    def dispatch(self, args: tuple, kwargs: dict):
+        for callback in self.handlers:
+            callback(*args, **kwargs)
 
 
 @dataclass
 class GlobalData:
     fps: float = 0.0
     dt: float = 0.0
+    # Fraction du tick de simulation écoulée au moment du rendu (interpolation)
+    alpha: float = 1.0
     running: bool = True
 
-    _signals: dict[str, list[callable]] = None
+    _signals: dict[str, Signal] = None
+
+    # Mode différé: les événements émis pendant l'update sont rangés dans une
+    # file préallouée, puis distribués ensemble par `flush` à un point fixe de
+    # la frame
+    deferred: bool = False
+    _queue: ClassVar[list] = [None] * 256
+    _queued: int = 0
 
     @classmethod
-    def emit(cls, signal_name: str, *args, **kwargs):
-        """Émet un signal à tous les abonnés"""
+    def signal(cls, signal_name: str) -> Signal:
+        """Retourne le signal `signal_name`, créé au premier appel"""
         if cls._signals is None:
             cls._signals = {}
-        for callback in cls._signals.get(signal_name, []):
-            callback(*args, **kwargs)
+        signal = cls._signals.get(signal_name)
+        if signal is None:
+            signal = cls._signals[signal_name] = Signal(signal_name)
+        return signal
+
+    @classmethod
+    def emit(cls, signal_name: str, *args, **kwargs):
+        """Émet un signal à tous les abonnés"""
+        cls.signal(signal_name).emit(*args, **kwargs)
 
     @classmethod
     def subscribe(cls, signal_name: str, callback: callable):
         """Abonne une fonction à un signal"""
-        if cls._signals is None:
-            cls._signals = {}
-        if signal_name not in cls._signals:
-            cls._signals[signal_name] = []
-        cls._signals[signal_name].append(callback)
+        cls.signal(signal_name).connect(callback)
+
+    @classmethod
+    def queue(cls, signal: Signal, args: tuple, kwargs: dict):
+        """Ajoute un événement à la file du mode différé"""
+        if cls._queued == len(cls._queue):
+            # Rare: la file double, elle ne rétrécit jamais
+            cls._queue.extend([None] * len(cls._queue))
+        cls._queue[cls._queued] = (signal, args, kwargs)
+        cls._queued += 1
+
+    @classmethod
+    def flush(cls):
+        """Distribue, dans l'ordre d'émission, les événements mis en file"""
+        queue = cls._queue
+        # Les événements émis pendant le flush sont distribués dans ce même flush
+        i = 0
+        while i < cls._queued:
+            signal, args, kwargs = queue[i]
+            queue[i] = None
+            signal.dispatch(args, kwargs)
+            i += 1
+        cls._queued = 0
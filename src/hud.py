@@ -0,0 +1,95 @@
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+import cv2
+import numpy as np
+
+from components.sprite_cache import Sprite
+
+
+class TileCanvas:
+    """Image BGRA sur laquelle on dessine avec les primitives OpenCV.
+
+    Chaque primitive est tracée à la fois sur la couleur et sur l'alpha.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.color = np.zeros((height, width, 3), dtype=np.uint8)
+        self.alpha = np.zeros((height, width), dtype=np.uint8)
+
+    def fill_rect(self, pt1, pt2, color: tuple, alpha: float = 1.0):
+        """Rectangle plein semi-transparent (pt1 et pt2 inclus)"""
+        cv2.rectangle(self.color, pt1, pt2, color, -1)
+        cv2.rectangle(self.alpha, pt1, pt2, int(round(alpha * 255)), -1)
+
+    def rectangle(self, pt1, pt2, color: tuple, thickness: int):
+        cv2.rectangle(self.color, pt1, pt2, color, thickness)
+        cv2.rectangle(self.alpha, pt1, pt2, 255, thickness)
+
+    def text(self, text: str, org, font: int, scale: float, color: tuple, thickness: int):
+        cv2.putText(self.color, text, org, font, scale, color, thickness)
+        cv2.putText(self.alpha, text, org, font, scale, 255, thickness)
+
+    def bgra(self) -> np.ndarray:
+        return np.dstack((self.color, self.alpha))
+
+
+def render_text(
+    text: str, org: tuple[int, int], font: int, scale: float, color: tuple, thickness: int
+) -> tuple[np.ndarray, int, int]:
+    """Rend un texte dans une tuile BGRA; retourne (tuile, x, y) où la poser
+    pour obtenir le même résultat que `cv2.putText(img, text, org, ...)`"""
+    (w, h), baseline = cv2.getTextSize(text, font, scale, thickness)
+    pad = thickness + 1
+    canvas = TileCanvas(w + 2 * pad, h + baseline + 2 * pad)
+    canvas.text(text, (pad, pad + h), font, scale, color, thickness)
+    return canvas.bgra(), org[0] - pad, org[1] - h - pad
+
+
+class HudLayer:
+    """Cache des éléments statiques du HUD.
+
+    Chaque élément est rendu une seule fois en tuile BGRA, identifiée par une
+    clé qui décrit son contenu (ex: les scores affichés); il suffit ensuite
+    d'un petit blit par frame. Une nouvelle clé invalide naturellement la
+    tuile précédente.
+    """
+
+    def __init__(self, max_tiles: int = 32):
+        self.max_tiles = max_tiles
+        self._tiles: OrderedDict[Hashable, tuple[Sprite, int, int]] = OrderedDict()
+
+    def draw(
+        self,
+        img: np.ndarray,
+        key: Hashable,
+        render: Callable[[], tuple[np.ndarray, int, int]],
+    ):
+        """Blitte la tuile `key`, rendue par `render()` -> (bgra, x, y) si absente"""
+        tile = self._tiles.get(key)
+        if tile is None:
+            bgra, x, y = render()
+            tile = (Sprite.from_bgra(bgra), x, y)
+            self._tiles[key] = tile
+            if len(self._tiles) > self.max_tiles:
+                self._tiles.popitem(last=False)
+        else:
+            self._tiles.move_to_end(key)
+        sprite, x, y = tile
+        sprite.blit(img, x, y)
+
+    def draw_text(
+        self,
+        img: np.ndarray,
+        text: str,
+        org: tuple[int, int],
+        font: int,
+        scale: float,
+        color: tuple,
+        thickness: int,
+    ):
+        """Équivalent mis en cache de `cv2.putText`"""
+        key = ("text", text, tuple(org), font, scale, tuple(color), thickness)
+        self.draw(
+            img, key, lambda: render_text(text, org, font, scale, color, thickness)
+        )
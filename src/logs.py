@@ -0,0 +1,51 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler qui dépose l'enregistrement tel quel.
+
+    `QueueHandler.prepare` formate le message dans le thread qui logge;
+    la file ne sort pas du processus, on laisse donc ce travail au
+    QueueListener. Les arguments du message sont lus à l'écriture: ne pas
+    logger un objet que l'on modifie juste après.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def start_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """Envoie les logs vers un thread d'écriture.
+
+    La boucle de jeu ne fait que déposer les enregistrements dans une file,
+    sans les formater; le formatage et l'écriture sur stderr se font dans le
+    thread du QueueListener, une rafale de messages ne bloque donc jamais
+    une frame.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+    records = queue.SimpleQueue()
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter("%(asctime)s %(name)s: %(message)s"))
+    _listener = logging.handlers.QueueListener(records, stream)
+
+    root = logging.getLogger()
+    root.addHandler(_DeferredQueueHandler(records))
+    root.setLevel(level)
+    _listener.start()
+    atexit.register(stop_logging)
+    return _listener
+
+
+def stop_logging():
+    """Écrit les messages en attente et arrête le thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
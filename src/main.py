@@ -1,47 +1,419 @@
+import argparse
+import logging
+import time
+
 import cv2
+import numpy as np
+from components.cursor_filter import CURSOR_FILTERS
 from global_data import GlobalData
+from logs import start_logging
+from profiler import profiler
 from model import Model
+from model.available_models import available_models
+from model.capture import CaptureSettings, parse_size
+from model.multi_camera import LaneModel, MultiCameraCapture
+from model.process_pool import ProcessPoolModel
+from model.replay import ReplayModel
+from model.selection import ModelSelector
 from game import Game
-import numpy as np
-import time
+from recorder import POLICIES, SessionRecorder
+from scheduler import FrameScheduler
+from startup import StartupLoader, draw_splash
+from stream import StreamServer
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Tire-au-canard duck shooting game")
+    parser.add_argument(
+        "--cameras",
+        metavar="SOURCES",
+        help="comma-separated camera indices (or video files) to play on together, "
+        "each captured and processed in its own process",
+    )
+    parser.add_argument(
+        "--rescan-cameras",
+        action="store_true",
+        help="probe the cameras again instead of using the cached list",
+    )
+    parser.add_argument(
+        "--capture-size",
+        type=parse_size,
+        metavar="WxH",
+        help="camera resolution to request, e.g. 1280x720 (default: the camera's)",
+    )
+    parser.add_argument(
+        "--mjpg",
+        action="store_true",
+        help="request MJPG frames from the camera, needed by many webcams for 720p/1080p at full rate",
+    )
+    parser.add_argument(
+        "--capture-buffer",
+        type=int,
+        default=1,
+        metavar="N",
+        help="frames buffered by the camera driver (default 1, always the newest frame)",
+    )
+    parser.add_argument(
+        "--inference-size",
+        type=parse_size,
+        default=(640, 480),
+        metavar="WxH",
+        help="downscale the frames to fit in WxH before hand inference (default 640x480); "
+        "the display keeps the capture resolution",
+    )
+    parser.add_argument(
+        "--sync-inference",
+        action="store_true",
+        help="run hand inference on the main thread (no pipelining)",
+    )
+    parser.add_argument(
+        "--queue-depth",
+        type=int,
+        default=1,
+        help="frames allowed to wait for inference in pipelined mode",
+    )
+    parser.add_argument(
+        "--model",
+        choices=["auto", "random"] + [m.__name__ for m in available_models],
+        default="auto",
+        help="hand model backend; auto benchmarks the available ones once and caches the choice",
+    )
+    parser.add_argument(
+        "--calibration-clip",
+        metavar="PATH",
+        help="video or image directory used to benchmark the models (default: the first camera frames)",
+    )
+    parser.add_argument(
+        "--target-fps",
+        type=float,
+        default=20,
+        help="inference speed a model must reach to be picked by --model auto",
+    )
+    parser.add_argument(
+        "--min-detection-rate",
+        type=float,
+        default=0.5,
+        help="share of calibration frames with hands a model must reach to be picked by --model auto",
+    )
+    parser.add_argument(
+        "--reselect-model",
+        action="store_true",
+        help="run the --model auto benchmark again instead of using the cached choice",
+    )
+    parser.add_argument(
+        "--inference-workers",
+        type=int,
+        default=0,
+        metavar="N",
+        help="run hand inference in a pool of N worker processes",
+    )
+    parser.add_argument(
+        "--roi-tracking",
+        action="store_true",
+        help="run hand inference on a crop around the previous hands",
+    )
+    parser.add_argument(
+        "--detection-interval",
+        type=int,
+        default=1,
+        metavar="N",
+        help="run hand inference every N frames and extrapolate the hands in between",
+    )
+    parser.add_argument(
+        "--inference-budget",
+        type=float,
+        metavar="MS",
+        help="also run inference on skipped frames while it takes less than MS milliseconds",
+    )
+    parser.add_argument(
+        "--cursor-filter",
+        choices=sorted(CURSOR_FILTERS),
+        default="exponential",
+        help="cursor smoothing; one_euro and kalman also compensate the pipeline latency",
+    )
+    parser.add_argument(
+        "--fps",
+        type=float,
+        default=30,
+        help="frame rate cap; the loop sleeps until the next frame (0 for no cap)",
+    )
+    parser.add_argument(
+        "--tick-rate",
+        type=float,
+        default=60,
+        help="game simulation steps per second, independent of the frame rate",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="time each stage of the frame and show the breakdown on screen",
+    )
+    parser.add_argument(
+        "--trace-out",
+        metavar="PATH",
+        help="profile the session and write a Chrome trace-event JSON to PATH on exit",
+    )
+    parser.add_argument(
+        "--csv-out",
+        metavar="PATH",
+        help="profile the session and write one CSV row per timed stage to PATH on exit",
+    )
+    parser.add_argument(
+        "--stats-interval",
+        type=float,
+        default=10.0,
+        metavar="SECONDS",
+        help="log the dropped frames (capture, inference, recording, stream) and the "
+        "recording queue depth every SECONDS (0 to disable)",
+    )
+    parser.add_argument(
+        "--swarm",
+        type=int,
+        default=0,
+        metavar="N",
+        help="add a swarm of N ducks to shoot at",
+    )
+    parser.add_argument(
+        "--duck-collisions",
+        action="store_true",
+        help="make the swarm ducks bounce off each other",
+    )
+    parser.add_argument(
+        "--stream-port",
+        type=int,
+        metavar="PORT",
+        help="stream the game as MJPEG to browsers on http://HOST:PORT/",
+    )
+    parser.add_argument(
+        "--stream-host",
+        default="127.0.0.1",
+        help="interface the stream listens on (default 127.0.0.1; 0.0.0.0 for the local network)",
+    )
+    parser.add_argument(
+        "--stream-fps",
+        type=float,
+        default=15,
+        help="frames per second sent to spectators at most",
+    )
+    parser.add_argument(
+        "--record-landmarks",
+        metavar="PATH",
+        help="record the detected hand landmarks to PATH",
+    )
+    parser.add_argument(
+        "--record-session",
+        metavar="PATH",
+        help="record the game video to PATH (e.g. session.mp4) on a background thread",
+    )
+    parser.add_argument(
+        "--record-raw",
+        action="store_true",
+        help="with --record-session, also record the camera frames to PATH with a .raw suffix",
+    )
+    parser.add_argument(
+        "--record-policy",
+        choices=POLICIES,
+        default="drop",
+        help="when the recording falls behind: drop frames (default) or make the game wait",
+    )
+    parser.add_argument(
+        "--record-queue",
+        type=int,
+        default=32,
+        metavar="N",
+        help="frames that may wait to be written by the session recorder",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="PATH",
+        help="replay hand landmarks recorded with --record-landmarks instead of running the model",
+    )
+    return parser.parse_args(argv)
+
+
+logger = logging.getLogger(__name__)
+
 
-#
+def build_game(args, loader: StartupLoader):
+    """Construit le Model et le Game (appelé sur le thread de démarrage)"""
+    source, model, lanes = 0, None, 1
+    if args.cameras:
+        # Une caméra par processus; le Model ne fait que fusionner leurs mains
+        sources = [int(s) if s.isdigit() else s for s in args.cameras.split(",")]
+        with loader.phase("cameras"):
+            source = MultiCameraCapture(sources)
+        model, lanes = LaneModel(source), len(sources)
+    elif args.replay:
+        model = ReplayModel(args.replay)
+    elif args.inference_workers > 0:
+        with loader.phase("workers"):
+            model = ProcessPoolModel(args.inference_workers, queue_depth=args.queue_depth)
+    imports = None
+    if model is None:
+        # mediapipe s'importe en parallèle de l'ouverture de la caméra
+        imports = loader.run_phase(
+            "import", lambda: [m.preload() for m in available_models if m.is_available()]
+        )
+    loader.phase_name = "camera and model"
+    md = Model(
+        source=source,
+        model=model,
+        pipelined=not args.sync_inference and lanes == 1,
+        queue_depth=args.queue_depth,
+        # Le recadrage tourne dans Model.infer, que le pool de processus contourne
+        roi_tracking=args.roi_tracking and lanes == 1 and not args.inference_workers,
+        detection_interval=args.detection_interval,
+        inference_budget=(
+            args.inference_budget / 1000 if args.inference_budget is not None else None
+        ),
+        max_players=2 * lanes,
+        rescan_cameras=args.rescan_cameras,
+        model_selection=args.model,
+        model_selector=ModelSelector(
+            min_fps=args.target_fps, min_detection_rate=args.min_detection_rate
+        ),
+        calibration_clip=args.calibration_clip,
+        reselect_model=args.reselect_model,
+        warmup=True,
+        capture_settings=CaptureSettings(
+            width=args.capture_size[0] if args.capture_size else None,
+            height=args.capture_size[1] if args.capture_size else None,
+            fourcc="MJPG" if args.mjpg else None,
+            buffer_size=args.capture_buffer,
+        ),
+        inference_size=args.inference_size,
+    )
+    if imports is not None:
+        imports.join()
+    for name, seconds in md.startup_timings.items():
+        loader.add_timing(name, seconds)
+    if args.record_landmarks:
+        md.start_recording(args.record_landmarks)
+    with loader.phase("game"):
+        gm = Game(
+            md,
+            cursor_filter=args.cursor_filter,
+            swarm_size=args.swarm,
+            swarm_collisions=args.duck_collisions,
+        )
+    return md, gm, lanes
 
-FPS = 30
 
+def log_frame_stats(md: Model, session: SessionRecorder | None, stream: StreamServer | None):
+    """Frames perdues depuis le lancement et file de l'enregistreur"""
+    parts = [f"capture dropped {md.dropped_frames}"]
+    if md.pipeline is not None:
+        parts.append(f"inference dropped {md.pipeline.dropped_frames}")
+    if session is not None:
+        parts.append(
+            f"recording queue {session.queue_depth} (max {session.max_queue_depth}), "
+            f"dropped {session.dropped_frames}"
+        )
+    if stream is not None:
+        parts.append(f"stream {stream.clients} clients, dropped {stream.dropped_frames}")
+    logger.info("Frames: %s", ", ".join(parts))
 
-def main():
-    md = Model()
-    gm = Game(md)
+
+def main(argv=None):
+    args = parse_args(argv)
+    start_logging()
+    if args.profile or args.trace_out or args.csv_out:
+        profiler.enable()
+    # Les événements de l'update sont distribués en bloc avant le rendu
+    GlobalData.deferred = True
     window_name = "Hand Gesture Recognition"
-    prev_time = time.time()
-    GlobalData.dt = 0
+    loader = StartupLoader(lambda loader: build_game(args, loader))
+
+    # La fenêtre s'ouvre tout de suite et affiche l'écran de chargement
     cv2.namedWindow(window_name, cv2.WINDOW_AUTOSIZE | cv2.WINDOW_GUI_NORMAL)
+    loader.add_timing("window", loader.elapsed)
+    splash_width, splash_height = args.capture_size or (640, 480)
+    splash = np.empty((splash_height, splash_width, 3), dtype=np.uint8)
+    quit_requested = False
+    while not loader.done:
+        draw_splash(splash, loader.phase_name, loader.elapsed)
+        cv2.imshow(window_name, splash)
+        if cv2.waitKey(30) & 0xFF == ord("q"):
+            quit_requested = True
+    md, gm, lanes = loader.result()
+    if quit_requested:
+        md.release()
+        cv2.destroyAllWindows()
+        return
 
-    while md.cap.isOpened() and GlobalData.running:
-        current_time = time.time()
-        GlobalData.dt = current_time - prev_time
-        GlobalData.fps = 1 / GlobalData.dt if GlobalData.dt > 0 else float("inf")
-        prev_time = current_time
+    stream = (
+        StreamServer(args.stream_port, args.stream_host, max_fps=args.stream_fps)
+        if args.stream_port is not None
+        else None
+    )
+    session = (
+        SessionRecorder(
+            args.record_session,
+            fps=args.fps or 30,
+            raw_path=SessionRecorder.raw_path_for(args.record_session) if args.record_raw else None,
+            queue_size=args.record_queue,
+            policy=args.record_policy,
+        )
+        if args.record_session
+        else None
+    )
+    scheduler = FrameScheduler(tick_rate=args.tick_rate, frame_cap=args.fps)
+    GlobalData.dt = 0
+    key = 0xFF
+    first_frame = True
+    next_stats = time.perf_counter() + args.stats_interval
 
+    while md.cap.isOpened() and GlobalData.running:
         frame = md.get_current_frame()
         if frame is None:
-            print("Ignoring empty camera frame.")
+            logger.info("Ignoring empty camera frame.")
             continue
 
+        ticks = scheduler.begin_frame()
+        GlobalData.dt = scheduler.frame_dt
+        GlobalData.fps = 1 / GlobalData.dt if GlobalData.dt > 0 else float("inf")
+
         md.process_active_players()
         md.process_frame(frame)
 
-        key = cv2.waitKey(1) & 0xFF
+        # Touche lue pendant l'attente de la frame précédente
         if key == ord("q") or gm.qt == 1:
             break
         # Change la capture video en appuyant sur tab
-        if key == ord("\t"):
+        if key == ord("\t") and lanes == 1:
             md.switch_camera()
 
-        gm.update(key)
-        gm.draw()
-        cv2.imshow(window_name, md.frame)
+        with profiler.scope("update"):
+            gm.update(key)
+        with profiler.scope("tick"):
+            for _ in range(ticks):
+                gm.tick(scheduler.tick)
+        GlobalData.alpha = scheduler.alpha
+        with profiler.scope("events"):
+            GlobalData.flush()
+        camera_frame = md.frame  # Avant le miroir et le dessin du jeu
+        with profiler.scope("draw"):
+            gm.draw()
+        if session is not None:
+            with profiler.scope("record"):
+                session.write(md.frame, camera_frame)
+        if args.profile:
+            profiler.draw_overlay(md.frame)
+        if stream is not None:
+            with profiler.scope("stream"):
+                stream.publish(md.frame)
+        with profiler.scope("imshow"):
+            cv2.imshow(window_name, md.frame)
+        with profiler.scope("wait"):
+            key = scheduler.pace(cv2.waitKey) & 0xFF
+        profiler.end_frame()
+        if first_frame:
+            first_frame = False
+            loader.add_timing("first_frame", loader.elapsed)
+            logger.info("Startup: %s", loader.report())
+        if args.stats_interval > 0 and time.perf_counter() >= next_stats:
+            next_stats = time.perf_counter() + args.stats_interval
+            log_frame_stats(md, session, stream)
 
         # Window closed manually
         try:
@@ -51,8 +423,16 @@ def main():
             # Handle the case where the window property cannot be retrieved (e.g., on Wayland)
             break
 
-    md.cap.release()
+    md.release()
+    if stream is not None:
+        stream.close()
+    if session is not None:
+        session.close()
     cv2.destroyAllWindows()
+    if args.trace_out:
+        profiler.export_chrome_trace(args.trace_out)
+    if args.csv_out:
+        profiler.export_csv(args.csv_out)
 
 
 if __name__ == "__main__":
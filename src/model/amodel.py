@@ -2,11 +2,18 @@ from dataclasses import dataclass
 from typing import List, Literal, Union
 
 import cv2
+import numpy as np
 
 
 class AModel:
     """Abstract base class for models that process video frames."""
 
+    # Index des labels dans `ArrayResults.handedness`
+    HANDEDNESS_LABELS = ("Left", "Right")
+    # False pour les modèles qui ignorent l'image (ex: ReplayModel): le
+    # benchmark "auto" ne les compare pas aux vrais détecteurs
+    uses_frames = True
+
     @dataclass
     class Landmark:
         x: float
@@ -44,6 +51,108 @@ class AModel:
         multi_hand_world_landmarks: List["AModel.HandLandmarks"]
         multi_handedness: List["AModel.Handedness"]
 
+    @dataclass
+    class ArrayResults:
+        """Array-backed version of `Results`, one row per detected hand.
+
+        - `landmarks`: (n_hands, 21, 3) float32 normalized image landmarks
+        - `world_landmarks`: (n_hands, 21, 3) float32 world landmarks in meters
+        - `handedness`: (n_hands,) int8 index into `AModel.HANDEDNESS_LABELS`
+        - `handedness_score`: (n_hands,) float32 classification score
+        - `lane`: optional (n_hands,) int8 camera lane of each hand, see
+          `MultiCameraCapture`
+        - `timestamps`: optional (n_hands,) float64 capture time of the frame
+          each hand was detected in, when the hands come from frames captured
+          at different times (one per camera lane)
+        """
+
+        landmarks: np.ndarray
+        world_landmarks: np.ndarray
+        handedness: np.ndarray
+        handedness_score: np.ndarray
+        lane: np.ndarray | None = None
+        timestamps: np.ndarray | None = None
+
+        @property
+        def n_hands(self) -> int:
+            return self.landmarks.shape[0]
+
+        @property
+        def labels(self) -> List[str]:
+            """Player ids: the handedness label, suffixed with the lane number
+            (from 1) when the hands come from several cameras"""
+            labels = [AModel.HANDEDNESS_LABELS[i] for i in self.handedness]
+            if self.lane is None:
+                return labels
+            return [f"{label} {lane + 1}" for label, lane in zip(labels, self.lane)]
+
+        @classmethod
+        def empty(cls) -> "AModel.ArrayResults":
+            return cls(
+                np.zeros((0, 21, 3), dtype=np.float32),
+                np.zeros((0, 21, 3), dtype=np.float32),
+                np.zeros(0, dtype=np.int8),
+                np.zeros(0, dtype=np.float32),
+            )
+
+        @classmethod
+        def from_results(cls, results) -> "AModel.ArrayResults":
+            """Convert MediaPipe output (or `AModel.Results`) into arrays.
+
+            Hands are only kept when both image and world landmarks are present.
+            """
+            if isinstance(results, cls):
+                return results
+            if not results.multi_hand_landmarks or not results.multi_hand_world_landmarks:
+                return cls.empty()
+            n_hands = min(
+                len(results.multi_hand_landmarks),
+                len(results.multi_hand_world_landmarks),
+                len(results.multi_handedness),
+            )
+            landmarks = np.array(
+                [
+                    [(lm.x, lm.y, lm.z) for lm in hand.landmark]
+                    for hand in results.multi_hand_landmarks[:n_hands]
+                ],
+                dtype=np.float32,
+            )
+            world_landmarks = np.array(
+                [
+                    [(lm.x, lm.y, lm.z) for lm in hand.landmark]
+                    for hand in results.multi_hand_world_landmarks[:n_hands]
+                ],
+                dtype=np.float32,
+            )
+            classifications = [
+                h.classification[0] for h in results.multi_handedness[:n_hands]
+            ]
+            handedness = np.array(
+                [AModel.HANDEDNESS_LABELS.index(c.label) for c in classifications],
+                dtype=np.int8,
+            )
+            handedness_score = np.array(
+                [c.score for c in classifications], dtype=np.float32
+            )
+            return cls(landmarks, world_landmarks, handedness, handedness_score)
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Whether the model can be picked automatically (e.g. its inputs exist)"""
+        return True
+
+    @classmethod
+    def preload(cls):
+        """Import the heavy dependencies of the model, e.g. on a startup thread"""
+
+    def warmup(self, width: int, height: int):
+        """Pay the lazy initialization of the model before the first real
+        frame of that size. Nothing to do by default: a model whose `process`
+        has side effects (e.g. ReplayModel advancing) must not run here."""
+
     def process(self, frame: cv2.typing.MatLike) -> Results:
         """Process a frame and return the processed frame."""
         raise NotImplementedError("Subclasses must implement this method.")
+
+    def close(self):
+        """Release the resources held by the model (threads, processes, files)"""
@@ -1,7 +1,9 @@
 from typing import List
 
 from .default import DefaultModel
+from .replay import ReplayModel
 from .amodel import AModel
 
 # List of available models. Add your model class to this list when you create it.
-available_models: List[AModel] = [DefaultModel]
+# Models whose `is_available()` is False are skipped when picking one at startup.
+available_models: List[AModel] = [DefaultModel, ReplayModel]
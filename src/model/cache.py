@@ -0,0 +1,9 @@
+import os
+
+
+def cache_dir() -> str:
+    """Directory for data kept between launches (created on demand)"""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    path = os.path.join(base, "tire-au-canard")
+    os.makedirs(path, exist_ok=True)
+    return path
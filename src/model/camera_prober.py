@@ -0,0 +1,185 @@
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Callable
+
+import cv2
+
+from .cache import cache_dir
+
+logger = logging.getLogger(__name__)
+
+
+class CameraProber:
+    """Finds the working cameras in the background and keeps the next one open.
+
+    The camera indices that deliver frames, with the resolutions they accept,
+    are probed once on a background thread and cached on disk, so later
+    launches skip the probe. The camera that `switch_camera` would move to
+    next is opened ahead of time, so switching is a swap instead of a
+    blocking open.
+    """
+
+    RESOLUTIONS = ((640, 480), (1280, 720), (1920, 1080))
+
+    @dataclass
+    class Camera:
+        index: int
+        resolutions: list[tuple[int, int]] = field(default_factory=list)
+
+    def __init__(
+        self,
+        open_camera: Callable[[int], object],
+        current: int = 0,
+        max_index: int = 8,
+        cache_path: str | None = None,
+        rescan: bool = False,
+        capture_factory: Callable[[int], object] = cv2.VideoCapture,
+    ):
+        """
+        Args:
+            open_camera: Opens the capture used by the game for an index
+            current (int): Index of the camera already open (not probed again)
+            max_index (int): Indices 0..max_index-1 are probed
+            cache_path (str | None): JSON cache, default in the user cache dir
+            rescan (bool): Ignore the cache and probe again
+            capture_factory: Opens a bare capture for probing
+        """
+        self.open_camera = open_camera
+        self.max_index = max_index
+        self.cache_path = cache_path or os.path.join(cache_dir(), "cameras.json")
+        self.capture_factory = capture_factory
+        self.cameras: list[CameraProber.Camera] = []
+        self.ready = threading.Event()
+
+        self._lock = threading.Lock()
+        self._warm: tuple[int, object] | None = None  # (index, capture)
+        self._warming = False
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, args=(current, rescan), name="camera-prober", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, current: int, rescan: bool):
+        cameras = None if rescan else self._load_cache()
+        if cameras is None:
+            cameras = self._probe(current)
+            self._save_cache(cameras)
+        self.cameras = cameras
+        with self._lock:
+            self._warming = True  # Avant ready: warm_next ne lance rien en parallèle
+        self.ready.set()
+        logger.info("Cameras: %s", [c.index for c in cameras])
+        self._warm_after(current)
+
+    def _probe(self, current: int) -> list["CameraProber.Camera"]:
+        cameras = []
+        for index in range(self.max_index):
+            if self._closed:
+                break
+            if index == current:
+                # Déjà ouverte par le jeu: une seconde ouverture échouerait souvent
+                cameras.append(CameraProber.Camera(index))
+                continue
+            cap = self.capture_factory(index)
+            try:
+                if not cap.isOpened() or not cap.read()[0]:
+                    continue
+                camera = CameraProber.Camera(index)
+                for width, height in self.RESOLUTIONS:
+                    cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+                    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+                    actual = (
+                        int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                        int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                    )
+                    if actual not in camera.resolutions:
+                        camera.resolutions.append(actual)
+                cameras.append(camera)
+            finally:
+                cap.release()
+        return cameras
+
+    def _load_cache(self) -> list["CameraProber.Camera"] | None:
+        try:
+            with open(self.cache_path) as f:
+                data = json.load(f)
+            return [
+                CameraProber.Camera(c["index"], [tuple(r) for r in c["resolutions"]])
+                for c in data["cameras"]
+            ]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save_cache(self, cameras: list["CameraProber.Camera"]):
+        try:
+            with open(self.cache_path, "w") as f:
+                json.dump({"cameras": [asdict(c) for c in cameras]}, f)
+        except OSError as e:
+            logger.warning("Cannot write the camera cache %s: %s", self.cache_path, e)
+
+    def next_index(self, current: int) -> int | None:
+        """Index of the working camera after `current`, None if unknown or alone"""
+        indices = [c.index for c in self.cameras if c.index != current]
+        if not indices:
+            return None
+        later = [i for i in indices if i > current]
+        return min(later) if later else min(indices)
+
+    def warm_next(self, current: int):
+        """Open the camera after `current` in the background"""
+        if not self.ready.is_set():
+            return  # Fait à la fin du probe
+        with self._lock:
+            if self._warming:
+                return
+            self._warming = True
+        threading.Thread(
+            target=self._warm_after, args=(current,), name="camera-warm", daemon=True
+        ).start()
+
+    def _warm_after(self, current: int):
+        """Open the camera after `current`; `_warming` is already set"""
+        try:
+            index = self.next_index(current)
+            with self._lock:
+                if index is None or (self._warm is not None and self._warm[0] == index):
+                    return
+            cap = self.open_camera(index)
+            if not cap.isOpened():
+                # Débranchée depuis le probe: on l'oublie
+                cap.release()
+                self.cameras = [c for c in self.cameras if c.index != index]
+                self._save_cache(self.cameras)
+                logger.warning("Camera %d is no longer available", index)
+                return
+            with self._lock:
+                previous, self._warm = self._warm, (index, cap)
+                closed = self._closed
+            if previous is not None:
+                previous[1].release()
+            if closed:
+                self.close()
+        finally:
+            with self._lock:
+                self._warming = False
+
+    def take_next(self, current: int) -> tuple[int, object] | None:
+        """Return `(index, capture)` of the warm camera after `current`, or
+        None if it is not open yet"""
+        with self._lock:
+            warm = self._warm
+            if warm is None or warm[0] != self.next_index(current):
+                return None
+            self._warm = None
+            return warm
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            warm, self._warm = self._warm, None
+        if warm is not None:
+            warm[1].release()
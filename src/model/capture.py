@@ -0,0 +1,266 @@
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+
+def parse_size(text: str) -> tuple[int, int]:
+    """Parse a "WIDTHxHEIGHT" size, e.g. "1280x720" """
+    width, _, height = text.lower().partition("x")
+    size = int(width), int(height)
+    if min(size) <= 0:
+        raise ValueError(f"Invalid size {text!r}")
+    return size
+
+
+@dataclass
+class CaptureSettings:
+    """Camera properties requested when a camera is opened (None: driver default)"""
+
+    width: int | None = None
+    height: int | None = None
+    # "MJPG": images compressées par la caméra, souvent nécessaire pour du
+    # 720p/1080p à 30 FPS sur les webcams USB
+    fourcc: str | None = None
+    # Images gardées dans le buffer du driver; 1 pour toujours lire la plus récente
+    buffer_size: int | None = 1
+
+    def apply(self, cap):
+        # Le format avant la résolution: certains drivers (V4L2) en dépendent
+        if self.fourcc:
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.fourcc))
+        if self.width:
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        if self.height:
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        if self.buffer_size:
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, self.buffer_size)
+
+
+class FramePool:
+    """Reusable frame buffers of a single shape.
+
+    `acquire` hands out a free buffer, allocating one only when none is
+    free, and consumers give it back with `release` once they are done with
+    it (from any thread). Buffers of an outdated shape are dropped.
+    """
+
+    def __init__(self, shape: tuple[int, ...] | None = None, dtype=np.uint8):
+        self.shape = shape
+        self.dtype = dtype
+        self.allocated = 0
+        self._free: list[np.ndarray] = []
+        self._lock = threading.Lock()
+
+    def reshape(self, shape: tuple[int, ...]):
+        with self._lock:
+            if shape != self.shape:
+                self.shape = shape
+                self._free.clear()
+
+    def acquire(self) -> np.ndarray:
+        with self._lock:
+            if self._free:
+                return self._free.pop()
+            self.allocated += 1
+            return np.empty(self.shape, dtype=self.dtype)
+
+    def release(self, buffer: np.ndarray | None):
+        if buffer is None:
+            return  # Pas d'image (modèle qui ignore les frames)
+        with self._lock:
+            if buffer.shape == self.shape and buffer.dtype == self.dtype:
+                self._free.append(buffer)
+
+
+class ThreadedCapture:
+    """Camera reader running on its own thread.
+
+    Frames are grabbed into a small preallocated ring of slots so the game
+    always gets the newest frame instead of whatever is buffered in the
+    driver. Frames that are overwritten before the game reads them are
+    counted in `dropped_frames`.
+
+    Exposes the subset of the `cv2.VideoCapture` interface used by the game
+    (`isOpened`, `read`, `release`, `get`, `set`).
+    """
+
+    def __init__(
+        self,
+        index: int = 0,
+        slots: int = 3,
+        timeout: float = 1.0,
+        settings: CaptureSettings | None = None,
+    ):
+        # Il faut au moins 3 slots: un pour le lecteur, un pour la dernière
+        # frame publiée et un dans lequel le thread de capture écrit.
+        if slots < 3:
+            raise ValueError("ThreadedCapture needs at least 3 slots")
+        self.index = index
+        self.timeout = timeout
+        self.cap = cv2.VideoCapture(index)
+        if settings is not None and self.cap.isOpened():
+            settings.apply(self.cap)
+
+        self._slots: list[np.ndarray | None] = [None] * slots
+        self._timestamps = np.zeros(slots, dtype=np.float64)
+        self._latest = -1  # Slot de la dernière frame publiée
+        self._reading = -1  # Slot actuellement prêté au lecteur
+        self._seq = 0  # Numéro de la dernière frame publiée
+        self._read_seq = 0  # Numéro de la dernière frame lue
+        self._cond = threading.Condition()
+
+        self.timestamp = 0.0
+        self.dropped_frames = 0
+        self.frame_count = 0
+
+        self._running = self.cap.isOpened()
+        self._thread = threading.Thread(
+            target=self._run, name=f"capture-{index}", daemon=True
+        )
+        if self._running:
+            self._thread.start()
+
+    def isOpened(self) -> bool:
+        return self._running and self.cap.isOpened()
+
+    def get(self, prop_id: int) -> float:
+        return self.cap.get(prop_id)
+
+    def set(self, prop_id: int, value: float) -> bool:
+        return self.cap.set(prop_id, value)
+
+    def _free_slot(self) -> int:
+        for i in range(len(self._slots)):
+            if i != self._latest and i != self._reading:
+                return i
+        raise RuntimeError("No free capture slot")  # impossible avec >= 3 slots
+
+    def _run(self):
+        while self._running:
+            with self._cond:
+                slot = self._free_slot()
+            # `read` réutilise le buffer fourni si la taille correspond
+            success, frame = self.cap.read(self._slots[slot])
+            timestamp = time.perf_counter()
+            if not success:
+                with self._cond:
+                    self._running = False
+                    self._cond.notify_all()
+                break
+
+            with self._cond:
+                self._slots[slot] = frame
+                self._timestamps[slot] = timestamp
+                if self._seq > self._read_seq:
+                    # La frame précédente n'a jamais été lue
+                    self.dropped_frames += 1
+                self._latest = slot
+                self._seq += 1
+                self.frame_count += 1
+                self._cond.notify_all()
+
+    def read(self, wait: bool = True):
+        """Return `(success, frame)` with the newest frame.
+
+        The returned array stays valid until the next call to `read`. If
+        `wait` is True, block until a frame newer than the last one read is
+        available (or `timeout` expires).
+        """
+        with self._cond:
+            if wait:
+                self._cond.wait_for(
+                    lambda: self._seq > self._read_seq or not self._running,
+                    self.timeout,
+                )
+            if self._seq == self._read_seq:
+                return False, None
+            self._reading = self._latest
+            self._read_seq = self._seq
+            self.timestamp = float(self._timestamps[self._reading])
+            return True, self._slots[self._reading]
+
+    def release(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.timeout)
+        self.cap.release()
+
+
+class ImageDirectoryCapture:
+    """Reads the images of a directory, in name order, like a video file."""
+
+    EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.files = sorted(
+            os.path.join(path, name)
+            for name in os.listdir(path)
+            if name.lower().endswith(self.EXTENSIONS)
+        )
+        self._index = 0
+        self.timestamp = 0.0
+
+    def isOpened(self) -> bool:
+        return self._index < len(self.files)
+
+    def get(self, prop_id: int) -> float:
+        if prop_id == cv2.CAP_PROP_FRAME_COUNT:
+            return float(len(self.files))
+        return 0.0
+
+    def set(self, prop_id: int, value: float) -> bool:
+        return False
+
+    def read(self):
+        while self._index < len(self.files):
+            frame = cv2.imread(self.files[self._index], cv2.IMREAD_COLOR)
+            self._index += 1
+            if frame is not None:
+                self.timestamp = time.perf_counter()
+                return True, frame
+        return False, None
+
+    def release(self):
+        self._index = len(self.files)
+
+
+class BlankCapture:
+    """Produces `frames` black frames, for running the game without any input."""
+
+    def __init__(self, frames: int, width: int = 640, height: int = 480):
+        self.frames = frames
+        self.timestamp = 0.0
+        self._frame = np.zeros((height, width, 3), dtype=np.uint8)
+        self._index = 0
+
+    def isOpened(self) -> bool:
+        return self._index < self.frames
+
+    def get(self, prop_id: int) -> float:
+        if prop_id == cv2.CAP_PROP_FRAME_COUNT:
+            return float(self.frames)
+        if prop_id == cv2.CAP_PROP_FRAME_WIDTH:
+            return float(self._frame.shape[1])
+        if prop_id == cv2.CAP_PROP_FRAME_HEIGHT:
+            return float(self._frame.shape[0])
+        return 0.0
+
+    def set(self, prop_id: int, value: float) -> bool:
+        return False
+
+    def read(self):
+        if self._index >= self.frames:
+            return False, None
+        self._index += 1
+        self.timestamp = time.perf_counter()
+        return True, self._frame
+
+    def release(self):
+        self._index = self.frames
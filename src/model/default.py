@@ -1,11 +1,23 @@
+import numpy as np
+
 from .amodel import AModel
-from mediapipe.python.solutions import hands
 
 
 class DefaultModel(AModel):
     def __init__(self):
         super().__init__()
+        # Import paresseux: mediapipe met plusieurs secondes à se charger
+        from mediapipe.python.solutions import hands
+
         self.hands: AModel = hands.Hands(max_num_hands=2, min_detection_confidence=0.8)
 
+    @classmethod
+    def preload(cls):
+        from mediapipe.python.solutions import hands  # noqa: F401
+
+    def warmup(self, width: int, height: int):
+        # Le premier appel initialise le graphe MediaPipe
+        self.hands.process(np.zeros((height, width, 3), dtype=np.uint8))
+
     def process(self, frame):
         return self.hands.process(frame)
@@ -0,0 +1,106 @@
+"""Hand kinematics computed on every detected hand at once.
+
+All functions take landmark blocks shaped (n_hands, 21, 3), as stored in
+`AModel.ArrayResults`, and return one row per hand.
+"""
+
+import numpy as np
+
+WRIST = 0
+THUMB_MCP = 2
+THUMB_IP = 3
+THUMB_TIP = 4
+INDEX_MCP = 5
+INDEX_PIP = 6
+INDEX_TIP = 8
+PINKY_MCP = 17
+
+
+def _normalize(v: np.ndarray) -> np.ndarray:
+    return v / np.linalg.norm(v, axis=-1, keepdims=True)
+
+
+def hand_angles(world_landmarks: np.ndarray) -> np.ndarray:
+    """Return (n_hands, 3) Euler angles in degrees: pitch, roll, yaw.
+
+    The hand frame is built from the wrist and the index/pinky MCP joints.
+    """
+    wrist = world_landmarks[:, WRIST].astype(np.float64)
+    index_mcp = world_landmarks[:, INDEX_MCP].astype(np.float64)
+    pinky_mcp = world_landmarks[:, PINKY_MCP].astype(np.float64)
+
+    axe_y = _normalize((index_mcp + pinky_mcp) / 2 - wrist)
+    axe_x = _normalize(pinky_mcp - index_mcp)
+    axe_z = _normalize(np.cross(axe_x, axe_y))
+
+    angles = np.empty((world_landmarks.shape[0], 3), dtype=np.float64)
+    angles[:, 0] = np.arctan2(-axe_y[:, 2], axe_y[:, 1])
+    angles[:, 1] = np.arctan2(axe_x[:, 1], axe_x[:, 0])
+    angles[:, 2] = np.arctan2(axe_z[:, 0], axe_z[:, 2])
+    return np.degrees(angles, out=angles)
+
+
+def screen_positions(landmarks: np.ndarray, width: int, height: int) -> np.ndarray:
+    """Return (n_hands, 2) mirrored pixel positions of the index tip."""
+    tip = landmarks[:, INDEX_TIP].astype(np.float64)
+    pos = np.empty((landmarks.shape[0], 2), dtype=np.float64)
+    pos[:, 0] = (1 - tip[:, 0]) * width
+    pos[:, 1] = tip[:, 1] * height
+    return np.trunc(pos).astype(np.int32)
+
+
+def thumb_index_distance(world_landmarks: np.ndarray) -> np.ndarray:
+    """Return (n_hands,) 3D distance in meters between thumb tip and index base."""
+    return np.linalg.norm(
+        world_landmarks[:, THUMB_TIP].astype(np.float64)
+        - world_landmarks[:, INDEX_MCP],
+        axis=-1,
+    )
+
+
+def projected_positions(
+    landmarks: np.ndarray,
+    width: int,
+    height: int,
+    forward_m: float = 0.5,
+    finger_length_m: float = 0.4,
+) -> np.ndarray:
+    """Return (n_hands, 2) mirrored pixel positions pointed at by each index.
+
+    The index direction (MCP -> tip) in image space is extended by
+    `forward_m` meters, converting meters to pixels by assuming the finger is
+    always `finger_length_m` long. Hands whose MCP and tip project to the
+    same pixel point at their fingertip.
+    """
+    scale = np.array([width, height], dtype=np.float64)
+    px_mcp = np.trunc(landmarks[:, INDEX_MCP, :2] * scale)
+    px_tip = np.trunc(landmarks[:, INDEX_TIP, :2] * scale)
+
+    v_img = px_tip - px_mcp
+    img_norm = np.linalg.norm(v_img, axis=-1, keepdims=True)
+    # pixels_per_meter * forward_m / img_norm, le img_norm se simplifie
+    gain = forward_m / finger_length_m
+    proj = np.where(img_norm > 1e-6, px_tip + v_img * gain, px_tip)
+
+    # Flip x coordinate for mirror effect
+    proj[:, 0] = width - proj[:, 0]
+    return np.trunc(proj).astype(np.int32)
+
+
+def thumb_bent(landmarks: np.ndarray, threshold_deg: float = 40.0) -> np.ndarray:
+    """Return (n_hands,) booleans telling whether each thumb is bent.
+
+    A thumb is bent when its tip is below the index PIP joint in the image,
+    or when the angle between its two last segments exceeds `threshold_deg`.
+    """
+    lms = landmarks.astype(np.float64)
+    below_index = lms[:, THUMB_TIP, 1] > lms[:, INDEX_PIP, 1]
+
+    v23 = lms[:, THUMB_IP] - lms[:, THUMB_MCP]
+    v34 = lms[:, THUMB_TIP] - lms[:, THUMB_IP]
+    norms = np.linalg.norm(v23, axis=-1) * np.linalg.norm(v34, axis=-1)
+    valid = norms > 0
+    cosang = np.einsum("ij,ij->i", v23, v34) / np.where(valid, norms, 1.0)
+    # Angle entre les deux segments = écart à un pouce tendu
+    bend_deg = np.degrees(np.arccos(np.clip(cosang, -1.0, 1.0)))
+    return below_index | (valid & (bend_deg > threshold_deg))
@@ -1,46 +1,241 @@
-from typing import List
+import logging
+import os
+import threading
+import time
 
-import numpy as np
 import cv2
-from mediapipe.python.solutions import hands
+import numpy as np
 from random import choice
 
+from . import kinematics
 from .amodel import AModel
 from .available_models import available_models
+from .camera_prober import CameraProber
+from .capture import CaptureSettings, FramePool, ImageDirectoryCapture, ThreadedCapture
+from .pipeline import InferencePipeline
+from .process_pool import ProcessPoolModel
+from .recording import LandmarkRecorder
+from .roi import RoiTracker
+from .selection import ModelSelector
 from components import PlayerHand
+from profiler import profiler
+
+logger = logging.getLogger(__name__)
 
 
 class Model:
-    def __init__(self):
-        # self.hands: AModel = hands.Hands(max_num_hands=2, min_detection_confidence=0.8)
-        self.hands: AModel = choice(available_models)()
-        self._current_camera_index = 0
-        self.cap = cv2.VideoCapture(self._current_camera_index)
+    def __init__(
+        self,
+        source: int | str = 0,
+        model: AModel | None = None,
+        threaded_capture: bool = True,
+        pipelined: bool = False,
+        queue_depth: int = 1,
+        roi_tracking: bool = False,
+        detection_interval: int = 1,
+        inference_budget: float | None = None,
+        max_players: int = 2,
+        probe_cameras: bool = True,
+        rescan_cameras: bool = False,
+        model_selection: str = "random",
+        model_selector: ModelSelector | None = None,
+        calibration_clip: str | None = None,
+        reselect_model: bool = False,
+        warmup: bool = False,
+        capture_settings: CaptureSettings | None = None,
+        inference_size: tuple[int, int] | None = None,
+    ):
+        """
+        Args:
+            source (int | str): Camera index, video file, image directory or an
+                already opened capture object
+            model (AModel | None): Model instance to use instead of picking one
+                from `available_models`
+            threaded_capture (bool): Read the camera on a background thread
+            pipelined (bool): Run inference on a worker thread; the game then
+                uses the latest finished results instead of waiting for them
+            queue_depth (int): Number of frames that may wait for inference
+                in pipelined mode
+            roi_tracking (bool): Run the model on a crop around the hands of
+                the previous frame, with periodic full-frame detections
+            detection_interval (int): Run inference every N frames; in between
+                the hands are extrapolated from their recent motion
+            inference_budget (float | None): Also run inference on skipped
+                frames while the average inference time (seconds) fits in it
+            max_players (int): Hands tracked at most, extra hands are ignored
+            probe_cameras (bool): For camera indices, list the working cameras
+                in the background and keep the next one open so
+                `switch_camera` does not block
+            rescan_cameras (bool): Ignore the cached camera list
+            model_selection (str): How to pick the model when `model` is None:
+                "random", "auto" (benchmark the available models, see
+                `ModelSelector`) or the class name of a model
+            model_selector (ModelSelector | None): Candidates and targets used
+                by "auto"
+            calibration_clip (str | None): Video or image directory used by
+                "auto"; defaults to the first frames of the source
+            reselect_model (bool): Run the "auto" benchmark even if a
+                decision is cached
+            warmup (bool): Warm the model up (see `AModel.warmup`) so the
+                first real inference does not pay for its lazy initialization
+            capture_settings (CaptureSettings | None): Resolution, format and
+                buffer size requested from the cameras
+            inference_size (tuple[int, int] | None): `(width, height)` box the
+                frames are downscaled into (keeping their aspect ratio) before
+                inference; the display keeps the full capture resolution
+        """
+        # Durée (secondes) des étapes de l'initialisation, pour suivre le démarrage
+        self.startup_timings: dict[str, float] = {}
+        self.threaded_capture = threaded_capture
+        self.capture_settings = capture_settings
+        self.inference_size = inference_size
+        # Images RGB réduites données au modèle, réutilisées d'une frame à l'autre
+        self.frame_pool = FramePool()
+        self._current_camera_index = source if isinstance(source, int) else 0
+        start = time.perf_counter()
+        self.cap = self._open_camera(source)
+        self.startup_timings["camera"] = time.perf_counter() - start
+        # Taille d'affichage, mise à jour à chaque frame; connue avant la
+        # première pour placer les éléments du jeu
+        self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or 640
+        self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or 480
+
+        start = time.perf_counter()
+        if model is None:
+            model = self._select_model(
+                source, model_selection, model_selector, calibration_clip, reselect_model
+            )()
+        self.hands: AModel = model
+        self.startup_timings["model"] = time.perf_counter() - start
+        if warmup:
+            start = time.perf_counter()
+            self.hands.warmup(*self.inference_shape(self.width, self.height))
+            self.startup_timings["warmup"] = time.perf_counter() - start
+        self.camera_prober = (
+            CameraProber(
+                self._open_camera,
+                current=self._current_camera_index,
+                rescan=rescan_cameras,
+            )
+            if probe_cameras and isinstance(source, int)
+            else None
+        )
         self.frame = None
+        self.frame_timestamp = 0.0
+        self.frame_id = 0
+        # Frame dont sont issus les derniers résultats utilisés
+        self.results_frame_id = 0
+        self.results_timestamp = 0.0
+        # Instant auquel correspondent les positions des joueurs (résultats ou extrapolation)
+        self.players_timestamp = 0.0
+        self.recorder: LandmarkRecorder | None = None
+        self.roi_tracker = RoiTracker() if roi_tracking else None
+        self.detection_interval = max(detection_interval, 1)
+        self.inference_budget = inference_budget
+        self.interpolate = detection_interval > 1 or inference_budget is not None
+        self.inference_time = 0.0  # Moyenne des temps d'inférence (secondes)
+        self._frames_since_inference = self.detection_interval  # Inférer dès la 1re frame
+        self._results_applied = False
+        self.pipeline = None
+        if pipelined:
+            # Le pool de processus fait lui-même office de pipeline, avec
+            # plusieurs frames en cours
+            if isinstance(self.hands, ProcessPoolModel):
+                self.pipeline = self.hands
+            else:
+                self.pipeline = InferencePipeline(
+                    self.infer, queue_depth, release=self.frame_pool.release
+                )
         self.player: dict[int, PlayerHand] = {}
-        self.height = 480
-        self.width = 640
+        self.max_players = max_players
+
+    def _select_model(
+        self,
+        source,
+        selection: str,
+        selector: ModelSelector | None,
+        calibration_clip: str | None,
+        reselect: bool,
+    ) -> type[AModel]:
+        if selection == "random":
+            return choice([m for m in available_models if m.is_available()])
+        if selection != "auto":
+            for m in available_models:
+                if m.__name__.lower() == selection.lower():
+                    return m
+            raise ValueError(
+                f"Unknown model {selection!r}, expected one of "
+                f"{[m.__name__ for m in available_models]}"
+            )
+
+        if selector is None:
+            selector = ModelSelector()
+        if calibration_clip:
+            stat = os.stat(calibration_clip)
+            key = f"clip:{os.path.abspath(calibration_clip)}:{stat.st_size}:{int(stat.st_mtime)}"
+            return selector.select(calibration_clip, key, use_cache=not reselect)
+        # Premières frames de la source (caméra en direct)
+        key = f"source:{source}" if isinstance(source, (int, str)) else "source"
+        return selector.select(self.cap, key, use_cache=not reselect)
+
+    def _open_camera(self, index):
+        if hasattr(index, "read"):
+            return index  # Objet de capture déjà construit (ex: BlankCapture)
+        if isinstance(index, str) and os.path.isdir(index):
+            return ImageDirectoryCapture(index)
+        if self.threaded_capture:
+            return ThreadedCapture(index, settings=self.capture_settings)
+        cap = cv2.VideoCapture(index)
+        if self.capture_settings is not None and cap.isOpened():
+            self.capture_settings.apply(cap)
+        return cap
+
+    @property
+    def dropped_frames(self) -> int:
+        """Number of camera frames overwritten before the game could use them"""
+        return getattr(self.cap, "dropped_frames", 0)
 
     def switch_camera(self):
-        """Switch to a different camera by index. If index is -1, switch to the next available camera."""
+        """Switch to the next working camera.
+
+        With the camera prober, the next camera is already open: it is swapped
+        in and the previous one is released on a background thread. If it is
+        not ready yet the switch is skipped instead of blocking the game.
+        """
+        if self.camera_prober is not None:
+            warm = self.camera_prober.take_next(self._current_camera_index)
+            if warm is None:
+                logger.info("No other camera ready yet")
+                return
+            previous = self.cap
+            self._current_camera_index, self.cap = warm
+            threading.Thread(target=previous.release, name="camera-release", daemon=True).start()
+            logger.info("Switched to camera %d", self._current_camera_index)
+            self.camera_prober.warm_next(self._current_camera_index)
+            return
+
         if self.cap.isOpened():
             self.cap.release()
         self.cap.release()
         index = self._current_camera_index + 1
-        self.cap = cv2.VideoCapture(index)
+        self.cap = self._open_camera(index)
         if self.cap.isOpened():
             self._current_camera_index = index
-            print(f"Switched to camera {index}")
+            logger.info("Switched to camera %d", index)
         else:
-            print(f"Failed to switch to camera {index}. Reverting to previous camera.")
+            logger.warning(
+                "Failed to switch to camera %d. Reverting to previous camera.", index
+            )
             index = 0
-            self.cap = cv2.VideoCapture(0)
+            self.cap = self._open_camera(0)
         self._current_camera_index = index
 
     def get_current_frame(self):
-        success, frame = self.cap.read()
+        with profiler.scope("capture"):
+            success, frame = self.cap.read()
         if not success:
             return None
+        self.frame_timestamp = getattr(self.cap, "timestamp", None) or time.perf_counter()
 
         # Utiliser les dimensions de la frame capturée
         height, width = frame.shape[:2]
@@ -48,244 +243,247 @@ class Model:
         return frame
 
     def process_active_players(self):
+        # Les joueurs ne vieillissent qu'à chaque nouveau résultat d'inférence,
+        # pour ne pas disparaître entre deux inférences espacées
+        if not self._results_applied:
+            return
+        self._results_applied = False
         # Remove players that haven't been detected for a while
         for player in list(self.player.values()):
             player.update()
             if not player.is_active:
                 self.player.pop(player.id, None)
 
-    def process_frame(self, frame: cv2.typing.MatLike):
+    @property
+    def latency(self) -> float:
+        """Seconds between the capture of the frame behind the current results and now"""
+        if not self.results_timestamp:
+            return 0.0
+        return time.perf_counter() - self.results_timestamp
+
+    def start_recording(self, path: str):
+        """Record the results of every processed frame to `path` (see recording.py)"""
+        self.stop_recording()
+        self.recorder = LandmarkRecorder(path)
+
+    def stop_recording(self):
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    def release(self):
+        if self.pipeline is not None:
+            self.pipeline.close()
+        self.stop_recording()
+        if self.camera_prober is not None:
+            self.camera_prober.close()
+        self.hands.close()
+        self.cap.release()
+
+    def infer(self, frame_rgb: cv2.typing.MatLike) -> AModel.ArrayResults:
+        """Run the model on an RGB frame and return array-backed results"""
+        if self.roi_tracker is None or not self.hands.uses_frames:
+            return self._process(frame_rgb)
+
+        height, width = frame_rgb.shape[:2]
+        image, rect = self.roi_tracker.crop(frame_rgb)
+        results = self._process(image)
+        results = self.roi_tracker.remap(results, rect, width, height)
+        if self.roi_tracker.is_lost(results, rect):
+            # Une main est sortie de la zone: détection sur toute la frame
+            rect = None
+            results = self._process(frame_rgb)
+        self.roi_tracker.update(results, rect, width, height)
+        return results
+
+    def _process(self, image: cv2.typing.MatLike) -> AModel.ArrayResults:
+        with profiler.scope("inference"):
+            return AModel.ArrayResults.from_results(self.hands.process(image))
+
+    def store_frame(self, frame: cv2.typing.MatLike):
+        """Store the frame to display"""
         self.frame = frame
-        frame_rgb = cv2.cvtColor(self.frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(frame_rgb)
-
-        # On vérifie la présence des deux types de landmarks
-        if results.multi_hand_landmarks and results.multi_hand_world_landmarks:
-            # zip permet de parcourir les deux listes en même temps
-            self.update_player_hand_metrics(
-                results.multi_hand_landmarks,
-                results.multi_hand_world_landmarks,
-                results.multi_handedness,
-                self.width,
-                self.height,
-            )
+        self.frame_id += 1
+
+    def inference_shape(self, width: int, height: int) -> tuple[int, int]:
+        """`(width, height)` of the image fed to the model for a frame of that size"""
+        if self.inference_size is None:
+            return width, height
+        scale = min(self.inference_size[0] / width, self.inference_size[1] / height)
+        if scale >= 1:
+            return width, height  # Jamais agrandie
+        return max(round(width * scale), 1), max(round(height * scale), 1)
+
+    def prepare_frame(self, frame: cv2.typing.MatLike) -> cv2.typing.MatLike:
+        """Store the frame to display and return the RGB image fed to the model.
+
+        The image comes from `frame_pool`: the consumer gives it back with
+        `frame_pool.release` once inference is done.
+        """
+        self.store_frame(frame)
+        with profiler.scope("color"):
+            height, width = frame.shape[:2]
+            size = self.inference_shape(width, height)
+            self.frame_pool.reshape((size[1], size[0], 3))
+            image = self.frame_pool.acquire()
+            if size == (width, height):
+                return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=image)
+            # Réduction puis conversion sur place: la conversion ne porte que
+            # sur les pixels de l'image réduite
+            cv2.resize(frame, size, dst=image, interpolation=cv2.INTER_LINEAR)
+            return cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image)
+
+    def apply_results(
+        self, results: AModel.ArrayResults, frame_id: int, timestamp: float
+    ):
+        """Update the players from the results of the frame `frame_id`"""
+        self.results_frame_id = frame_id
+        self.results_timestamp = timestamp
+        self._results_applied = True
+        self.players_timestamp = timestamp
+        if self.recorder is not None:
+            self.recorder.write(timestamp, results)
+        if results.n_hands:
+            with profiler.scope("metrics"):
+                self.update_player_hand_metrics(
+                    results, self.width, self.height, timestamp
+                )
+
+    def _should_infer(self) -> bool:
+        """Whether to run inference on the current frame (see detection_interval)"""
+        self._frames_since_inference += 1
+        if self._frames_since_inference >= self.detection_interval:
+            return True
+        return (
+            self.inference_budget is not None
+            and self.inference_time <= self.inference_budget
+        )
+
+    def process_frame(self, frame: cv2.typing.MatLike):
+        infer = self._should_infer()
+        if infer:
+            self._frames_since_inference = 0
+            if self.hands.uses_frames:
+                frame_rgb = self.prepare_frame(frame)
+            else:
+                # Le modèle ignore l'image (ex: LaneModel): ni réduction ni
+                # conversion couleur
+                self.store_frame(frame)
+                frame_rgb = None
+        else:
+            self.store_frame(frame)
+
+        if self.pipeline is not None:
+            if infer:
+                self.pipeline.submit(self.frame_id, frame_rgb, self.frame_timestamp)
+                if self.pipeline is self.hands:
+                    # Le pool de processus a copié l'image en mémoire partagée
+                    self.frame_pool.release(frame_rgb)
+            result = self.pipeline.poll()
+            if result is not None:
+                self._record_inference_time(result.inference_time)
+                self.apply_results(result.results, result.frame_id, result.timestamp)
+                return
+        elif infer:
+            start = time.perf_counter()
+            results = self.infer(frame_rgb)
+            self.frame_pool.release(frame_rgb)
+            self._record_inference_time(time.perf_counter() - start)
+            self.apply_results(results, self.frame_id, self.frame_timestamp)
+            return
+
+        # Pas de nouveau résultat sur cette frame: on garde l'état des joueurs,
+        # ou on extrapole les mains si l'inférence est espacée
+        if self.interpolate:
+            self.extrapolate_players(self.frame_timestamp)
+
+    def _record_inference_time(self, duration: float):
+        # Moyenne glissante exponentielle
+        if self.inference_time == 0.0:
+            self.inference_time = duration
+        else:
+            self.inference_time += 0.1 * (duration - self.inference_time)
 
     def update_player_hand_metrics(
         self,
-        multi_landmarks: List[AModel.HandLandmarks],
-        multi_world_landmarks: List[AModel.HandLandmarks],
-        multi_handedness: List[AModel.Handedness],
+        results: AModel.ArrayResults,
         width: int,
         height: int,
+        timestamp: float = 0.0,
     ):
-        for i, (hand_lms, hand_world_lms, handedness) in enumerate(
-            zip(multi_landmarks, multi_world_landmarks, multi_handedness)
-        ):
-            # player = self._find_or_create_player(hand_world_lms)
-            if i >= 2:
-                print(
-                    f"Warning: Detected more hands than player slots ({i}/{2}). Ignoring extra hands."
-                )
-                continue
-            player: PlayerHand = self.player.get(
-                handedness.classification[0].label, PlayerHand(id=i)
+        n_hands = results.n_hands
+        if n_hands > self.max_players:
+            logger.warning(
+                "Detected more hands than player slots (%d/%d). Ignoring extra hands.",
+                n_hands,
+                self.max_players,
             )
-            player.id = handedness.classification[0].label
-
-            # --- 1. POSITION ÉCRAN (Utilise hand_landmarks) ---
-            # On prend l'index (point 8) ou le poignet (point 0)
-            index_tip = hand_lms.landmark[8]
-            screen_x = int((1 - index_tip.x) * width)
-            screen_y = int(index_tip.y * height)
-
-            # --- 2. ANGLES & GIZMO (Utilise hand_world_landmarks) ---
-            wrist_w = hand_world_lms.landmark[0]
-            index_mcp_w = hand_world_lms.landmark[5]
-            pinky_mcp_w = hand_world_lms.landmark[17]
-
-            wrist_pos = np.array([wrist_w.x, wrist_w.y, wrist_w.z])
-            index_mcp_pos = np.array([index_mcp_w.x, index_mcp_w.y, index_mcp_w.z])
-            pinky_mcp_pos = np.array([pinky_mcp_w.x, pinky_mcp_w.y, pinky_mcp_w.z])
-
-            # Calcul des vecteurs
-            milieu_mcp = (index_mcp_pos + pinky_mcp_pos) / 2
-            axe_y = milieu_mcp - wrist_pos
-            axe_y /= np.linalg.norm(axe_y)
-
-            axe_x = pinky_mcp_pos - index_mcp_pos
-            axe_x /= np.linalg.norm(axe_x)
-
-            axe_z = np.cross(axe_x, axe_y)
-            axe_z /= np.linalg.norm(axe_z)
-
-            # Angles d'Euler
-            pitch = np.degrees(np.atan2(-axe_y[2], axe_y[1]))
-            roll = np.degrees(np.atan2(axe_x[1], axe_x[0]))
-            yaw = np.degrees(np.atan2(axe_z[0], axe_z[2]))
-
-            # Gestion du shoot
-            # on verifie si le bout du pouce (landmark 4) est proche de la base de l'index (landmark 5)
-            thumb_2d = hand_lms.landmark[4]
-            index_base_2d = hand_lms.landmark[5]
-            dist_2d = np.sqrt(
-                (thumb_2d.x - index_base_2d.x) ** 2
-                + (thumb_2d.y - index_base_2d.y) ** 2
-            )
-
-            # 3D distance using world landmarks (real-world coordinates)
-            thumb_w = hand_world_lms.landmark[4]
-            index_base_w = hand_world_lms.landmark[5]
-            thumb_pos = np.array([thumb_w.x, thumb_w.y, thumb_w.z])
-            index_pos = np.array([index_base_w.x, index_base_w.y, index_base_w.z])
-            dist_3d = float(np.linalg.norm(thumb_pos - index_pos))
-
-            index_tip = hand_lms.landmark[8]
-
-            # Use a 3D threshold (meters) for shooting detection; adjust as needed
-            is_shooting = (
-                # dist_3d < 0.035
-                1
-                and self._is_thumb_bent(hand_lms)
-                # and abs(player.average_dist_3D - dist_3d)
-                # > 0.01  # ensure it's a new "shoot" action, not just noise
-            )
-
-            projected_pos = self._calculate_projected_pos(
-                hand_lms, hand_world_lms, width, height
-            )
-
-            player.angle = PlayerHand.Angle(pitch, roll, yaw)
-            player.pos = (screen_x, screen_y)
-            player.projected_pos = projected_pos
-            player.is_shooting = is_shooting
+            n_hands = self.max_players
+        lms = results.landmarks[:n_hands]
+        world_lms = results.world_landmarks[:n_hands]
+
+        # Toutes les mains sont traitées en une fois
+        dist_3d = kinematics.thumb_index_distance(world_lms)
+        # Pose du pouce sur cette détection; le tir lui-même est décidé par
+        # le ShotTrigger de chaque joueur, sur l'historique de la main
+        thumb_bent = kinematics.thumb_bent(lms)
+
+        # Mains de caméras différentes: chacune a l'instant de sa capture
+        stamps = (
+            results.timestamps[:n_hands].tolist()
+            if results.timestamps is not None
+            else [timestamp] * n_hands
+        )
+        players = []
+        for i, label in enumerate(results.labels[:n_hands]):
+            player = self.player.get(label)
+            if player is None:
+                # Historique alloué une seule fois par main
+                player = PlayerHand(id=i)
+            player.id = label
+            player.claim()
+            player.set_landmarks(lms[i], world_lms[i], stamps[i])
+            player.update_trigger(bool(thumb_bent[i]), stamps[i])
             player.average_dist_3D = (
-                dist_3d * 0.5 + player.average_dist_3D * 0.5
+                float(dist_3d[i]) * 0.5 + player.average_dist_3D * 0.5
             )  # simple moving average to smooth distance
             self.player[player.id] = player
+            players.append(player)
 
-    def _calculate_projected_pos(
-        self, hand_lms, hand_world_lms, width, height, forward_m=0.5
-    ):
-        """Compute projected image pixel position by moving forward `forward_m` meters
-        along the axis defined by world landmarks 5->8, then map that world offset
-        to image pixels using the observed image displacement between 5 and 8.
+        self._update_hand_geometry(players, lms, world_lms, width, height)
 
-        Falls back to a 10-pixel forward projection if world->image mapping is unstable.
-        """
-        # image-space points
-        idx_mcp_2d = hand_lms.landmark[5]
-        idx_tip_2d = hand_lms.landmark[8]
-        px_mcp = np.array(
-            [int(idx_mcp_2d.x * width), int(idx_mcp_2d.y * height)], dtype=float
-        )
-        px_tip = np.array(
-            [int(idx_tip_2d.x * width), int(idx_tip_2d.y * height)], dtype=float
-        )
-
-        # Derive pixels-per-meter from image MCP->TIP displacement assuming
-        # the finger length is always 0.4 meters (no world landmarks used).
-        v_img = px_tip - px_mcp
-        img_norm = np.linalg.norm(v_img)
-        finger_length_m = 0.4
-
-        if img_norm > 1e-6:
-            pixels_per_meter = img_norm / finger_length_m
-            dir_unit = v_img / img_norm
-            delta_pixels = dir_unit * (pixels_per_meter * forward_m)
-            proj_point = px_tip + delta_pixels
-        else:
-            print("Fallback projection used due to unstable world->image mapping")
-            # fallback: simple image-space 10-pixel forward
-            dir_px = px_tip - px_mcp
-            norm_dir = np.linalg.norm(dir_px)
-            if norm_dir == 0:
-                return (int(px_tip[0]), int(px_tip[1]))
-            dir_unit = dir_px / norm_dir
-            proj_point = px_tip + dir_unit * 10  # 10 pixels forward
-
-        # Flip x coordinate for mirror effect
-        proj_point[0] = width - proj_point[0]
-        return (int(proj_point[0]), int(proj_point[1]))
-
-    def _is_thumb_bent(self, hand_lms):
-        """Estimate thumb bend using image-space landmarks (`hand_lms`).
-
-        Reconstruct a simple 3D chain for the thumb using the landmark directions
-        and assuming each segment length = 0.2 meters. Then compute the angle at
-        the middle joint and return True if bend > 25°.
-        """
-        # Use landmarks 4,5,8 which are the thumb tip, index base, and index tip respectively
-        thumb_base = hand_lms.landmark[2]
-        thumb_mid = hand_lms.landmark[3]
-        thumb_tip = hand_lms.landmark[4]
-        index_pip = hand_lms.landmark[6]
-
-        # If thumb tip is below index base in image space, consider it bent
-        if thumb_tip.y > index_pip.y:
-            return True
-
-        # Build direction vectors from normalized landmarks (x,y,z provided by hand_lms)
-        v23 = np.array(
-            [
-                thumb_mid.x - thumb_base.x,
-                thumb_mid.y - thumb_base.y,
-                thumb_mid.z - thumb_base.z,
-            ],
-            dtype=float,
-        )
-        v34 = np.array(
-            [
-                thumb_tip.x - thumb_mid.x,
-                thumb_tip.y - thumb_mid.y,
-                thumb_tip.z - thumb_mid.z,
-            ],
-            dtype=float,
-        )
-
-        na = np.linalg.norm(v23)
-        nb = np.linalg.norm(v34)
-        if na == 0 or nb == 0:
-            return False
-
-        # Unit directions in image-normalized space
-        d23 = v23 / na
-        d34 = v34 / nb
-
-        # Reconstruct 3D positions assuming each thumb segment length = 0.2 m
-        L = 0.2
-        p2 = np.array([0.0, 0.0, 0.0], dtype=float)
-        p3 = p2 + d23 * L
-        p4 = p3 + d34 * L
-
-        # Angle at p3 between p2->p3 and p4->p3
-        va = p2 - p3
-        vb = p4 - p3
-        na2 = np.linalg.norm(va)
-        nb2 = np.linalg.norm(vb)
-        if na2 == 0 or nb2 == 0:
-            return False
-        cosang = np.clip(np.dot(va, vb) / (na2 * nb2), -1.0, 1.0)
-        angle_deg = float(np.degrees(np.arccos(cosang)))
-        bend_deg = abs(180.0 - angle_deg)
-
-        # # Debug visualization (optional): draw the thumb chain and angle on the frame
-        # ## First segment (constant, length = 0.2, along y axis, start in center of screen)
-        # cv2.line(
-        #     self.frame,
-        #     (self.width // 2, self.height // 2),
-        #     (self.width // 2, self.height // 2 + int(L * self.height)),
-        #     (255, 255, 0),
-        #     2,
-        # )
-        # # rotated second segment
-        # end_x = int(self.width // 2 + L * self.height * np.sin(np.radians(bend_deg)))
-        # end_y = int(self.height // 2 + L * self.height * np.cos(np.radians(bend_deg)))
-        # cv2.line(
-        #     self.frame,
-        #     (self.width // 2, self.height // 2),
-        #     (end_x, end_y),
-        #     (255, 0, 0),
-        #     2,
-        # )
-
-        return bend_deg > 40
+    def _update_hand_geometry(
+        self,
+        players: list[PlayerHand],
+        lms: np.ndarray,
+        world_lms: np.ndarray,
+        width: int,
+        height: int,
+    ):
+        """Met à jour position, position projetée et angles des joueurs"""
+        screen_pos = kinematics.screen_positions(lms, width, height)
+        angles = kinematics.hand_angles(world_lms)
+        projected_pos = kinematics.projected_positions(lms, width, height)
+        for i, player in enumerate(players):
+            pitch, roll, yaw = angles[i].tolist()
+            player.angle = PlayerHand.Angle(pitch, roll, yaw)
+            player.pos = tuple(screen_pos[i].tolist())
+            player.projected_pos = tuple(projected_pos[i].tolist())
+
+    def extrapolate_players(self, timestamp: float, max_horizon: float = 0.1):
+        """Move the players between two inferences by extrapolating their
+        landmarks from their recent motion. Shooting state is left untouched:
+        shots are only detected on real inference results."""
+        players = [p for p in self.player.values() if p.landmarks is not None]
+        if not players:
+            return
+        horizons = np.array(
+            [min(max(timestamp - p.landmarks_timestamp, 0.0), max_horizon) for p in players],
+            dtype=np.float32,
+        )[:, None, None]
+        lms = np.stack([p.landmarks for p in players])
+        lms += np.stack([p.landmarks_velocity for p in players]) * horizons
+        world_lms = np.stack([p.world_landmarks for p in players])
+        world_lms += np.stack([p.world_landmarks_velocity for p in players]) * horizons
+        self._update_hand_geometry(players, lms, world_lms, self.width, self.height)
+        self.players_timestamp = timestamp
@@ -0,0 +1,303 @@
+import math
+import multiprocessing as mp
+import os
+import time
+from dataclasses import dataclass
+from multiprocessing import connection, shared_memory
+from typing import Callable, Sequence
+
+import cv2
+import numpy as np
+
+from .amodel import AModel
+from .capture import ImageDirectoryCapture
+from .default import DefaultModel
+
+
+@dataclass
+class LaneTransform:
+    """Maps landmarks normalized to a lane image into the tiled canvas"""
+
+    x0: float
+    y0: float
+    sx: float
+    sy: float
+
+    def apply(self, landmarks: np.ndarray) -> np.ndarray:
+        out = landmarks.copy()
+        out[..., 0] = self.x0 + out[..., 0] * self.sx
+        out[..., 1] = self.y0 + out[..., 1] * self.sy
+        # z suit la même échelle que x
+        out[..., 2] *= self.sx
+        return out
+
+
+def _lane_worker(
+    source,
+    model_factory: Callable[[], AModel],
+    shm_name: str,
+    shape: tuple[int, int, int, int],
+    conn,
+    free_conn,
+    stop,
+):
+    """Capture + inference loop of one camera, in its own process.
+
+    Frames are written into free shared-memory slots and announced on `conn`
+    with the results as plain arrays: nothing image-sized is pickled. The
+    main process sends each slot index back on `free_conn` once it has
+    copied (or skipped) the frame; only then is the slot written again.
+    """
+    if isinstance(source, str) and os.path.isdir(source):
+        cap = ImageDirectoryCapture(source)
+    else:
+        cap = cv2.VideoCapture(source)
+    model = model_factory()
+    shm = shared_memory.SharedMemory(name=shm_name)
+    slots = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+    n_slots, height, width = shape[:3]
+    free = list(range(n_slots))
+    try:
+        while not stop.is_set():
+            success, frame = cap.read()
+            if not success:
+                break
+            timestamp = time.perf_counter()
+            if frame.shape[:2] != (height, width):
+                frame = cv2.resize(frame, (width, height))
+            results = AModel.ArrayResults.from_results(
+                model.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+            )
+
+            # Slots rendus par le processus principal; s'il n'y en a aucun,
+            # on attend qu'il copie ou saute une frame
+            while free_conn.poll():
+                free.append(free_conn.recv())
+            while not free and not stop.is_set():
+                if free_conn.poll(0.1):
+                    free.append(free_conn.recv())
+            if not free:
+                break
+            slot = free.pop()
+            slots[slot] = frame
+            conn.send(
+                (
+                    slot,
+                    timestamp,
+                    results.landmarks,
+                    results.world_landmarks,
+                    results.handedness,
+                    results.handedness_score,
+                )
+            )
+    except (BrokenPipeError, EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        conn.close()
+        free_conn.close()
+        cap.release()
+        del slots
+        shm.close()
+
+
+class MultiCameraCapture:
+    """Several cameras, each captured and processed by its own worker process.
+
+    The lane images are tiled into one canvas returned by `read`, like a
+    single camera, and `results` returns the hands of the lanes that sent a
+    new frame, mapped into canvas coordinates with each lane's
+    `LaneTransform` and stamped with that lane's capture time. Use it with
+    `LaneModel` so the `Model` uses these results instead of running
+    inference on the canvas.
+    """
+
+    def __init__(
+        self,
+        sources: Sequence[int | str],
+        width: int = 640,
+        height: int = 480,
+        model_factory: Callable[[], AModel] = DefaultModel,
+        slots: int = 3,
+        timeout: float = 1.0,
+    ):
+        """
+        Args:
+            sources: Camera indices, video files or image directories, one per lane
+            width (int), height (int): Size of each lane in the canvas
+            model_factory: Picklable callable building the model of each worker
+            slots (int): Shared-memory frame slots per lane (at least 2)
+            timeout (float): Seconds `read` waits for a new lane frame
+        """
+        if slots < 2:
+            raise ValueError("MultiCameraCapture needs at least 2 slots per lane")
+        self.sources = list(sources)
+        self.lane_width, self.lane_height = width, height
+        self.timeout = timeout
+        n = len(self.sources)
+        cols = math.ceil(math.sqrt(n))
+        rows = math.ceil(n / cols)
+        self.canvas = np.zeros((rows * height, cols * width, 3), dtype=np.uint8)
+        self.transforms = [
+            LaneTransform((i % cols) / cols, (i // cols) / rows, 1 / cols, 1 / rows)
+            for i in range(n)
+        ]
+
+        self.timestamp = 0.0
+        self.frame_count = 0
+        self._results = [AModel.ArrayResults.empty() for _ in range(n)]
+        # Instant de capture de la dernière frame de chaque lane, et lanes
+        # dont les résultats n'ont pas encore été rendus par `results`
+        self._timestamps = np.zeros(n, dtype=np.float64)
+        self._fresh = [False] * n
+        self._alive = [True] * n
+
+        ctx = mp.get_context("spawn")
+        self._stop = ctx.Event()
+        self._shms, self._slots = [], []
+        self._conns, self._free_conns, self._processes = [], [], []
+        shape = (slots, height, width, 3)
+        for i, source in enumerate(self.sources):
+            shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)))
+            parent_conn, child_conn = ctx.Pipe(duplex=False)
+            # Slots rendus au worker, dans l'autre sens
+            worker_free, parent_free = ctx.Pipe(duplex=False)
+            process = ctx.Process(
+                target=_lane_worker,
+                args=(
+                    source, model_factory, shm.name, shape, child_conn, worker_free, self._stop
+                ),
+                name=f"lane-{i}",
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            worker_free.close()
+            self._shms.append(shm)
+            self._slots.append(np.ndarray(shape, dtype=np.uint8, buffer=shm.buf))
+            self._conns.append(parent_conn)
+            self._free_conns.append(parent_free)
+            self._processes.append(process)
+
+    @property
+    def lanes(self) -> int:
+        return len(self.sources)
+
+    def isOpened(self) -> bool:
+        return any(self._alive)
+
+    def get(self, prop_id: int) -> float:
+        if prop_id == cv2.CAP_PROP_FRAME_WIDTH:
+            return float(self.canvas.shape[1])
+        if prop_id == cv2.CAP_PROP_FRAME_HEIGHT:
+            return float(self.canvas.shape[0])
+        return 0.0
+
+    def set(self, prop_id: int, value: float) -> bool:
+        return False
+
+    def _hand_back(self, lane: int, slot: int):
+        """Let the worker of `lane` write into `slot` again"""
+        try:
+            self._free_conns[lane].send(slot)
+        except OSError:
+            pass  # Worker terminé
+
+    def _receive(self, lane: int) -> bool:
+        """Copy the newest frame of `lane` into the canvas; False if none"""
+        conn = self._conns[lane]
+        message = None
+        try:
+            while conn.poll():
+                if message is not None:
+                    self._hand_back(lane, message[0])  # Frame sautée
+                message = conn.recv()
+        except EOFError:
+            # Caméra terminée: ses mains disparaissent
+            self._alive[lane] = False
+            self._results[lane] = AModel.ArrayResults.empty()
+            self._fresh[lane] = False
+        if message is None:
+            return False
+
+        slot, timestamp, landmarks, world, handedness, score = message
+        x0 = int(round(self.transforms[lane].x0 * self.canvas.shape[1]))
+        y0 = int(round(self.transforms[lane].y0 * self.canvas.shape[0]))
+        self.canvas[
+            y0 : y0 + self.lane_height, x0 : x0 + self.lane_width
+        ] = self._slots[lane][slot]
+        self._hand_back(lane, slot)
+
+        self._results[lane] = AModel.ArrayResults(
+            self.transforms[lane].apply(landmarks), world, handedness, score
+        )
+        self._timestamps[lane] = timestamp
+        self._fresh[lane] = True
+        self.timestamp = max(self.timestamp, timestamp)
+        return True
+
+    def read(self):
+        """Wait for at least one lane to deliver a frame and return the canvas"""
+        live = [c for c, alive in zip(self._conns, self._alive) if alive]
+        if not live or not connection.wait(live, self.timeout):
+            return False, None
+        updated = [self._receive(lane) for lane in range(self.lanes) if self._alive[lane]]
+        if not any(updated):
+            return False, None  # Seulement des lanes terminées
+        self.frame_count += 1
+        # Copie: la frame appartient ensuite au jeu (miroir, dessin, pipeline)
+        return True, self.canvas.copy()
+
+    def results(self) -> AModel.ArrayResults:
+        """Hands of the lanes that delivered a frame since the last call, in
+        canvas coordinates, with their lane and capture time. A lane without
+        a new frame is left out rather than served again as a new detection."""
+        fresh = [i for i in range(self.lanes) if self._fresh[i]]
+        self._fresh = [False] * self.lanes
+        lanes = [self._results[i] for i in fresh]
+        empty = AModel.ArrayResults.empty()
+        return AModel.ArrayResults(
+            np.concatenate([empty.landmarks] + [r.landmarks for r in lanes]),
+            np.concatenate([empty.world_landmarks] + [r.world_landmarks for r in lanes]),
+            np.concatenate([empty.handedness] + [r.handedness for r in lanes]),
+            np.concatenate([empty.handedness_score] + [r.handedness_score for r in lanes]),
+            lane=np.concatenate(
+                [np.zeros(0, dtype=np.int8)]
+                + [np.full(r.n_hands, i, dtype=np.int8) for i, r in zip(fresh, lanes)]
+            ),
+            timestamps=np.concatenate(
+                [np.zeros(0, dtype=np.float64)]
+                + [np.full(r.n_hands, self._timestamps[i]) for i, r in zip(fresh, lanes)]
+            ),
+        )
+
+    def release(self):
+        self._stop.set()
+        for conn in self._conns + self._free_conns:
+            conn.close()
+        for process in self._processes:
+            process.join(timeout=2.0)
+            if process.is_alive():
+                process.terminate()
+        self._slots.clear()
+        for shm in self._shms:
+            shm.close()
+            shm.unlink()
+        self._shms.clear()
+        self._alive = [False] * self.lanes
+
+
+class LaneModel(AModel):
+    """Serves the per-lane results computed by the `MultiCameraCapture` workers"""
+
+    uses_frames = False
+
+    def __init__(self, capture: MultiCameraCapture):
+        super().__init__()
+        self.capture = capture
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return False  # Needs a MultiCameraCapture
+
+    def process(self, frame):
+        return self.capture.results()
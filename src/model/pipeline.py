@@ -0,0 +1,100 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+class InferencePipeline:
+    """Runs a model on a worker thread so the game loop never waits for it.
+
+    Frames are submitted with `submit` into a bounded queue (the oldest
+    pending frame is dropped when it is full) and the newest completed
+    result is fetched with `poll`. Frames are handed to `release` once the
+    worker is done with them (or they are dropped), e.g. to reuse their
+    buffers.
+    """
+
+    @dataclass
+    class Result:
+        frame_id: int
+        timestamp: float  # Timestamp de capture de la frame d'origine
+        results: Any
+        inference_time: float = 0.0
+
+    def __init__(
+        self,
+        process: Callable[[Any], Any],
+        queue_depth: int = 1,
+        release: Callable[[Any], None] | None = None,
+    ):
+        if queue_depth < 1:
+            raise ValueError("queue_depth must be at least 1")
+        self.process = process
+        self.release = release
+        self.queue_depth = queue_depth
+        self.dropped_frames = 0
+
+        self._pending: deque = deque()
+        self._latest: InferencePipeline.Result | None = None
+        self._latest_polled = True
+        self._error: BaseException | None = None
+        self._cond = threading.Condition()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="inference", daemon=True)
+        self._thread.start()
+
+    def submit(self, frame_id: int, frame, timestamp: float):
+        """Queue a frame for inference. The pipeline takes ownership of `frame`."""
+        with self._cond:
+            if len(self._pending) >= self.queue_depth:
+                dropped = self._pending.popleft()
+                self.dropped_frames += 1
+                if self.release is not None:
+                    self.release(dropped[1])
+            self._pending.append((frame_id, frame, timestamp))
+            self._cond.notify_all()
+
+    def poll(self) -> "InferencePipeline.Result | None":
+        """Return the newest completed result, or None if nothing new finished."""
+        with self._cond:
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise error
+            if self._latest_polled:
+                return None
+            self._latest_polled = True
+            return self._latest
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or not self._running)
+                if not self._running:
+                    return
+                frame_id, frame, timestamp = self._pending.popleft()
+
+            start = time.perf_counter()
+            try:
+                results = self.process(frame)
+            except Exception as e:
+                with self._cond:
+                    self._error = e
+                continue
+            finally:
+                if self.release is not None:
+                    self.release(frame)
+            result = InferencePipeline.Result(
+                frame_id, timestamp, results, time.perf_counter() - start
+            )
+
+            with self._cond:
+                self._latest = result
+                self._latest_polled = False
+
+    def close(self):
+        with self._cond:
+            self._running = False
+            self._pending.clear()
+            self._cond.notify_all()
+        self._thread.join(timeout=1.0)
@@ -0,0 +1,219 @@
+import multiprocessing as mp
+import queue
+import time
+from multiprocessing import shared_memory
+from typing import Callable
+
+import numpy as np
+
+from .amodel import AModel
+from .default import DefaultModel
+from .pipeline import InferencePipeline
+
+
+def _pool_worker(
+    model_factory: Callable[[], AModel],
+    shm_name: str,
+    slot_bytes: int,
+    tasks,
+    results,
+):
+    """Inference loop of one worker process: frames are read in place from
+    the shared-memory slot named by each task"""
+    model = model_factory()
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            seq, slot, shape = task
+            frame = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf, offset=slot * slot_bytes)
+            start = time.perf_counter()
+            try:
+                r = AModel.ArrayResults.from_results(model.process(frame))
+            except Exception as e:
+                results.put((seq, slot, None, repr(e)))
+                continue
+            finally:
+                del frame
+            results.put(
+                (
+                    seq,
+                    slot,
+                    (r.landmarks, r.world_landmarks, r.handedness, r.handedness_score),
+                    time.perf_counter() - start,
+                )
+            )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        shm.close()
+
+
+class ProcessPoolModel(AModel):
+    """Runs the hand model in a pool of worker processes.
+
+    Each worker has its own model instance (MediaPipe `Hands` by default).
+    RGB frames are copied into shared-memory slots instead of being pickled;
+    only the slot index goes to the worker and only the result arrays come
+    back. Results are released in submission order.
+
+    Use `process` like any model (one frame at a time), or give the pool to
+    `Model(pipelined=True)`: it then replaces the inference thread and keeps
+    up to `workers + queue_depth` consecutive frames in flight. Each worker
+    sees only part of the frames, so MediaPipe's tracking between frames is
+    per worker.
+
+    A worker that dies (crash, killed) loses the frame it was processing:
+    the pool raises a RuntimeError as soon as it notices, instead of waiting
+    for that frame or silently dropping every later one.
+    """
+
+    LIVENESS_INTERVAL = 0.5  # Secondes d'attente entre deux vérifications des workers
+
+    def __init__(
+        self,
+        workers: int = 2,
+        queue_depth: int = 1,
+        max_frame_shape: tuple[int, int, int] = (1080, 1920, 3),
+        model_factory: Callable[[], AModel] = DefaultModel,
+    ):
+        """
+        Args:
+            workers (int): Worker processes
+            queue_depth (int): Frames that may wait for a free worker
+            max_frame_shape: Largest (h, w, 3) frame accepted, sizes the slots
+            model_factory: Picklable callable building each worker's model
+        """
+        super().__init__()
+        if workers < 1:
+            raise ValueError("ProcessPoolModel needs at least one worker")
+        self.workers = workers
+        self.slot_bytes = int(np.prod(max_frame_shape))
+        self.max_frame_shape = max_frame_shape
+        self.dropped_frames = 0
+
+        n_slots = workers + max(queue_depth, 1)
+        self._shm = shared_memory.SharedMemory(create=True, size=n_slots * self.slot_bytes)
+        self._free = list(range(n_slots))
+        self._seq = 0  # Prochain numéro de frame soumise
+        self._next = 0  # Prochain numéro de résultat à rendre, dans l'ordre
+        self._in_flight: dict[int, tuple[int, float]] = {}  # seq -> (frame_id, timestamp)
+        self._done: dict[int, InferencePipeline.Result] = {}
+        self._latest: InferencePipeline.Result | None = None
+        self._error: str | None = None
+
+        ctx = mp.get_context("spawn")
+        self._tasks = ctx.Queue()
+        self._results = ctx.Queue()
+        self._processes = [
+            ctx.Process(
+                target=_pool_worker,
+                args=(model_factory, self._shm.name, self.slot_bytes, self._tasks, self._results),
+                name=f"inference-{i}",
+                daemon=True,
+            )
+            for i in range(workers)
+        ]
+        for process in self._processes:
+            process.start()
+        self._closed = False
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return False  # Opt-in (--inference-workers), never picked at random
+
+    def submit(self, frame_id: int, frame: np.ndarray, timestamp: float) -> bool:
+        """Copy an RGB frame into a free slot and queue it. Returns False (and
+        counts a dropped frame) when every slot is still in use."""
+        self._collect(block=False)
+        if frame.nbytes > self.slot_bytes:
+            raise ValueError(
+                f"Frame {frame.shape} larger than max_frame_shape {self.max_frame_shape}"
+            )
+        if not self._free:
+            self._check_workers()  # Un slot peut être perdu avec son worker
+            self.dropped_frames += 1
+            return False
+        slot = self._free.pop()
+        view = np.ndarray(
+            frame.shape, dtype=np.uint8, buffer=self._shm.buf, offset=slot * self.slot_bytes
+        )
+        view[...] = frame
+        del view
+        seq = self._seq
+        self._seq += 1
+        self._in_flight[seq] = (frame_id, timestamp)
+        self._tasks.put((seq, slot, frame.shape))
+        return True
+
+    def _check_workers(self):
+        for process in self._processes:
+            if not process.is_alive():
+                raise RuntimeError(
+                    f"Inference worker {process.name} exited with code {process.exitcode}"
+                )
+
+    def _collect(self, block: bool):
+        """Move finished results out of the queue, then release the ones
+        that are next in order. When blocking, wait for at least one result
+        and check regularly that the workers are still alive."""
+        while True:
+            try:
+                seq, slot, arrays, extra = self._results.get(
+                    block=block, timeout=self.LIVENESS_INTERVAL
+                )
+            except queue.Empty:
+                if block:
+                    self._check_workers()
+                    continue
+                break
+            block = False  # Ensuite, seulement ce qui est déjà arrivé
+            self._free.append(slot)
+            frame_id, timestamp = self._in_flight.pop(seq)
+            if arrays is None:
+                self._error = extra
+                results, duration = AModel.ArrayResults.empty(), 0.0
+            else:
+                results, duration = AModel.ArrayResults(*arrays), extra
+            self._done[seq] = InferencePipeline.Result(frame_id, timestamp, results, duration)
+
+        while self._next in self._done:
+            self._latest = self._done.pop(self._next)
+            self._next += 1
+
+    def poll(self) -> InferencePipeline.Result | None:
+        """Newest result released in order since the last poll, or None"""
+        self._collect(block=False)
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError(f"Inference worker failed: {error}")
+        latest, self._latest = self._latest, None
+        return latest
+
+    def process(self, frame) -> AModel.ArrayResults:
+        """Run one frame through the pool and wait for its results"""
+        while not self.submit(0, frame, 0.0):
+            self.dropped_frames -= 1
+            self._collect(block=True)
+        target = self._seq
+        while self._next < target:
+            self._collect(block=True)
+        result = self.poll()
+        return result.results if result is not None else AModel.ArrayResults.empty()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._processes:
+            self._tasks.put(None)
+        for process in self._processes:
+            process.join(timeout=2.0)
+            if process.is_alive():
+                process.terminate()
+        self._tasks.close()
+        self._results.close()
+        self._shm.close()
+        self._shm.unlink()
@@ -0,0 +1,117 @@
+"""Compact binary recordings of hand tracking results.
+
+A recording is a small header followed by fixed-size records, one per
+processed frame, so it can be memory-mapped as a NumPy structured array.
+Landmarks are quantized to int16 (image landmarks in 1/8192 of the frame,
+world landmarks in 1/16384 m) and scores to uint8.
+"""
+
+import os
+
+import numpy as np
+
+from .amodel import AModel
+
+MAGIC = b"TACANLMK"
+VERSION = 1
+MAX_HANDS = 2
+IMAGE_SCALE = 8192.0
+WORLD_SCALE = 16384.0
+
+HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("max_hands", "<u4"),
+        ("record_size", "<u4"),
+        ("reserved", "<u4", (5,)),
+    ]
+)
+
+RECORD_DTYPE = np.dtype(
+    [
+        ("timestamp", "<f8"),  # Secondes depuis le début de l'enregistrement
+        ("n_hands", "u1"),
+        ("handedness", "i1", (MAX_HANDS,)),
+        ("handedness_score", "u1", (MAX_HANDS,)),
+        ("landmarks", "<i2", (MAX_HANDS, 21, 3)),
+        ("world_landmarks", "<i2", (MAX_HANDS, 21, 3)),
+    ]
+)
+
+
+class LandmarkRecorder:
+    """Appends `AModel.ArrayResults` to a recording file, one record per frame."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        self._start: float | None = None
+        self._record = np.zeros(1, dtype=RECORD_DTYPE)
+        self._file = open(path, "wb")
+
+        header = np.zeros(1, dtype=HEADER_DTYPE)
+        header["magic"] = MAGIC
+        header["version"] = VERSION
+        header["max_hands"] = MAX_HANDS
+        header["record_size"] = RECORD_DTYPE.itemsize
+        self._file.write(header.tobytes())
+
+    def write(self, timestamp: float, results: AModel.ArrayResults):
+        if self._start is None:
+            self._start = timestamp
+        n = min(results.n_hands, MAX_HANDS)
+        record = self._record[0]
+        record["timestamp"] = timestamp - self._start
+        record["n_hands"] = n
+        record["handedness"][:n] = results.handedness[:n]
+        record["handedness_score"][:n] = np.round(results.handedness_score[:n] * 255)
+        _quantize(results.landmarks[:n], IMAGE_SCALE, record["landmarks"][:n])
+        _quantize(results.world_landmarks[:n], WORLD_SCALE, record["world_landmarks"][:n])
+        # Les mains absentes restent à zéro
+        record["handedness"][n:] = 0
+        record["handedness_score"][n:] = 0
+        record["landmarks"][n:] = 0
+        record["world_landmarks"][n:] = 0
+        self._file.write(self._record.tobytes())
+        self.count += 1
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _quantize(values: np.ndarray, scale: float, out: np.ndarray):
+    np.clip(np.rint(values * scale), -32768, 32767, out=out, casting="unsafe")
+
+
+def open_recording(path: str) -> np.memmap:
+    """Memory-map a recording and return its records as a structured array"""
+    header = np.fromfile(path, dtype=HEADER_DTYPE, count=1)
+    if len(header) != 1 or header["magic"][0] != MAGIC:
+        raise ValueError(f"{path} is not a landmark recording")
+    if (
+        header["version"][0] != VERSION
+        or header["max_hands"][0] != MAX_HANDS
+        or header["record_size"][0] != RECORD_DTYPE.itemsize
+    ):
+        raise ValueError(f"Unsupported landmark recording format in {path}")
+    if os.path.getsize(path) < HEADER_DTYPE.itemsize + RECORD_DTYPE.itemsize:
+        return np.zeros(0, dtype=RECORD_DTYPE)  # mmap refuse une zone vide
+    return np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_DTYPE.itemsize)
+
+
+def decode_record(record) -> AModel.ArrayResults:
+    """Turn one record back into `AModel.ArrayResults`"""
+    n = int(record["n_hands"])
+    return AModel.ArrayResults(
+        record["landmarks"][:n].astype(np.float32) * np.float32(1 / IMAGE_SCALE),
+        record["world_landmarks"][:n].astype(np.float32) * np.float32(1 / WORLD_SCALE),
+        record["handedness"][:n].astype(np.int8),
+        record["handedness_score"][:n].astype(np.float32) * np.float32(1 / 255),
+    )
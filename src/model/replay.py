@@ -0,0 +1,48 @@
+import os
+
+from .amodel import AModel
+from .recording import decode_record, open_recording
+
+
+class ReplayModel(AModel):
+    """Serves hand tracking results from a landmark recording.
+
+    The recording is memory-mapped and each call to `process` returns the
+    next record, ignoring the frame, so the game can run without a camera or
+    MediaPipe. The path comes from the constructor or from the
+    `TIRE_AU_CANARD_REPLAY` environment variable.
+
+    Never picked automatically: select it with `--replay PATH` or
+    `--model ReplayModel`.
+    """
+
+    ENV_VAR = "TIRE_AU_CANARD_REPLAY"
+    uses_frames = False
+
+    def __init__(self, path: str | None = None, loop: bool = True):
+        super().__init__()
+        path = path or os.environ.get(self.ENV_VAR)
+        if not path:
+            raise ValueError(
+                f"ReplayModel needs a recording path (or ${self.ENV_VAR} set)"
+            )
+        self.path = path
+        self.loop = loop
+        self.records = open_recording(path)
+        self._index = 0
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return False  # Opt-in (--replay), jamais tiré au sort contre la caméra
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def process(self, frame=None) -> AModel.ArrayResults:
+        if self._index >= len(self.records):
+            if not self.loop or len(self.records) == 0:
+                return AModel.ArrayResults.empty()
+            self._index = 0
+        record = self.records[self._index]
+        self._index += 1
+        return decode_record(record)
@@ -0,0 +1,125 @@
+import numpy as np
+
+from .amodel import AModel
+
+
+class RoiTracker:
+    """Restricts inference to a padded region around the previous hands.
+
+    After a full-frame detection, the next frames are cropped to the
+    bounding box of all landmarks, padded by `padding` times its largest
+    side. The crop then stays fixed until the next full-frame detection:
+    models that track the hand between calls (MediaPipe with
+    `static_image_mode=False`) keep working in one coordinate frame instead
+    of one that moves every frame. The model runs on the full frame again
+    every `redetect_interval` inferences, when the crop would cover most of
+    the frame anyway, when a hand is lost, or when a hand comes within
+    `edge_margin` of the crop border (a new crop is placed around it).
+    """
+
+    def __init__(
+        self,
+        padding: float = 0.75,
+        min_size: float = 0.2,
+        max_area: float = 0.6,
+        redetect_interval: int = 30,
+        edge_margin: float = 0.05,
+    ):
+        """
+        Args:
+            padding (float): Margin added around the hands, relative to their
+                bounding box
+            min_size (float): Minimum crop side, relative to the frame height
+            max_area (float): Crops larger than this fraction of the frame are
+                not worth it, the full frame is used instead
+            redetect_interval (int): Run a full-frame detection at least every
+                N inferences so new hands are picked up
+            edge_margin (float): Distance to the crop border, relative to the
+                crop size, below which the next inference is full-frame
+        """
+        self.padding = padding
+        self.min_size = min_size
+        self.max_area = max_area
+        self.redetect_interval = redetect_interval
+        self.edge_margin = edge_margin
+        self.rect: tuple[int, int, int, int] | None = None
+        self.expected_hands = 0
+        self._since_full = 0
+
+    def crop(self, frame: np.ndarray):
+        """Return `(image, rect)` to run the model on; rect is None for the full frame"""
+        if self.rect is None or self._since_full >= self.redetect_interval:
+            return frame, None
+        x0, y0, x1, y1 = self.rect
+        return np.ascontiguousarray(frame[y0:y1, x0:x1]), self.rect
+
+    def remap(
+        self, results: AModel.ArrayResults, rect, width: int, height: int
+    ) -> AModel.ArrayResults:
+        """Convert landmarks normalized to the crop into full-frame coordinates"""
+        if rect is None or not results.n_hands:
+            return results
+        x0, y0, x1, y1 = rect
+        crop_w, crop_h = x1 - x0, y1 - y0
+        landmarks = results.landmarks.copy()
+        landmarks[..., 0] = (landmarks[..., 0] * crop_w + x0) / width
+        landmarks[..., 1] = (landmarks[..., 1] * crop_h + y0) / height
+        # z suit la même échelle que x
+        landmarks[..., 2] *= crop_w / width
+        return AModel.ArrayResults(
+            landmarks,
+            results.world_landmarks,
+            results.handedness,
+            results.handedness_score,
+        )
+
+    def is_lost(self, results: AModel.ArrayResults, rect) -> bool:
+        """True if a cropped inference found fewer hands than the last full one"""
+        return rect is not None and results.n_hands < self.expected_hands
+
+    def near_edge(self, results: AModel.ArrayResults, rect, width: int, height: int) -> bool:
+        """True if a landmark of a cropped inference is close to the crop border"""
+        if rect is None or not results.n_hands:
+            return False
+        x0, y0, x1, y1 = rect
+        margin_x = (x1 - x0) * self.edge_margin
+        margin_y = (y1 - y0) * self.edge_margin
+        xy = results.landmarks[..., :2].reshape(-1, 2) * (width, height)
+        return bool(
+            (xy[:, 0] < x0 + margin_x).any()
+            or (xy[:, 0] > x1 - margin_x).any()
+            or (xy[:, 1] < y0 + margin_y).any()
+            or (xy[:, 1] > y1 - margin_y).any()
+        )
+
+    def update(self, results: AModel.ArrayResults, rect, width: int, height: int):
+        """Place the crop from full-frame results; after a cropped inference
+        the crop is kept as is, unless a hand nears its border"""
+        if rect is not None:
+            self._since_full += 1
+            if self.near_edge(results, rect, width, height):
+                # La main va sortir: détection plein cadre à la prochaine
+                # inférence, qui placera un nouveau recadrage
+                self.rect = None
+            return
+        self._since_full = 0
+        self.expected_hands = results.n_hands
+        if not results.n_hands:
+            self.rect = None
+            return
+
+        xy = results.landmarks[..., :2].reshape(-1, 2) * (width, height)
+        (bx0, by0), (bx1, by1) = xy.min(axis=0), xy.max(axis=0)
+        side = max(bx1 - bx0, by1 - by0)
+        pad = side * self.padding
+        half_min = self.min_size * height / 2
+        cx, cy = (bx0 + bx1) / 2, (by0 + by1) / 2
+        half_w = max((bx1 - bx0) / 2 + pad, half_min)
+        half_h = max((by1 - by0) / 2 + pad, half_min)
+
+        x0, x1 = int(max(cx - half_w, 0)), int(min(cx + half_w, width))
+        y0, y1 = int(max(cy - half_h, 0)), int(min(cy + half_h, height))
+        if x1 <= x0 or y1 <= y0 or (x1 - x0) * (y1 - y0) > self.max_area * width * height:
+            self.rect = None
+        else:
+            self.rect = (x0, y0, x1, y1)
@@ -0,0 +1,185 @@
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Sequence
+
+import cv2
+import numpy as np
+
+from .amodel import AModel
+from .available_models import available_models
+from .cache import cache_dir
+from .capture import ImageDirectoryCapture
+
+logger = logging.getLogger(__name__)
+
+
+class ModelSelector:
+    """Picks the model backend by running each candidate on calibration frames.
+
+    Every candidate processes the same frames; the fastest one (median
+    latency) that reaches `min_fps` and detects hands on at least
+    `min_detection_rate` of the frames wins. If none meets both targets, the
+    one with the best detection rate is used. The decision is stored in a
+    JSON cache keyed by the candidates, the calibration source and the
+    targets, so later launches skip the benchmark.
+
+    Models that ignore the frames (`AModel.uses_frames` False, e.g.
+    `ReplayModel`) are never candidates: they would always look fastest.
+    """
+
+    @dataclass
+    class Score:
+        model: str
+        latency_ms: float  # Médiane
+        fps: float
+        detection_rate: float
+        error: str | None = None
+
+    def __init__(
+        self,
+        candidates: Sequence[type[AModel]] | None = None,
+        min_fps: float = 20.0,
+        min_detection_rate: float = 0.5,
+        cache_path: str | None = None,
+    ):
+        """
+        Args:
+            candidates: Model classes to compare, by default the available
+                models (see `available_models`)
+            min_fps (float): Speed a model must reach
+            min_detection_rate (float): Fraction of the frames in which a
+                model must find hands
+            cache_path (str | None): JSON cache, default in the user cache dir
+        """
+        if candidates is None:
+            candidates = [m for m in available_models if m.is_available()]
+        self.candidates = [m for m in candidates if m.uses_frames]
+        self.min_fps = min_fps
+        self.min_detection_rate = min_detection_rate
+        self.cache_path = cache_path or os.path.join(cache_dir(), "model_selection.json")
+
+    @staticmethod
+    def read_frames(source, count: int = 30) -> list[np.ndarray]:
+        """Read up to `count` RGB frames from a video file, an image directory
+        or an open capture (e.g. the live camera)"""
+        if isinstance(source, str):
+            cap = ImageDirectoryCapture(source) if os.path.isdir(source) else cv2.VideoCapture(source)
+        else:
+            cap = source
+        frames = []
+        try:
+            while len(frames) < count:
+                success, frame = cap.read()
+                if not success:
+                    break
+                frames.append(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        finally:
+            if cap is not source:
+                cap.release()
+        return frames
+
+    def _cache_key(self, source_key: str) -> str:
+        names = ",".join(sorted(m.__name__ for m in self.candidates))
+        return f"{names}|{source_key}|fps>={self.min_fps}|det>={self.min_detection_rate}"
+
+    def _load_cache(self) -> dict:
+        try:
+            with open(self.cache_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def cached(self, source_key: str) -> type[AModel] | None:
+        entry = self._load_cache().get(self._cache_key(source_key))
+        if not entry:
+            return None
+        return next((m for m in self.candidates if m.__name__ == entry["model"]), None)
+
+    def benchmark(self, model_class: type[AModel], frames: list[np.ndarray]) -> "ModelSelector.Score":
+        try:
+            model = model_class()
+        except Exception as e:
+            return ModelSelector.Score(model_class.__name__, float("inf"), 0.0, 0.0, repr(e))
+        try:
+            model.process(frames[0])  # Initialisation paresseuse hors mesure
+            latencies, detected = [], 0
+            for frame in frames:
+                start = time.perf_counter()
+                results = AModel.ArrayResults.from_results(model.process(frame))
+                latencies.append(time.perf_counter() - start)
+                detected += results.n_hands > 0
+        except Exception as e:
+            return ModelSelector.Score(model_class.__name__, float("inf"), 0.0, 0.0, repr(e))
+        finally:
+            model.close()
+        latency = float(np.median(latencies))
+        return ModelSelector.Score(
+            model_class.__name__,
+            latency * 1000,
+            1 / latency if latency > 0 else float("inf"),
+            detected / len(frames),
+        )
+
+    def choose(self, scores: list["ModelSelector.Score"]) -> "ModelSelector.Score":
+        valid = [s for s in scores if s.error is None]
+        if not valid:
+            raise RuntimeError(f"No model could run: {[s.error for s in scores]}")
+        good = [
+            s for s in valid
+            if s.fps >= self.min_fps and s.detection_rate >= self.min_detection_rate
+        ]
+        if good:
+            return min(good, key=lambda s: s.latency_ms)
+        return max(valid, key=lambda s: (s.detection_rate, -s.latency_ms))
+
+    def select(self, source, source_key: str, count: int = 30, use_cache: bool = True) -> type[AModel]:
+        """Return the model class to use for this calibration source.
+
+        Args:
+            source: Calibration clip path, image directory or open capture;
+                only read when the decision is not cached
+            source_key (str): Identifies the source in the cache
+            count (int): Calibration frames to run through each model
+            use_cache (bool): Reuse a stored decision if there is one
+        """
+        if not self.candidates:
+            raise RuntimeError("No model that processes frames to select from")
+        if len(self.candidates) == 1:
+            return self.candidates[0]
+        if use_cache:
+            model_class = self.cached(source_key)
+            if model_class is not None:
+                logger.info("Using cached model choice %s", model_class.__name__)
+                return model_class
+
+        frames = self.read_frames(source, count)
+        if not frames:
+            raise RuntimeError("No calibration frames to select a model with")
+        scores = [self.benchmark(m, frames) for m in self.candidates]
+        best = self.choose(scores)
+        for score in scores:
+            logger.info(
+                "%s: %.1f ms, %.1f FPS, hands on %.0f%% of frames%s",
+                score.model,
+                score.latency_ms,
+                score.fps,
+                score.detection_rate * 100,
+                f" (failed: {score.error})" if score.error else "",
+            )
+        logger.info("Selected model %s", best.model)
+
+        cache = self._load_cache()
+        cache[self._cache_key(source_key)] = {
+            "model": best.model,
+            "scores": [asdict(s) for s in scores],
+            "created": time.time(),
+        }
+        try:
+            with open(self.cache_path, "w") as f:
+                json.dump(cache, f, indent=2)
+        except OSError as e:
+            logger.warning("Cannot write the model cache %s: %s", self.cache_path, e)
+        return next(m for m in self.candidates if m.__name__ == best.model)
@@ -0,0 +1,201 @@
+"""Scoped stage timers for the game loop.
+
+    from profiler import profiler
+
+    with profiler.scope("inference"):
+        ...
+
+When the profiler is disabled (the default), `scope` returns a shared no-op
+context manager, so instrumented code costs one attribute check per scope.
+Once enabled, every scope is stored in a fixed-size ring of records that can
+be exported as Chrome trace-event JSON (chrome://tracing, Perfetto) or CSV,
+and the per-stage averages can be drawn on the frame.
+"""
+
+import csv
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+import cv2
+import numpy as np
+
+from components.glyph_atlas import GlyphAtlas
+
+_DISABLED = nullcontext()
+
+
+class _Scope:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, self.start, time.perf_counter_ns())
+        return False
+
+
+class Profiler:
+    """Collects (name, start, end, thread, frame) records in a ring buffer."""
+
+    def __init__(self, capacity: int = 200_000, smoothing: float = 0.1):
+        """
+        Args:
+            capacity (int): Records kept; the oldest are overwritten
+            smoothing (float): Weight of the newest frame in the on-screen
+                per-stage averages
+        """
+        self.enabled = False
+        self.capacity = capacity
+        self.smoothing = smoothing
+        self.frame = 0
+        # Average milliseconds per frame for each stage, for the overlay
+        self.stage_ms: dict[str, float] = {}
+        self._records: list[tuple | None] = [None] * capacity
+        # next() on itertools.count is atomic, the inference worker records too
+        self._counter = itertools.count()
+        self._written = 0
+        # Written by every recording thread, swapped out by end_frame
+        self._frame_totals: dict[str, int] = {}
+        self._totals_lock = threading.Lock()
+        self._origin = time.perf_counter_ns()
+
+    def enable(self):
+        self.enabled = True
+
+    def scope(self, name: str):
+        """Context manager timing the enclosed block as stage `name`"""
+        if not self.enabled:
+            return _DISABLED
+        return _Scope(self, name)
+
+    def record(self, name: str, start_ns: int, end_ns: int):
+        index = next(self._counter)
+        self._records[index % self.capacity] = (
+            name,
+            start_ns,
+            end_ns,
+            threading.get_ident(),
+            self.frame,
+        )
+        self._written = index + 1
+        with self._totals_lock:
+            totals = self._frame_totals
+            totals[name] = totals.get(name, 0) + end_ns - start_ns
+
+    def end_frame(self):
+        """Close the current frame and fold its stage totals into `stage_ms`"""
+        if not self.enabled:
+            return
+        with self._totals_lock:
+            totals, self._frame_totals = self._frame_totals, {}
+        a = self.smoothing
+        for name in self.stage_ms.keys() - totals.keys():
+            self.stage_ms[name] *= 1 - a
+        for name, total in totals.items():
+            ms = total / 1e6
+            previous = self.stage_ms.get(name)
+            self.stage_ms[name] = ms if previous is None else previous + a * (ms - previous)
+        self.frame += 1
+
+    def records(self) -> list[tuple]:
+        """Stored records, oldest first"""
+        written = self._written
+        if written <= self.capacity:
+            return [r for r in self._records[:written] if r is not None]
+        start = written % self.capacity
+        return [r for r in self._records[start:] + self._records[:start] if r is not None]
+
+    def stage_durations(self, since_frame: int = 0) -> dict[str, np.ndarray]:
+        """Milliseconds spent in each stage, one value per stored frame from
+        `since_frame` in which the stage ran"""
+        totals: dict[str, dict[int, int]] = {}
+        for name, start, end, _, frame in self.records():
+            if frame >= since_frame:
+                per_frame = totals.setdefault(name, {})
+                per_frame[frame] = per_frame.get(frame, 0) + end - start
+        return {
+            name: np.fromiter(per_frame.values(), dtype=np.float64, count=len(per_frame)) / 1e6
+            for name, per_frame in totals.items()
+        }
+
+    def export_chrome_trace(self, path: str):
+        """Write the records as Chrome trace-event JSON ("X" complete events)"""
+        pid = os.getpid()
+        names = {t.ident: t.name for t in threading.enumerate()}
+        events = []
+        tids = set()
+        for name, start, end, tid, frame in self.records():
+            tids.add(tid)
+            events.append(
+                {
+                    "name": name,
+                    "cat": "stage",
+                    "ph": "X",
+                    "ts": (start - self._origin) / 1000,
+                    "dur": (end - start) / 1000,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"frame": frame},
+                }
+            )
+        for tid in tids:
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": names.get(tid, f"thread-{tid}")},
+                }
+            )
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    def export_csv(self, path: str):
+        """Write one row per record: frame, stage, thread, start and duration in ms"""
+        names = {t.ident: t.name for t in threading.enumerate()}
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "stage", "thread", "start_ms", "duration_ms"])
+            for name, start, end, tid, frame in self.records():
+                writer.writerow(
+                    [
+                        frame,
+                        name,
+                        names.get(tid, f"thread-{tid}"),
+                        f"{(start - self._origin) / 1e6:.4f}",
+                        f"{(end - start) / 1e6:.4f}",
+                    ]
+                )
+
+    def draw_overlay(self, img: np.ndarray, org: tuple[int, int] | None = None):
+        """Draw the average time per frame of each stage, slowest first"""
+        if not self.enabled or not self.stage_ms:
+            return
+        atlas = GlyphAtlas.get(cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
+        stages = sorted(self.stage_ms.items(), key=lambda item: -item[1])
+        line_height = atlas.ascent + 6
+        width, height = 190, line_height * len(stages) + 8
+        x, y = org if org is not None else (img.shape[1] - width - 10, 10)
+
+        # Darken the background so the text stays readable
+        roi = img[max(y, 0) : y + height, max(x, 0) : x + width]
+        roi //= 3
+        for i, (name, ms) in enumerate(stages):
+            baseline = y + 4 + atlas.ascent + i * line_height
+            atlas.draw_text(img, name, (x + 6, baseline))
+            value = f"{ms:6.2f} ms"
+            atlas.draw_text(img, value, (x + width - 6 - atlas.text_width(value), baseline))
+
+
+profiler = Profiler()
@@ -0,0 +1,154 @@
+import logging
+import os
+import queue
+import threading
+
+import cv2
+import numpy as np
+
+from model.capture import FramePool
+
+logger = logging.getLogger(__name__)
+
+POLICIES = ("drop", "block")
+
+
+class SessionRecorder:
+    """Records the game to a video file from a background thread.
+
+    `write` copies the composited frame (and optionally the raw camera
+    frame, to a second file) into reusable buffers and queues them; a
+    writer thread encodes them with `cv2.VideoWriter`. The queue is bounded:
+    when the disk or the encoder falls behind, the "drop" policy skips the
+    frame (counted in `dropped_frames`) and the "block" policy makes the
+    game wait for a free place, so no frame is lost.
+
+    The video size is set by the first frame; later frames of another size
+    (e.g. after a camera switch) are resized on the writer thread.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fps: float = 30.0,
+        raw_path: str | None = None,
+        fourcc: str = "mp4v",
+        queue_size: int = 32,
+        policy: str = "drop",
+    ):
+        """
+        Args:
+            path (str): Video file of the composited game frames
+            fps (float): Frame rate written in the files
+            raw_path (str | None): Also record the camera frames to this file
+            fourcc (str): Codec, e.g. "mp4v" (.mp4) or "MJPG" (.avi)
+            queue_size (int): Frames that may wait for the writer thread
+            policy (str): "drop" or "block" when the queue is full
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy {policy!r}, expected one of {POLICIES}")
+        self.path = path
+        self.raw_path = raw_path
+        self.fps = fps
+        self.fourcc = fourcc
+        self.policy = policy
+        self.written_frames = 0
+        self.dropped_frames = 0
+        self.max_queue_depth = 0
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max(queue_size, 1))
+        self._pools = {"game": FramePool(), "raw": FramePool()}
+        self._writers: dict[str, cv2.VideoWriter] = {}
+        self._error: BaseException | None = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="session-recorder", daemon=True)
+        self._thread.start()
+
+    @property
+    def queue_depth(self) -> int:
+        """Frames waiting for the writer thread"""
+        return self._queue.qsize()
+
+    def _copy(self, stream: str, frame: np.ndarray) -> np.ndarray:
+        pool = self._pools[stream]
+        pool.reshape(frame.shape)
+        buffer = pool.acquire()
+        np.copyto(buffer, frame)
+        return buffer
+
+    def write(self, frame: np.ndarray, raw: np.ndarray | None = None) -> bool:
+        """Queue a copy of the frame (and of the raw camera frame when a
+        `raw_path` is set). Returns False if it was dropped."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError(f"Session recording failed: {error!r}")
+        item = [("game", self._copy("game", frame))]
+        if self.raw_path is not None and raw is not None:
+            item.append(("raw", self._copy("raw", raw)))
+        try:
+            self._queue.put(item, block=self.policy == "block")
+        except queue.Full:
+            self.dropped_frames += 1
+            for stream, buffer in item:
+                self._pools[stream].release(buffer)
+            return False
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+        return True
+
+    def _open_writer(self, stream: str, frame: np.ndarray) -> cv2.VideoWriter:
+        path = self.path if stream == "game" else self.raw_path
+        height, width = frame.shape[:2]
+        writer = cv2.VideoWriter(
+            path, cv2.VideoWriter_fourcc(*self.fourcc), self.fps, (width, height)
+        )
+        if not writer.isOpened():
+            raise OSError(f"Cannot open {path} for writing with codec {self.fourcc}")
+        logger.info("Recording %s to %s (%dx%d)", stream, path, width, height)
+        return writer
+
+    def _run(self):
+        sizes: dict[str, tuple[int, int]] = {}
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            for stream, buffer in item:
+                try:
+                    if self._error is None:
+                        writer = self._writers.get(stream)
+                        if writer is None:
+                            writer = self._writers[stream] = self._open_writer(stream, buffer)
+                            sizes[stream] = (buffer.shape[1], buffer.shape[0])
+                        frame = buffer
+                        if (frame.shape[1], frame.shape[0]) != sizes[stream]:
+                            frame = cv2.resize(frame, sizes[stream])
+                        writer.write(frame)
+                except Exception as e:
+                    self._error = e
+                finally:
+                    self._pools[stream].release(buffer)
+            if self._error is None:
+                self.written_frames += 1
+
+    def close(self):
+        """Write the queued frames and close the files"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        for writer in self._writers.values():
+            writer.release()
+        logger.info(
+            "Recorded %d frames to %s (%d dropped, queue depth up to %d)",
+            self.written_frames,
+            self.path,
+            self.dropped_frames,
+            self.max_queue_depth,
+        )
+
+    @staticmethod
+    def raw_path_for(path: str) -> str:
+        """"game.mp4" -> "game.raw.mp4" """
+        stem, ext = os.path.splitext(path)
+        return f"{stem}.raw{ext}"
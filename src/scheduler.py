@@ -0,0 +1,74 @@
+import time
+from typing import Callable
+
+
+class FrameScheduler:
+    """Boucle de jeu à pas fixe avec limitation du nombre d'images par seconde.
+
+    La simulation avance par ticks de durée fixe (`tick`), quel que soit le
+    rythme d'affichage: chaque frame exécute autant de ticks que le temps
+    écoulé le permet, et le reste (`alpha`, entre 0 et 1) sert à interpoler le
+    rendu entre les deux derniers états. Entre deux frames, `pace` attend la
+    prochaine échéance au lieu de boucler sur `waitKey(1)`.
+    """
+
+    def __init__(self, tick_rate: float = 60.0, frame_cap: float = 30.0, max_ticks: int = 5):
+        """
+        Args:
+            tick_rate (float): Ticks de simulation par seconde
+            frame_cap (float): Images par seconde maximum, 0 pour ne pas limiter
+            max_ticks (int): Ticks maximum par frame; au-delà le retard est
+                abandonné (la simulation ralentit au lieu de s'emballer)
+        """
+        self.tick = 1.0 / tick_rate
+        self.frame_time = 1.0 / frame_cap if frame_cap else 0.0
+        self.max_ticks = max_ticks
+        self.alpha = 1.0
+        self.frame_dt = 0.0
+        self._accumulator = 0.0
+        self._last: float | None = None
+        self._deadline: float | None = None
+
+    def begin_frame(self) -> int:
+        """Mesure le temps écoulé depuis la frame précédente et retourne le
+        nombre de ticks de simulation à exécuter"""
+        now = time.perf_counter()
+        if self._last is None:
+            # Première frame: un tick pour avoir un état précédent et courant
+            self._last = now
+            self._deadline = now
+            self._accumulator = self.tick
+        self.frame_dt = now - self._last
+        self._last = now
+
+        self._accumulator += self.frame_dt
+        ticks = int(self._accumulator / self.tick)
+        if ticks > self.max_ticks:
+            ticks = self.max_ticks
+            self._accumulator = ticks * self.tick
+        self._accumulator -= ticks * self.tick
+        self.alpha = self._accumulator / self.tick
+        return ticks
+
+    def pace(self, wait_key: Callable[[int], int]) -> int:
+        """Attend l'échéance de la prochaine frame et retourne la touche pressée.
+
+        `wait_key(ms)` (typiquement `cv2.waitKey`) traite les événements de la
+        fenêtre pendant la plus grande partie de l'attente; le reste, plus court
+        qu'une milliseconde, est attendu avec `time.sleep`.
+        """
+        if not self.frame_time or self._deadline is None:
+            return wait_key(1)
+
+        self._deadline += self.frame_time
+        now = time.perf_counter()
+        if now > self._deadline:
+            # En retard: pas de rattrapage en rafale, on repart de maintenant
+            self._deadline = now
+            return wait_key(1)
+
+        key = wait_key(max(int((self._deadline - now) * 1000), 1))
+        remaining = self._deadline - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+        return key
@@ -0,0 +1,81 @@
+from collections import defaultdict
+from typing import Hashable
+
+import numpy as np
+
+
+class SpatialGrid:
+    """Index spatial par grille uniforme de cellules carrées.
+
+    Chaque élément est rangé dans toutes les cellules que touche son
+    rectangle englobant (x1, y1, x2, y2), x2/y2 exclus. Une requête ne
+    teste donc que les éléments proches du point, quel que soit leur nombre.
+    """
+
+    def __init__(self, cell_size: int = 64):
+        self.cell_size = cell_size
+        self._cells: dict[tuple[int, int], set[Hashable]] = defaultdict(set)
+        # Plage de cellules (cx1, cy1, cx2, cy2 inclus) occupée par chaque élément
+        self._ranges: dict[Hashable, tuple[int, int, int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._ranges
+
+    def _cell_range(self, bounds) -> tuple[int, int, int, int]:
+        x1, y1, x2, y2 = bounds
+        c = self.cell_size
+        return (
+            int(x1) // c,
+            int(y1) // c,
+            (int(x2) - 1) // c,
+            (int(y2) - 1) // c,
+        )
+
+    def _add(self, item: Hashable, cells: tuple[int, int, int, int]):
+        cx1, cy1, cx2, cy2 = cells
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                self._cells[(cx, cy)].add(item)
+
+    def _discard(self, item: Hashable, cells: tuple[int, int, int, int]):
+        cx1, cy1, cx2, cy2 = cells
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                cell = self._cells.get((cx, cy))
+                if cell is not None:
+                    cell.discard(item)
+                    if not cell:
+                        del self._cells[(cx, cy)]
+
+    def insert(self, item: Hashable, bounds):
+        """Ajoute ou déplace `item`; ne touche aux cellules que si elles changent"""
+        cells = self._cell_range(bounds)
+        previous = self._ranges.get(item)
+        if previous == cells:
+            return
+        if previous is not None:
+            self._discard(item, previous)
+        self._add(item, cells)
+        self._ranges[item] = cells
+
+    update = insert
+
+    def remove(self, item: Hashable):
+        cells = self._ranges.pop(item, None)
+        if cells is not None:
+            self._discard(item, cells)
+
+    def clear(self):
+        self._cells.clear()
+        self._ranges.clear()
+
+    def query_points(self, points) -> list[set[Hashable]]:
+        """Retourne, pour chaque point (x, y), les éléments dont la cellule le
+        contient (ensembles internes, à ne pas modifier)"""
+        points = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+        cells = np.floor_divide(points, self.cell_size).tolist()
+        empty = set()
+        return [self._cells.get((cx, cy), empty) for cx, cy in cells]
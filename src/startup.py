@@ -0,0 +1,110 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable
+
+import cv2
+import numpy as np
+
+from profiler import profiler
+
+logger = logging.getLogger(__name__)
+
+
+class StartupLoader:
+    """Builds the game on a background thread while the window shows a splash.
+
+    `build(loader)` does the slow work (imports, model graph, camera, ...)
+    and times each step with `loader.phase(name)`; `phase_name` tells the
+    splash what is being loaded. Durations land in `timings` (seconds) and,
+    when profiling, in the trace as `startup.<name>` records.
+    """
+
+    def __init__(self, build: Callable[["StartupLoader"], Any]):
+        self.build = build
+        self.timings: dict[str, float] = {}
+        self.phase_name = "starting"
+        self.started = time.perf_counter()
+        self._result = None
+        self._error: BaseException | None = None
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="startup", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            self._result = self.build(self)
+        except BaseException as e:
+            self._error = e
+
+    @property
+    def done(self) -> bool:
+        return not self._thread.is_alive()
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the enclosed block as startup phase `name` (thread-safe)"""
+        self.phase_name = name
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            self.add_timing(name, (end - start) / 1e9)
+            if profiler.enabled:
+                profiler.record(f"startup.{name}", start, end)
+
+    def add_timing(self, name: str, seconds: float):
+        with self._lock:
+            self.timings[name] = seconds
+
+    def run_phase(self, name: str, function: Callable[[], Any]) -> threading.Thread:
+        """Run `function` as a timed phase on its own thread, in parallel"""
+        def run():
+            with self.phase(name):
+                function()
+
+        thread = threading.Thread(target=run, name=f"startup-{name}", daemon=True)
+        thread.start()
+        return thread
+
+    def result(self):
+        """Wait for the build and return its result, re-raising its error"""
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    def report(self) -> str:
+        with self._lock:
+            timings = dict(self.timings)
+        return ", ".join(f"{name} {seconds:.2f} s" for name, seconds in timings.items())
+
+
+def draw_splash(img: np.ndarray, phase: str, elapsed: float) -> np.ndarray:
+    """Écran d'attente: titre, étape en cours et barre animée"""
+    img[:] = (40, 25, 10)
+    h, w = img.shape[:2]
+    title = "Tire au canard"
+    font = cv2.FONT_HERSHEY_DUPLEX
+    (tw, th), _ = cv2.getTextSize(title, font, 1.6, 2)
+    cv2.putText(img, title, ((w - tw) // 2, h // 2 - 30), font, 1.6, (0, 255, 255), 2)
+
+    text = f"Loading {phase}" + "." * (int(elapsed * 3) % 4)
+    cv2.putText(
+        img, text, (w // 2 - 110, h // 2 + 20), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 1
+    )
+
+    # Barre qui va et vient pendant le chargement
+    bar_w, bar_x, bar_y = w // 2, w // 4, h // 2 + 50
+    cv2.rectangle(img, (bar_x, bar_y), (bar_x + bar_w, bar_y + 8), (90, 90, 90), 1)
+    t = (elapsed * 0.8) % 2
+    pos = t if t < 1 else 2 - t
+    x = bar_x + int(pos * (bar_w - 60))
+    cv2.rectangle(img, (x, bar_y + 1), (x + 60, bar_y + 7), (0, 200, 255), -1)
+    return img
@@ -0,0 +1,204 @@
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+BOUNDARY = "frame"
+PAGE = b"""<!DOCTYPE html>
+<html><head><title>Tire au canard</title>
+<style>body{margin:0;background:#000}img{width:100vw;height:100vh;object-fit:contain}</style>
+</head><body><img src="/stream"></body></html>
+"""
+
+
+class StreamServer:
+    """Serves the game to spectators as MJPEG over HTTP.
+
+    JPEG encoding runs on its own thread, at most `max_fps` times per
+    second and only while there are clients. `publish` only copies the
+    frame into a buffer, and only when the encoder is ready for a new one:
+    the game pays for `max_fps` copies per second at most, and for nothing
+    while no spectator is connected. Each
+    client is served by its own thread and always gets the newest encoded
+    frame: a slow client skips frames (counted in `dropped_frames`) instead
+    of slowing down the others or the game. A client may ask for a lower
+    rate with `/stream?fps=N`.
+
+    Open `http://host:port/` in a browser to watch.
+    """
+
+    def __init__(
+        self,
+        port: int = 8080,
+        host: str = "127.0.0.1",
+        max_fps: float = 15.0,
+        quality: int = 80,
+        timeout: float = 5.0,
+    ):
+        """
+        Args:
+            port (int): HTTP port, 0 for any free port (see `port`)
+            host (str): Interface to listen on; "0.0.0.0" for the local network
+            max_fps (float): Encoded frames per second at most
+            quality (int): JPEG quality (0-100)
+            timeout (float): Seconds a client may block a write before it is
+                disconnected
+        """
+        self.max_fps = max_fps
+        self.quality = quality
+        self.timeout = timeout
+        self.encoded_frames = 0
+        self.dropped_frames = 0
+
+        self._cond = threading.Condition()
+        self._clients = 0
+        self._running = True
+        # Frame à encoder, écrite par `publish` seulement quand l'encodeur
+        # en demande une (`_wanted`)
+        self._frame: np.ndarray | None = None
+        self._wanted = False
+        self._jpeg = b""
+        self._jpeg_seq = 0  # Numéro de la dernière frame encodée
+
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._server_thread = threading.Thread(
+            target=self._server.serve_forever, name="stream-server", daemon=True
+        )
+        self._encoder = threading.Thread(target=self._encode_loop, name="stream-encoder", daemon=True)
+        self._server_thread.start()
+        self._encoder.start()
+        logger.info("Spectator stream on http://%s:%d/", host, self.port)
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def clients(self) -> int:
+        return self._clients
+
+    def publish(self, frame: np.ndarray):
+        """Offer the frame to display to the spectators (copied, not encoded)"""
+        if not self._wanted or not self._clients:
+            return
+        with self._cond:
+            if self._frame is None or self._frame.shape != frame.shape:
+                self._frame = np.empty_like(frame)
+            np.copyto(self._frame, frame)
+            self._wanted = False
+            self._cond.notify_all()
+
+    def _encode_loop(self):
+        next_time = 0.0
+        params = [cv2.IMWRITE_JPEG_QUALITY, self.quality]
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: not self._running or self._clients)
+                if not self._running:
+                    return
+            # Limite de débit, puis on demande la prochaine frame du jeu
+            delay = next_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            with self._cond:
+                self._wanted = True
+                self._cond.wait_for(lambda: not self._running or not self._wanted)
+                if not self._running:
+                    return
+            next_time = time.perf_counter() + 1 / self.max_fps
+            # `publish` n'écrit plus dans la frame avant la prochaine demande
+            success, jpeg = cv2.imencode(".jpg", self._frame, params)
+            if not success:
+                continue
+            with self._cond:
+                self._jpeg = jpeg.tobytes()
+                self._jpeg_seq += 1
+                self.encoded_frames += 1
+                self._cond.notify_all()
+
+    def _wait_jpeg(self, last_seq: int) -> tuple[int, bytes] | None:
+        """Newest JPEG after `last_seq`, or None when the server stops"""
+        with self._cond:
+            self._cond.wait_for(lambda: not self._running or self._jpeg_seq > last_seq)
+            if not self._running:
+                return None
+            return self._jpeg_seq, self._jpeg
+
+    def _serve_stream(self, handler: BaseHTTPRequestHandler, fps: float):
+        handler.send_response(200)
+        handler.send_header("Content-Type", f"multipart/x-mixed-replace; boundary={BOUNDARY}")
+        handler.send_header("Cache-Control", "no-cache")
+        handler.end_headers()
+        handler.connection.settimeout(self.timeout)
+        interval = 1 / fps
+        with self._cond:
+            self._clients += 1
+            seq = self._jpeg_seq
+            self._cond.notify_all()
+        try:
+            while True:
+                frame = self._wait_jpeg(seq)
+                if frame is None:
+                    break
+                # Frames encodées pendant l'envoi précédent ou l'attente
+                with self._cond:
+                    self.dropped_frames += frame[0] - seq - 1
+                seq, jpeg = frame
+                start = time.perf_counter()
+                handler.wfile.write(
+                    f"--{BOUNDARY}\r\nContent-Type: image/jpeg\r\n"
+                    f"Content-Length: {len(jpeg)}\r\n\r\n".encode()
+                )
+                handler.wfile.write(jpeg)
+                handler.wfile.write(b"\r\n")
+                handler.wfile.flush()
+                # Débit propre au client
+                delay = interval - (time.perf_counter() - start)
+                if delay > 0:
+                    time.sleep(delay)
+        except OSError:
+            pass  # Client parti ou trop lent (timeout)
+        finally:
+            with self._cond:
+                self._clients -= 1
+
+    def _handler_class(self):
+        stream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path == "/":
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/html")
+                    self.send_header("Content-Length", str(len(PAGE)))
+                    self.end_headers()
+                    self.wfile.write(PAGE)
+                elif url.path == "/stream":
+                    try:
+                        fps = float(parse_qs(url.query).get("fps", [stream.max_fps])[0])
+                    except ValueError:
+                        fps = stream.max_fps
+                    stream._serve_stream(self, min(max(fps, 0.1), stream.max_fps))
+                else:
+                    self.send_error(404)
+
+            def log_message(self, format, *args):
+                logger.debug("%s - %s", self.address_string(), format % args)
+
+        return Handler
+
+    def close(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        self._server.shutdown()
+        self._server.server_close()
+        self._encoder.join(timeout=1.0)